@@ -0,0 +1,56 @@
+"""
+The differences of a wrong answer and the correct answer.
+
+The two strings are aligned once with difflib, so after a missing or an
+extra letter the rest of the answer is still compared with the matching
+part of the correct answer. The differences are merged into ranges of the
+answer, they can be highlighted with a single tag_add call.
+"""
+from difflib import SequenceMatcher
+
+
+def incorrect_ranges(answer, correct, case_sensitive=False):
+    """
+    Finds the parts of the answer which differ from the correct answer.
+        A missing part is marked on the character after it
+        (or before it at the end of the answer).
+
+    :param answer: string, the given answer
+    :param correct: string, the correct answer
+    :param case_sensitive: bool, does the case matter
+    :return list of tuples of 2 ints, the sorted, disjoint
+        (start, end) character offsets in the answer
+    """
+    if not case_sensitive:
+        # Lowercased character by character, so the offsets do not change
+        answer_characters = [c.lower() for c in answer]
+        correct_characters = [c.lower() for c in correct]
+    else:
+        answer_characters, correct_characters = answer, correct
+    matcher = SequenceMatcher(None, answer_characters, correct_characters, autojunk=False)
+    ranges = []
+    for operation, start, end, _, _ in matcher.get_opcodes():
+        if operation == "equal" or not answer:
+            continue
+        if operation == "insert":
+            # Nothing to mark in the answer, its neighbour is marked
+            start = min(start, len(answer) - 1)
+            end = start + 1
+        # Merges the touching ranges
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], max(end, ranges[-1][1]))
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def text_indices(ranges, start="1.0"):
+    """
+    Converts offsets to the indices of a tkinter Text widget.
+
+    :param ranges: list of tuples of 2 ints, the character offsets
+    :param start: string, the index of the first character of the answer
+    :return list of strings, the start and end indices of the ranges
+        after each other, e.g. ["1.0+3c", "1.0+5c"]
+    """
+    return [f"{start}+{offset}c" for offset_range in ranges for offset in offset_range]
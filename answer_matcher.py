@@ -0,0 +1,149 @@
+"""
+Compiled answer checking for the write mode.
+
+The acceptable forms of every term are computed once when the settings are
+saved, so checking an answer is only a normalization and a set lookup.
+
+In the near miss mode an answer which is not exactly correct is compared
+to the acceptable forms with a bounded edit distance (edit_distance.py),
+the bitmasks of the forms are computed with the forms. The allowed number
+of typos grows with the length of the term, so a short word has to be
+exact but a missing letter in a sentence is accepted.
+"""
+from edit_distance import bounded_distance, pattern_masks
+from text_normalization import clean_word, remove_nested_parentheses
+
+# The results of checking an answer
+EXACT = "exact"
+NEAR_MISS = "near miss"
+# One typo is allowed in every this many characters of a term
+CHARACTERS_PER_TYPO = 8
+
+
+class AnswerMatcher:
+    """
+    The acceptable answers of a word list column for a settings snapshot.
+    """
+
+    def __init__(self, terms, case_sensitive, trim_characters,
+                 trim_position, optional_parentheses, near_miss=False):
+        """
+        Compiles the acceptable answers of every term.
+
+        :param terms: list of strings, the correct answers
+        :param case_sensitive: bool, uppercase/lowercase matters
+        :param trim_characters: list of strings, the ignored punctuation
+        :param trim_position: string, "everywhere", "nowhere" or "end"
+        :param optional_parentheses: bool, the parts in parentheses
+            can be left out
+        :param near_miss: bool, accept answers with a few typos
+        """
+        self.__case_sensitive = case_sensitive
+        self.__trim_characters = list(trim_characters)
+        self.__trim_position = trim_position
+        self.__optional_parentheses = optional_parentheses
+        # Translation table of the punctuation which is ignored everywhere
+        self.__translation_table = str.maketrans(
+            '', '', ''.join(self.__trim_characters))
+        # The normalized acceptable answers for every term index
+        self.__accepted = [self.accepted_forms(term) for term in terms]
+        # The bitmasks of the acceptable answers for the edit distance:
+        #     (form, bitmasks, the allowed number of typos) tuples
+        self.__near_forms = None
+        if near_miss:
+            self.__near_forms = [
+                [(form, pattern_masks(form), len(form) // CHARACTERS_PER_TYPO)
+                 for form in forms if len(form) >= CHARACTERS_PER_TYPO]
+                for forms in self.__accepted]
+
+    @classmethod
+    def from_settings(cls, terms, settings):
+        """
+        Creates a matcher from the settings dictionary of the app.
+
+        :param terms: list of strings, the correct answers
+        :param settings: dict, the settings of the app
+        :return AnswerMatcher
+        """
+        return cls(terms, settings["case_sensitive_answers"],
+                   settings["trim_punctuation_characters"],
+                   settings["trim_punctuation"],
+                   settings["optional_answer_in_parentheses"],
+                   settings["near_miss_answers"])
+
+    @staticmethod
+    def settings_key(settings):
+        """
+        The settings which change the acceptable answers.
+
+        :param settings: dict, the settings of the app
+        :return tuple, if it changes the matcher has to be compiled again
+        """
+        return (settings["answ_lang"],
+                settings["case_sensitive_answers"],
+                tuple(settings["trim_punctuation_characters"]),
+                settings["trim_punctuation"],
+                settings["optional_answer_in_parentheses"],
+                settings["near_miss_answers"])
+
+    def normalize(self, word):
+        """
+        :param word: string, an answer
+        :return string, the form which is compared
+        """
+        return clean_word(word, self.__case_sensitive)
+
+    def accepted_forms(self, term):
+        """
+        Computes the acceptable answers of a term.
+
+        :param term: string, the correct answer
+        :return frozenset of strings, the normalized acceptable answers
+        """
+        # A list of the possibly acceptable answers
+        acceptable_answers = [term]
+        # IF trim punctuations
+        if self.__trim_position == "everywhere":
+            # Adds the another poissible answer
+            acceptable_answers.append(term.translate(self.__translation_table))
+        elif self.__trim_position == "end":
+            # Until all the unnecesary characers are removed from the end
+            trimmed_word = term
+            while len(trimmed_word) > 1 and trimmed_word[-1] in self.__trim_characters + [" "]:
+                # Removes the last character
+                trimmed_word = trimmed_word[:-1]
+            # Adds the another poissible answer
+            acceptable_answers.append(trimmed_word)
+        if self.__optional_parentheses:
+            acceptable_answers += [remove_nested_parentheses(x) for x in acceptable_answers]
+            acceptable_answers += [x.replace("(", "").replace(")", "") for x in acceptable_answers]
+        # A normalized answer can only be equal to a normalized form
+        return frozenset(self.normalize(x) for x in acceptable_answers)
+
+    def check(self, index, answer):
+        """
+        Checks the answer.
+
+        :param index: int, the index of the term in the word list
+        :param answer: string, the given answer
+        :return string or None, EXACT, NEAR_MISS or None if it is wrong
+        """
+        normalized = self.normalize(answer)
+        if normalized in self.__accepted[index]:
+            return EXACT
+        if self.__near_forms is None:
+            return None
+        for form, masks, typos in self.__near_forms[index]:
+            if bounded_distance(masks, len(form), normalized, typos) <= typos:
+                return NEAR_MISS
+        return None
+
+    def matches(self, index, answer):
+        """
+        Is the answer correct.
+
+        :param index: int, the index of the term in the word list
+        :param answer: string, the given answer
+        :return bool, is the answer acceptable
+        """
+        return self.check(index, answer) is not None
@@ -0,0 +1,251 @@
+"""
+Persistent cache of the synthesized speech for the language learning app.
+
+Every (text, language) pair is synthesized only once, the audio is stored
+in a directory and the name of the file is the hash of the pair. The total
+size of the directory is limited, when it is exceeded the least recently
+used files are deleted.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# The default directory of the cache
+AUDIO_CACHE_DIRECTORY = "audio_cache"
+# The default maximal size of the cache in bytes
+AUDIO_CACHE_SIZE = 100 * 1024 * 1024
+# The name of the file which stores the order of usage
+INDEX_FILE_NAME = "index.json"
+# The changed index is saved at most this often in seconds
+INDEX_SAVE_INTERVAL = 30
+
+
+def synthesize_speech(text, language, file_name):
+    """
+    Synthesizes the text with Google text to speech and saves it.
+
+    :param text: string, the text to be read
+    :param language: string, the gTTS language code
+    :param file_name: string, the path of the created mp3 file
+    """
+    # Imported here, so the cache can be created before gtts is loaded
+    import gtts
+    tts = gtts.gTTS(text=text, lang=language)
+    tts.save(file_name)
+
+
+class AudioCache:
+    """
+    Content-addressed on-disk cache of the audio files with LRU eviction.
+    """
+
+    def __init__(self, directory=AUDIO_CACHE_DIRECTORY,
+                 max_size=AUDIO_CACHE_SIZE):
+        """
+        Loads the index of the cache.
+
+        :param directory: string, the directory of the audio files
+        :param max_size: int, the maximal size of the cache in bytes
+        """
+        # The directory of the audio files
+        self.__directory = directory
+        # The maximal size in bytes
+        self.__max_size = max_size
+        # The cached files in the order of usage, the last one is the newest
+        #     - key [string] the hash of the text and the language
+        #     - value [int] the size of the file in bytes
+        self.__entries = OrderedDict()
+        # The sum of the file sizes
+        self.__size = 0
+        # Guards the index
+        self.__lock = threading.Lock()
+        # The files which are being synthesized right now
+        #     - key [string] the hash of the text and the language
+        #     - value [threading.Event] set when the file is ready
+        self.__in_progress = {}
+        # The evicted files which could not be deleted yet, e.g. because
+        #     they were being played, their size is still counted
+        #     - key [string] the hash of the text and the language
+        #     - value [int] the size of the file in bytes
+        self.__pending_deletes = {}
+        # The index changed since it was saved
+        self.__index_changed = False
+        # time.monotonic() when the index was saved
+        self.__index_saved = time.monotonic()
+        os.makedirs(self.__directory, exist_ok=True)
+        self.load_index()
+
+    @staticmethod
+    def key(text, language):
+        """
+        The content address of a text.
+
+        :param text: string, the spoken text
+        :param language: string, the language code
+        :return string, the hash of the pair
+        """
+        return hashlib.sha1(f"{language}\0{text}".encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        """
+        :param key: string, the content address
+        :return string, the path of the audio file
+        """
+        return os.path.join(self.__directory, f"{key}.mp3")
+
+    def get(self, text, language):
+        """
+        Returns the cached audio file and marks it as recently used.
+
+        :param text: string, the spoken text
+        :param language: string, the language code
+        :return string or None, the path of the file if it is cached
+        """
+        key = self.key(text, language)
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+            # The file was deleted from outside
+            if not os.path.exists(self.path(key)):
+                self.__size -= self.__entries.pop(key)
+                return None
+            # Most recently used
+            self.__entries.move_to_end(key)
+            self.index_changed()
+        return self.path(key)
+
+    def fetch(self, text, language, synthesize=synthesize_speech):
+        """
+        Returns the audio file, it is synthesized if it is not cached yet.
+
+        :param text: string, the spoken text
+        :param language: string, the language code
+        :param synthesize: function(text, language, file_name), creates the file
+        :return string, the path of the file
+        """
+        key = self.key(text, language)
+        while True:
+            file_name = self.get(text, language)
+            if file_name:
+                return file_name
+            with self.__lock:
+                ready = self.__in_progress.get(key)
+                if ready is None:
+                    # This thread synthesizes it
+                    ready = self.__in_progress[key] = threading.Event()
+                    break
+            # Another thread synthesizes the same text, it is not requested twice
+            ready.wait()
+        file_name = self.path(key)
+        # The audio is written to a temporary file first,
+        #     so a half written file is never used
+        temp_file_name = f"{file_name}.{threading.get_ident()}.part"
+        try:
+            synthesize(text, language, temp_file_name)
+            os.replace(temp_file_name, file_name)
+            self.add(key, os.path.getsize(file_name))
+        finally:
+            if os.path.exists(temp_file_name):
+                os.remove(temp_file_name)
+            with self.__lock:
+                del self.__in_progress[key]
+            ready.set()
+        return file_name
+
+    def add(self, key, size):
+        """
+        Registers a new file and deletes the old ones if the cache is full.
+
+        :param key: string, the content address
+        :param size: int, the size of the file in bytes
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= self.__entries.pop(key)
+            self.__entries[key] = size
+            self.__size += size
+            self.retry_deletes()
+            # Removes the least recently used files, the new one is kept
+            while self.__size > self.__max_size and len(self.__entries) > 1:
+                old_key, old_size = self.__entries.popitem(last=False)
+                self.__pending_deletes[old_key] = old_size
+                self.retry_deletes()
+            self.index_changed()
+
+    def retry_deletes(self):
+        """
+        Deletes the evicted files which are not deleted yet,
+            their size is not counted after that. The lock has to be held.
+        """
+        for key, size in list(self.__pending_deletes.items()):
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+            # It may be played right now, it is deleted later
+            except OSError:
+                continue
+            del self.__pending_deletes[key]
+            self.__size -= size
+
+    def index_changed(self):
+        """
+        Marks the index as changed, it is saved now and then
+            and when the cache is closed. The lock has to be held.
+        """
+        self.__index_changed = True
+        if time.monotonic() - self.__index_saved > INDEX_SAVE_INTERVAL:
+            self.save_index()
+
+    def close(self):
+        """
+        Deletes the evicted files and saves the index if it changed.
+        """
+        with self.__lock:
+            self.retry_deletes()
+            if self.__index_changed:
+                self.save_index()
+
+    def load_index(self):
+        """
+        Reads the order of usage from the index file.
+            The files which are missing are left out, the audio files
+            which are not in the index (e.g. an evicted file which
+            could not be deleted) are the least recently used ones.
+        """
+        try:
+            with open(os.path.join(self.__directory, INDEX_FILE_NAME),
+                      "r", encoding="utf-8") as index_file:
+                entries = json.load(index_file)
+        except (OSError, ValueError):
+            entries = []
+        indexed = dict(entries)
+        with os.scandir(self.__directory) as files:
+            for entry in files:
+                key, extension = os.path.splitext(entry.name)
+                if extension == ".mp3" and key not in indexed:
+                    self.__entries[key] = entry.stat().st_size
+                    self.__size += self.__entries[key]
+                    self.__index_changed = True
+        for key, size in entries:
+            if os.path.exists(self.path(key)):
+                self.__entries[key] = size
+                self.__size += size
+
+    def save_index(self):
+        """
+        Writes the order of usage to the index file. The lock has to be held.
+        """
+        file_name = os.path.join(self.__directory, INDEX_FILE_NAME)
+        try:
+            with open(f"{file_name}.tmp", "w", encoding="utf-8") as index_file:
+                json.dump(list(self.__entries.items()), index_file)
+            os.replace(f"{file_name}.tmp", file_name)
+            self.__index_changed = False
+            self.__index_saved = time.monotonic()
+        # The cache still works without the index
+        except OSError:
+            pass
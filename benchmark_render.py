@@ -0,0 +1,108 @@
+"""
+Benchmark of showing a question on the Write tab.
+
+Compares the previous way, where the widgets of the question were destroyed
+and created again for every card, with the reused WriteView, which only
+changes the texts. The time includes the layout (update_idletasks).
+It needs a display. No timings of the two ways are recorded yet, so the
+reuse is not claimed to be faster, it only avoids creating and destroying
+the Tk widgets of every card. The medians and the 95th percentiles
+printed by the benchmark are the numbers to compare.
+
+Usage:
+    python benchmark_render.py [number of cards]
+Without a desktop it can be run with a virtual display:
+    xvfb-run -a python benchmark_render.py
+"""
+import sys
+import time
+from tkinter import Tk, TclError, ttk, Scrollbar, Text
+
+from practice_views import WriteView
+
+# The default number of cards
+DEFAULT_CARDS = 500
+# The fonts of main.py
+FONT = ("Helvetica", 14)
+ENTRY_FONT = ("Helvetica", 16)
+
+
+def previous_card(tab, text, check):
+    """
+    Creates the widgets of a question like the previous write_mode_write.
+
+    :return list of widgets, they are destroyed before the next card
+    """
+    question_label = ttk.Label(tab, text = text, wraplength = 415, font = FONT)
+    question_label.grid(column = 0, row = 1)
+    entry = Text(tab, height = 5, width = 50, font = ENTRY_FONT)
+    entry.grid(column = 0, row = 2)
+    scrollbar = Scrollbar(tab)
+    scrollbar.grid(column = 1, row = 2, sticky = "nse")
+    entry.configure(yscrollcommand = scrollbar.set)
+    scrollbar.configure(command = entry.yview)
+    check_button = ttk.Button(tab, text = "Check", command = check)
+    check_button.grid(column = 0, row = 3)
+    result_label = ttk.Label(tab, text = "...", wraplength = 415, font = FONT)
+    next_button = ttk.Button(tab, text = "Next")
+    entry.focus()
+    return [question_label, entry, scrollbar, check_button, result_label, next_button]
+
+
+def measure(window, show, cards):
+    """
+    :param show: function, shows the i-th card
+    :return list of floats, the time of every card in milliseconds
+    """
+    times = []
+    for i in range(cards):
+        start = time.perf_counter()
+        show(i)
+        window.update_idletasks()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def summary(times):
+    """
+    :return string, the median and the 95th percentile
+    """
+    times = sorted(times)
+    return (f"median {times[len(times) // 2]:6.3f} ms  "
+            f"p95 {times[int(len(times) * 0.95)]:6.3f} ms")
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CARDS
+    try:
+        window = Tk()
+    except TclError as e:
+        print(f"The benchmark needs a display ({e}), try: xvfb-run -a python benchmark_render.py")
+        return 2
+    tab = ttk.Frame(window)
+    tab.grid()
+
+    widgets = []
+
+    def show_previous(i):
+        for widget in widgets:
+            widget.destroy()
+        widgets[:] = previous_card(tab, f"What does\nterm {i}\nmean?", None)
+
+    previous_times = measure(window, show_previous, cards)
+    for widget in widgets:
+        widget.destroy()
+
+    view = WriteView(tab, FONT, ENTRY_FONT, None)
+    current_times = measure(
+        window, lambda i: view.show_question(f"What does\nterm {i}\nmean?"), cards)
+    window.destroy()
+
+    print(f"{cards} cards")
+    print(f"destroy and create  {summary(previous_times)}")
+    print(f"reused WriteView    {summary(current_times)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark of the text normalization.
+
+Compares the compiled, single pass functions of text_normalization with the
+previous implementations on the terms of the given word lists, and checks
+that they give the same results.
+
+Usage:
+    python benchmark_text_normalization.py [directory] [separator]
+The default directory is word_lists/uusi_kielemme/advanced.
+"""
+import os
+import re
+import sys
+import timeit
+
+from text_normalization import clean_word, remove_nested_parentheses
+
+# The default word lists
+DEFAULT_DIRECTORY = os.path.join("word_lists", "uusi_kielemme", "advanced")
+# How many times the terms are normalized in one measurement
+REPEAT = 20
+
+
+def previous_clean_word(word, case_sensitive=False):
+    """
+    The previous clean_word, the pattern is compiled at every call.
+    """
+    word = re.sub(r'\s{2,}', ' ', word)
+    word = word.strip()
+    if not case_sensitive:
+        word = word.lower()
+    return word
+
+
+def previous_remove_nested_parentheses(input_string):
+    """
+    The previous remove_nested_parentheses, it searches until a fixed point.
+    """
+    pattern = r'\([^()]*\)'
+    while re.search(pattern, input_string):
+        input_string = re.sub(pattern, '', input_string)
+    return input_string
+
+
+def read_terms(directory, separator):
+    """
+    Reads all the terms of the word lists in a directory.
+
+    :param directory: string, the directory of the word lists
+    :param separator: string, the separator of the terms
+    :return list of strings, the terms
+    """
+    terms = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith((".csv", ".txt")):
+            continue
+        with open(os.path.join(directory, file_name), "r", encoding="utf8") as my_file:
+            for line in my_file:
+                terms += line.strip().split(separator)
+    return terms
+
+
+def measure(function, terms):
+    """
+    :param function: function(string), the measured function
+    :param terms: list of strings, the input
+    :return float, the best time of one call in microseconds
+    """
+    timer = timeit.Timer(lambda: [function(term) for term in terms])
+    return min(timer.repeat(repeat=5, number=REPEAT)) / REPEAT / len(terms) * 1e6
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DIRECTORY
+    separator = sys.argv[2] if len(sys.argv) > 2 else ";"
+    terms = read_terms(directory, separator)
+    print(f"{len(terms)} terms from {directory}")
+    pairs = [
+        ("clean_word", previous_clean_word, clean_word),
+        ("remove_nested_parentheses", previous_remove_nested_parentheses,
+            remove_nested_parentheses),
+        ("both (as in words_match)",
+            lambda x: previous_clean_word(previous_remove_nested_parentheses(x)),
+            lambda x: clean_word(remove_nested_parentheses(x))),
+    ]
+    for name, previous, current in pairs:
+        # The results have to be the same
+        different = [x for x in terms if previous(x) != current(x)]
+        if different:
+            print(f"{name}: different results for {different[:5]}")
+        previous_time = measure(previous, terms)
+        current_time = measure(current, terms)
+        print(f"{name:28} previous {previous_time:6.2f} us  "
+              f"current {current_time:6.2f} us  "
+              f"speed-up {previous_time / current_time:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
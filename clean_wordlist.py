@@ -1,24 +1,199 @@
-# replace_tabs.py
+"""
+Normalizes the characters of the word list files.
+
+The tabs become semicolons, the typographic quotes, apostrophes, dashes
+and ellipses become ASCII, the soft hyphens are removed, the non-breaking
+spaces become spaces, the slashes get spaces around them, the double
+spaces and the empty lines are halved. The line breaks become "\n" like
+when the file is read as text.
+
+All the files of the given directories are cleaned in parallel processes.
+The rules are applied in the order of the original single file script,
+so the output is the same, then a changed file is replaced atomically.
+The hash of every clean file is stored in a cache, an unchanged file is
+not normalized again on the next run.
+
+Usage:
+    python clean_wordlist.py [PATH ...] [--check] [--diff] [--jobs N] [--no-cache]
+The default path is word_lists. --check and --diff do not change the files,
+--check exits with 1 if a file would be changed.
+"""
+import argparse
+import difflib
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from word_list_writer import atomic_writer
+
+# The default directory of the word lists
+DEFAULT_ROOT = "word_lists"
+# The hashes of the clean files
+DEFAULT_CACHE = "clean_wordlist_cache.json"
+# The extensions of the word list files
+EXTENSIONS = (".csv", ".txt")
+# Increased when the rules change, the cache is not valid after that
+RULES_VERSION = 2
+
+# The replacements in order, every one is a single str.replace pass
+#     (so e.g. four spaces become two)
+REPLACEMENTS = [
+    # Windows and old Mac line breaks
+    ("\r\n", "\n"),
+    ("\r", "\n"),
+    ("\t", ";"),
+    ("  ", " "),
+    ("\n\n", "\n"),
+    (" ", " "),
+    ("­", ""),
+    ("’", "'"),
+    ("…", "..."),
+    ("/", " / "),
+    ("  ", " "),
+    ("–", "-"),
+    ("“", '"'),
+    ("”", '"'),
+]
+
+
+def clean_text(content):
+    """
+    :param content: string, the content of a word list file
+    :return string, the normalized content
+    """
+    for old, new in REPLACEMENTS:
+        content = content.replace(old, new)
+    return content
+
+
+def find_files(paths):
+    """
+    :param paths: list of strings, files and directories
+    :return list of strings, the word list files, the directories are walked
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for directory, _, file_names in os.walk(path):
+            files += [os.path.join(directory, file_name) for file_name in file_names
+                      if file_name.lower().endswith(EXTENSIONS)]
+    return sorted(files)
+
+
+def clean_file(file_name, clean_hash=None, write=True, diff=False):
+    """
+    Normalizes a file, runs in a worker process.
+
+    :param file_name: string, the path of the file
+    :param clean_hash: string or None, the hash of the file
+        when it was clean the last time
+    :param write: bool, is the changed file saved
+    :param diff: bool, is the diff of the changes returned
+    :return tuple of (string, string, string or None), the state of the file
+        ("cached", "clean" or "changed"), the hash of the clean content
+        and the unified diff
+    """
+    with open(file_name, "rb") as my_file:
+        data = my_file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == clean_hash:
+        return "cached", digest, None
+    content = data.decode("utf-8")
+    cleaned = clean_text(content)
+    if cleaned == content:
+        return "clean", digest, None
+    changes = None
+    if diff:
+        changes = "".join(difflib.unified_diff(
+            content.splitlines(keepends=True), cleaned.splitlines(keepends=True),
+            fromfile=file_name, tofile=file_name))
+    if write:
+        with atomic_writer(file_name) as temp_file:
+            temp_file.write(cleaned)
+    return "changed", hashlib.sha256(cleaned.encode("utf-8")).hexdigest(), changes
+
+
+def load_cache(file_name):
+    """
+    :param file_name: string, the path of the cache
+    :return dict, key [string] the absolute path of a file,
+        value [string] the hash of its clean content
+    """
+    try:
+        with open(file_name, "r", encoding="utf-8") as my_file:
+            cache = json.load(my_file)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != RULES_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(file_name, hashes):
+    """
+    :param file_name: string, the path of the cache
+    :param hashes: dict, the result of load_cache
+    """
+    with atomic_writer(file_name) as my_file:
+        json.dump({"version": RULES_VERSION, "files": hashes}, my_file, indent=1)
+
+
+def main(argv=None):
+    """
+    :param argv: list of strings or None, the command line arguments
+    :return int, the exit code
+    """
+    parser = argparse.ArgumentParser(description="Normalizes the word list files.")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_ROOT],
+                        help="files and directories, default: word_lists")
+    parser.add_argument("--check", action="store_true",
+                        help="do not change the files, exit with 1 if a file is not clean")
+    parser.add_argument("--diff", action="store_true",
+                        help="do not change the files, print the changes")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="the number of processes, default: the number of CPUs")
+    parser.add_argument("--cache", default=DEFAULT_CACHE,
+                        help="the file of the hashes of the clean files")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="normalize also the files which were clean the last time")
+    args = parser.parse_args(argv)
+    write = not (args.check or args.diff)
+    hashes = {} if args.no_cache else load_cache(args.cache)
+    files = find_files(args.paths)
+    counts = {"cached": 0, "clean": 0, "changed": 0}
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(clean_file, file_name,
+                                   hashes.get(os.path.abspath(file_name)), write, args.diff)
+                   for file_name in files]
+        for file_name, future in zip(files, futures):
+            try:
+                state, digest, changes = future.result()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"{file_name}: {e}", file=sys.stderr)
+                failed += 1
+                continue
+            counts[state] += 1
+            if changes:
+                sys.stdout.write(changes)
+            if state == "changed":
+                print(f"{'Cleaned' if write else 'Would clean'}: {file_name}")
+            # A file which is not clean yet is normalized again the next time
+            if state != "changed" or write:
+                hashes[os.path.abspath(file_name)] = digest
+    if not args.no_cache:
+        save_cache(args.cache, hashes)
+    print(f"{counts['changed']} {'cleaned' if write else 'to clean'}, "
+          f"{counts['clean'] + counts['cached']} clean "
+          f"({counts['cached']} unchanged since the last run), {failed} failed.")
+    if failed or (args.check and counts["changed"]):
+        return 1
+    return 0
+
 
-filepath = sys.argv[1]
-with open(filepath, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Replace tab with semicolon
-content = content.replace('\t', ';')
-content = content.replace('  ', ' ')
-content = content.replace('\n\n', '\n')
-content = content.replace(' ', ' ')
-content = content.replace('­', '')
-content = content.replace('’', "'")
-content = content.replace('…', "...")
-content = content.replace("/", " / ")
-content = content.replace("  ", " ")
-content = content.replace("–", "-")
-content = content.replace('“', '"')
-content = content.replace('”', '"')
-
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(content)
-print(f"File saved.")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Compiled binary cache of the word list files.
+
+When a word list is opened for the first time, its parsed content and the
+duplicate report are written next to it into a .deck file. The next time
+the unchanged file is opened, the .deck file is memory mapped and the
+terms are sliced from its string table, the file is not parsed again.
+
+The .deck file is valid if the modification time and the size of the word
+list are the same as when it was compiled, or if its SHA-256 hash is the
+same (e.g. it was only touched or copied).
+
+Layout, all numbers are little-endian:
+    header: magic, version, mtime_ns, size, sha256, separator length,
+        number of languages, number of rows
+    separator: utf-8 bytes
+    offsets: (number of strings + 1) unsigned ints, the character offsets
+        of the strings in the string table, first the languages then the
+        terms column by column
+    string table: byte length, utf-8 bytes
+    duplicate report: byte length, utf-8 JSON
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from word_list_loader import load_word_list
+
+# The extension of the compiled files
+DECK_EXTENSION = ".deck"
+# Identifies the format
+MAGIC = b"SUOMIDCK"
+# Increased when the layout changes
+VERSION = 1
+# magic, version, mtime_ns, size, sha256, separator length,
+#     number of languages, number of rows
+HEADER = struct.Struct("<8sHqq32sIII")
+# A length field
+LENGTH = struct.Struct("<I")
+
+
+def deck_path(file_name):
+    """
+    :param file_name: string, the path of the word list
+    :return string, the path of the compiled file
+    """
+    return file_name + DECK_EXTENSION
+
+
+def file_hash(file_name):
+    """
+    :param file_name: string, the path of a file
+    :return bytes, the SHA-256 hash of its content
+    """
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as my_file:
+        for block in iter(lambda: my_file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def find_duplicates(strings):
+    """
+    :param strings: list of strings
+    :return list of strings or None, the strings which are there
+        more than once, None if there is no duplicate
+    """
+    seen = set()
+    duplicates = set()
+
+    for string in strings:
+        if string in seen:
+            duplicates.add(string)
+        else:
+            seen.add(string)
+
+    if duplicates:
+        return list(duplicates)
+    else:
+        return None
+
+
+def duplicate_report(word_list):
+    """
+    :param word_list: dict, key [string] the language,
+        value [list of strings] the terms
+    :return dict, key [string] the language, value [list of strings]
+        the duplicates, only the languages with duplicates are there
+    """
+    report = {}
+    for lang in word_list:
+        duplicates = find_duplicates(word_list[lang])
+        if duplicates:
+            report[lang] = duplicates
+    return report
+
+
+def save_deck(file_name, separator, languages, word_list, duplicates, stat, digest):
+    """
+    Writes the compiled file of a word list. Errors are ignored,
+        e.g. if the directory is read-only it is simply not cached.
+
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :param languages: list of strings, the header
+    :param word_list: dict, the terms of the languages
+    :param duplicates: dict, the duplicate report
+    :param stat: os.stat_result, the state of the word list when it was read
+    :param digest: bytes, the SHA-256 hash of the word list
+    """
+    strings = list(languages)
+    for lang in languages:
+        strings += word_list[lang]
+    # The character offsets of the strings
+    offsets = array("I", [0])
+    position = 0
+    for string in strings:
+        position += len(string)
+        offsets.append(position)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    text = "".join(strings).encode("utf-8")
+    report = json.dumps(duplicates, ensure_ascii=False).encode("utf-8")
+    separator_bytes = separator.encode("utf-8")
+    number_of_rows = len(word_list[languages[0]])
+    temp_name = deck_path(file_name) + ".tmp"
+    try:
+        with open(temp_name, "wb") as deck_file:
+            deck_file.write(HEADER.pack(
+                MAGIC, VERSION, stat.st_mtime_ns, stat.st_size, digest,
+                len(separator_bytes), len(languages), number_of_rows))
+            deck_file.write(separator_bytes)
+            deck_file.write(offsets.tobytes())
+            deck_file.write(LENGTH.pack(len(text)))
+            deck_file.write(text)
+            deck_file.write(LENGTH.pack(len(report)))
+            deck_file.write(report)
+        # The old compiled file is replaced atomically
+        os.replace(temp_name, deck_path(file_name))
+    except OSError:
+        try:
+            os.remove(temp_name)
+        except OSError:
+            pass
+
+
+def load_deck(file_name, separator):
+    """
+    Reads the compiled file of a word list if it is up to date.
+
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :return tuple of (list of strings, dict, dict) or None,
+        the languages, the word list and the duplicate report,
+        None if there is no valid compiled file
+    """
+    try:
+        stat = os.stat(file_name)
+        with open(deck_path(file_name), "rb") as deck_file:
+            with mmap.mmap(deck_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return read_deck(data, file_name, separator, stat)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+
+
+def read_deck(data, file_name, separator, stat):
+    """
+    Parses the compiled file.
+
+    :param data: mmap, the content of the compiled file
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :param stat: os.stat_result, the current state of the word list
+    :return tuple or None, see load_deck
+    """
+    (magic, version, mtime_ns, size, digest, separator_length,
+        number_of_languages, number_of_rows) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        return None
+    position = HEADER.size
+    if data[position:position + separator_length].decode("utf-8") != separator:
+        return None
+    # The word list changed, unless its content is the same
+    if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size) and \
+            file_hash(file_name) != digest:
+        return None
+    position += separator_length
+    number_of_strings = number_of_languages * (1 + number_of_rows)
+    offsets = array("I")
+    offsets.frombytes(data[position:position + offsets.itemsize * (number_of_strings + 1)])
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    position += offsets.itemsize * (number_of_strings + 1)
+    (text_length,) = LENGTH.unpack_from(data, position)
+    position += LENGTH.size
+    text = data[position:position + text_length].decode("utf-8")
+    position += text_length
+    (report_length,) = LENGTH.unpack_from(data, position)
+    position += LENGTH.size
+    duplicates = json.loads(data[position:position + report_length].decode("utf-8"))
+    strings = [text[offsets[i]:offsets[i + 1]] for i in range(number_of_strings)]
+    languages = strings[:number_of_languages]
+    word_list = {}
+    for i, lang in enumerate(languages):
+        start = number_of_languages + i * number_of_rows
+        word_list[lang] = strings[start:start + number_of_rows]
+    return languages, word_list, duplicates
+
+
+def open_word_list(file_name, separator):
+    """
+    Reads a word list from its compiled file, or parses it
+        and compiles it if it is not cached yet.
+
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :return tuple of (list of strings, dict, dict),
+        the languages, the word list and the duplicate report
+    """
+    deck = load_deck(file_name, separator)
+    if deck is not None:
+        return deck
+    # The state before reading, so a later change invalidates the cache
+    stat = os.stat(file_name)
+    digest = file_hash(file_name)
+    languages, word_list = load_word_list(file_name, separator)
+    duplicates = duplicate_report(word_list)
+    save_deck(file_name, separator, languages, word_list, duplicates, stat, digest)
+    return languages, word_list, duplicates
+
+
+def update_deck(file_name, separator, languages, word_list, duplicates):
+    """
+    Compiles a word list which was written by the program,
+        so it does not have to be parsed when it is opened again.
+
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :param languages: list of strings, the header
+    :param word_list: dict, the terms of the languages
+    :param duplicates: dict, the duplicate report
+    """
+    try:
+        stat = os.stat(file_name)
+        digest = file_hash(file_name)
+    except OSError:
+        return
+    save_deck(file_name, separator, languages, word_list, duplicates, stat, digest)
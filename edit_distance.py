@@ -0,0 +1,66 @@
+"""
+Bounded Levenshtein distance with the bit-parallel algorithm of Myers,
+in the formulation of Hyyrö for the edit distance of whole strings.
+
+A column of the dynamic programming table is represented by the bits of
+two integers (the +1 and -1 vertical differences), so a character of the
+text is processed with a few integer operations independently of the
+length of the pattern. The pattern is preprocessed once into a bitmask for
+every character (pattern_masks), it can be reused for many texts.
+"""
+
+
+def pattern_masks(pattern):
+    """
+    :param pattern: string, the pattern
+    :return dict, key [string] a character, value [int] the bitmask
+        of its positions in the pattern
+    """
+    masks = {}
+    for i, character in enumerate(pattern):
+        masks[character] = masks.get(character, 0) | (1 << i)
+    return masks
+
+
+def bounded_distance(masks, pattern_length, text, limit):
+    """
+    Computes the edit distance of a pattern and a text if it is at most limit.
+
+    :param masks: dict, the result of pattern_masks
+    :param pattern_length: int, the length of the pattern
+    :param text: string, the text
+    :param limit: int, the maximum distance which is interesting
+    :return int, the distance, or limit + 1 if it is greater than limit
+    """
+    # Every character has to be inserted or deleted
+    if abs(pattern_length - len(text)) > limit:
+        return limit + 1
+    if pattern_length == 0:
+        return len(text)
+    full = (1 << pattern_length) - 1
+    last = 1 << (pattern_length - 1)
+    # The vertical differences of the first column are all +1
+    positive = full
+    negative = 0
+    score = pattern_length
+    remaining = len(text)
+    for character in text:
+        remaining -= 1
+        equal = masks.get(character, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = (negative | ~(horizontal | positive)) & full
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            score += 1
+        elif horizontal_negative & last:
+            score -= 1
+        # The first row increases by one in every column
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = (horizontal_negative | ~(vertical | horizontal_positive)) & full
+        negative = horizontal_positive & vertical
+        # The score can decrease by at most one per remaining character
+        if score - remaining > limit:
+            return limit + 1
+    return score if score <= limit else limit + 1
@@ -0,0 +1,134 @@
+"""
+Log of the answers, one JSON object per line.
+
+The events are put into a bounded queue, a background thread takes them
+in batches and writes a batch with a single write call. Logging an event
+never waits for the disk: if the queue is full (e.g. the disk is very slow)
+the event is dropped and counted.
+
+An event is a dictionary, e.g. the events of the practice modes:
+    {"t": 1700000000.0, "event": "attempt", "mode": "write",
+     "deck": "word_lists/test.csv", "index": 3, "latency": 2.41,
+     "correct": false, "attempt": 1}
+"""
+import json
+import queue
+import threading
+import time
+
+# The file of the events
+DEFAULT_EVENT_LOG = "events.jsonl"
+# The maximum number of events waiting for the writer
+MAX_QUEUED_EVENTS = 10000
+# The maximum number of events in a write
+BATCH_SIZE = 200
+# The writer waits this many seconds for more events before writing
+FLUSH_INTERVAL = 1.0
+
+
+class EventLog:
+    """
+    Writes the events in a background thread.
+    """
+
+    def __init__(self, file_name=DEFAULT_EVENT_LOG, max_queued=MAX_QUEUED_EVENTS,
+                 batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        """
+        :param file_name: string, the JSONL file, the events are appended
+        :param max_queued: int, the size of the queue
+        :param batch_size: int, the maximum number of events in a write
+        :param flush_interval: float, how long the writer collects
+            the events of a batch in seconds
+        """
+        self.__file_name = file_name
+        self.__queue = queue.Queue(maxsize=max_queued)
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+        # The number of dropped events
+        self.__dropped = 0
+        # The last error of the writer
+        self.__error = None
+        # Marks the end of the events
+        self.__stop = object()
+        # Was close called
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.run, name="event log", daemon=True)
+        self.__thread.start()
+
+    @property
+    def dropped(self):
+        return self.__dropped
+
+    @property
+    def error(self):
+        return self.__error
+
+    def log(self, event, **fields):
+        """
+        Queues an event, it does not block.
+
+        :param event: string, the type of the event
+        :param fields: the values of the event, they have to be
+            JSON serializable
+        """
+        try:
+            self.__queue.put_nowait({"t": round(time.time(), 3), "event": event, **fields})
+        except queue.Full:
+            self.__dropped += 1
+
+    def run(self):
+        """
+        Writes the queued events in batches, runs in the background thread.
+        """
+        stopped = False
+        while not stopped:
+            # Waits for the first event of the batch
+            batch = [self.__queue.get()]
+            deadline = time.monotonic() + self.__flush_interval
+            # Collects the other events until the batch is full or it is time
+            while len(batch) < self.__batch_size and batch[-1] is not self.__stop:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.__queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            if batch[-1] is self.__stop:
+                batch.pop()
+                stopped = True
+            if batch:
+                self.write(batch)
+
+    def write(self, batch):
+        """
+        Appends the events to the file.
+
+        :param batch: list of dicts, the events
+        """
+        lines = "".join(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+                        for event in batch)
+        try:
+            with open(self.__file_name, "a", encoding="utf-8") as my_file:
+                my_file.write(lines)
+        except OSError as e:
+            self.__error = e
+
+    def close(self, timeout=5):
+        """
+        Writes the remaining events and stops the thread.
+            It does not raise, it can be called more than once.
+
+        :param timeout: float, the maximum wait in seconds
+        """
+        if self.__closed or not self.__thread.is_alive():
+            return
+        self.__closed = True
+        try:
+            # The stop mark has to get into the queue
+            self.__queue.put(self.__stop, timeout=timeout)
+        except queue.Full:
+            # The writer is stuck, the queued events may be lost
+            #     but the exit is not blocked
+            return
+        self.__thread.join(timeout)
@@ -0,0 +1,155 @@
+"""
+Write mode in the terminal, without the graphical user interface.
+
+Usage:
+    python main.py --headless deck.csv [--question LANG ...] [--answer LANG]
+        [--separator ";"] [--batch-size 8] [--no-shuffle]
+        [--correct-mistakes end|round] [--no-repeat-until-correct]
+        [--case-sensitive] [--near-miss] [--spaced-repetition]
+
+The terms are asked round by round like on the Write tab, the answer is
+typed and checked with ENTER. An empty input or Ctrl+D stops the practice.
+"""
+import time
+
+from answer_matcher import NEAR_MISS, AnswerMatcher
+from deck_cache import open_word_list
+from scheduler import SpacedRepetitionScheduler, deck_terms
+from session_engine import SessionEngine
+from word_list_loader import WordListError
+
+
+def add_arguments(parser):
+    """
+    Adds the options of the headless mode to the argument parser.
+
+    :param parser: argparse.ArgumentParser
+    """
+    parser.add_argument("--question", nargs="+", default=None,
+                        help="the question language(s), default: the first column")
+    parser.add_argument("--answer", default=None,
+                        help="the answer language, default: the second column")
+    parser.add_argument("--separator", default=";",
+                        help="the separator of the terms in the file")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="the number of terms in a round, 0 for all")
+    parser.add_argument("--no-shuffle", action="store_true",
+                        help="ask the terms in the order of the file")
+    parser.add_argument("--correct-mistakes", choices=["end", "round"],
+                        default="end", help="when the mistakes are asked again")
+    parser.add_argument("--no-repeat-until-correct", action="store_true",
+                        help="do not ask a wrong answer again immediately")
+    parser.add_argument("--case-sensitive", action="store_true",
+                        help="uppercase/lowercase matters")
+    parser.add_argument("--near-miss", action="store_true",
+                        help="accept answers with a typo in every 8 characters")
+    parser.add_argument("--spaced-repetition", action="store_true",
+                        help="ask only the due terms and a few new terms")
+
+
+def ask(prompt):
+    """
+    Reads a line from the terminal.
+
+    :param prompt: string, the text before the input
+    :return string or None, None at the end of the input
+    """
+    try:
+        return input(prompt)
+    except EOFError:
+        print()
+        return None
+
+
+def run_headless(args):
+    """
+    Runs the write mode in the terminal.
+
+    :param args: argparse.Namespace, the parsed command line options
+    :return int, the exit code
+    """
+    try:
+        languages, word_list, _ = open_word_list(args.headless, args.separator)
+    except (OSError, UnicodeDecodeError, WordListError) as e:
+        print(f"The word list cannot be opened: {e}")
+        return 1
+    ques_langs = args.question or [languages[0]]
+    answ_lang = args.answer or languages[min(1, len(languages) - 1)]
+    for lang in [*ques_langs, answ_lang]:
+        if lang not in word_list:
+            print(f"'{lang}' is not in the header: {', '.join(languages)}")
+            return 1
+    settings = {
+        "shuffle": not args.no_shuffle,
+        "ques_langs": ques_langs,
+        "answ_lang": answ_lang,
+        "batch_size": max(args.batch_size, 0),
+        "correct_mistakes": args.correct_mistakes,
+        "case_sensitive_answers": args.case_sensitive,
+        "repeat_until_correct": not args.no_repeat_until_correct,
+        "trim_punctuation_characters": [".", "!", "?"],
+        "trim_punctuation": "end",
+        "optional_answer_in_parentheses": True,
+        "near_miss_answers": args.near_miss,
+    }
+    number_of_words = len(word_list[answ_lang])
+    matcher = AnswerMatcher.from_settings(word_list[answ_lang], settings)
+    engine = SessionEngine.from_settings(number_of_words, settings)
+    scheduler = None
+    if args.spaced_repetition:
+        scheduler = SpacedRepetitionScheduler()
+        scheduler.open_deck(args.headless, *deck_terms(word_list, ques_langs, answ_lang))
+        engine.reset(scheduler.due_indices())
+    practice_time = time.time()
+    stopped = False
+    while not stopped:
+        recap = engine.next_round()
+        if recap is None:
+            break
+        print("\nIn this round you will practice these phrases:")
+        for i in recap:
+            print("  " + " / ".join(word_list[lang][i] for lang in [*ques_langs, answ_lang]))
+        if ask("Press ENTER to start! ") is None:
+            break
+        while not stopped:
+            index = engine.current_question()
+            if index is None:
+                break
+            question = " / ".join(word_list[lang][index] for lang in ques_langs)
+            correct_answer = word_list[answ_lang][index]
+            answer = ask(f"\nWhat does '{question}' mean in {answ_lang}? ")
+            if not answer:
+                stopped = True
+                break
+            result = matcher.check(index, answer)
+            if result:
+                print(f'{"Almost" if result == NEAR_MISS else "Correct"}, '
+                      f'the answer is "{correct_answer}".')
+                if scheduler:
+                    scheduler.review(index, True)
+                engine.answer_correct()
+                continue
+            print(f'Wrong, the answer is "{correct_answer}".')
+            # Asks until the answer is correct
+            while settings["repeat_until_correct"]:
+                answer = ask("Try again! ")
+                if not answer:
+                    stopped = True
+                    break
+                if matcher.matches(index, answer):
+                    break
+            if stopped:
+                break
+            if scheduler:
+                scheduler.review(index, False)
+            engine.answer_incorrect()
+        if engine.is_finished():
+            break
+    if scheduler:
+        scheduler.close()
+    cor_n = engine.number_of_correct_answers
+    incor_n = engine.number_of_incorrect_answers
+    print(f"\nYour accuracy was: {cor_n}/{cor_n + incor_n}"
+          f"={engine.accuracy * 100:.0f}%.\n"
+          f"You have practiced for {(time.time() - practice_time) / 60:.0f} minutes.")
+    return 0
@@ -0,0 +1,185 @@
+"""
+Timing of the stages of the practice loop.
+
+Every measured stage (e.g. rendering a question, checking an answer,
+synthesizing speech) has a rolling histogram of its last durations, so the
+statistics show the current behaviour and the memory use is bounded. The
+recent measurements are also kept as spans, they can be saved in the Chrome
+trace event format (chrome://tracing, https://ui.perfetto.dev) with the
+histograms in its "otherData".
+
+The stages can be measured from any thread.
+"""
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+
+# The number of the last durations in a histogram
+HISTOGRAM_WINDOW = 512
+# The number of the last spans in the trace
+TRACE_WINDOW = 10000
+# The upper bounds of the histogram buckets in milliseconds
+BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf")]
+
+
+class RollingHistogram:
+    """
+    The last durations of a stage.
+    """
+
+    def __init__(self, window=HISTOGRAM_WINDOW):
+        """
+        :param window: int, the number of the kept durations
+        """
+        self.__durations = deque(maxlen=window)
+        # The number of all the measurements, also the dropped ones
+        self.__total = 0
+
+    def add(self, duration):
+        """
+        :param duration: float, a duration in milliseconds
+        """
+        self.__durations.append(duration)
+        self.__total += 1
+
+    def summary(self):
+        """
+        :return dict, the total count and the count, mean, median,
+            95th percentile and maximum of the window in milliseconds
+        """
+        durations = sorted(self.__durations)
+        if not durations:
+            return {"total": self.__total, "count": 0, "mean": 0, "p50": 0, "p95": 0, "max": 0}
+        return {
+            "total": self.__total,
+            "count": len(durations),
+            "mean": sum(durations) / len(durations),
+            "p50": durations[len(durations) // 2],
+            "p95": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+            "max": durations[-1],
+        }
+
+    def buckets(self):
+        """
+        :return list of ints, the number of the durations in the window
+            below each bound of BUCKETS
+        """
+        counts = [0] * len(BUCKETS)
+        for duration in self.__durations:
+            counts[bisect_left(BUCKETS, duration)] += 1
+        return counts
+
+
+class Instrumentation:
+    """
+    The histograms and the trace of the measured stages.
+    """
+
+    def __init__(self, enabled=True, window=HISTOGRAM_WINDOW, trace_window=TRACE_WINDOW):
+        """
+        :param enabled: bool, if False nothing is measured
+        :param window: int, the size of the histograms
+        :param trace_window: int, the number of the kept spans
+        """
+        self.__enabled = enabled
+        self.__window = window
+        self.__start_time = time.perf_counter()
+        # The histograms of the stages
+        #     - key [string] the name of the stage
+        #     - value [RollingHistogram]
+        self.__histograms = {}
+        # The recent spans: (name, start, duration, thread id) tuples
+        self.__spans = deque(maxlen=trace_window)
+        # The stages are measured from several threads
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+    def record(self, name, start, duration):
+        """
+        Stores a measurement.
+
+        :param name: string, the name of the stage
+        :param start: float, time.perf_counter() at its start
+        :param duration: float, its length in seconds
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = self.__histograms[name] = RollingHistogram(self.__window)
+            histogram.add(duration * 1000)
+            self.__spans.append((name, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Measures the stage in the with block.
+
+        :param name: string, the name of the stage
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start)
+
+    def timed(self, name, function):
+        """
+        :param name: string, the name of the stage
+        :param function: function, it is measured at every call
+        :return function, calls the function and measures it
+        """
+        def timed_function(*args, **kwargs):
+            with self.stage(name):
+                return function(*args, **kwargs)
+        return timed_function
+
+    def summaries(self):
+        """
+        :return dict, key [string] the name of the stage,
+            value [dict] the summary of its histogram
+        """
+        with self.__lock:
+            return {name: histogram.summary() for name, histogram in self.__histograms.items()}
+
+    def report(self):
+        """
+        :return string, a table of the stages, the slowest (p95) first
+        """
+        summaries = sorted(self.summaries().items(), key=lambda item: -item[1]["p95"])
+        lines = [f"{'stage':24} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"]
+        for name, summary in summaries:
+            lines.append(f"{name:24.24} {summary['total']:6} {summary['p50']:8.2f} "
+                         f"{summary['p95']:8.2f} {summary['max']:8.2f}")
+        return "\n".join(lines)
+
+    def dump(self, file_name):
+        """
+        Saves the recent spans and the histograms as a Chrome trace.
+
+        :param file_name: string, the path of the JSON file
+        """
+        with self.__lock:
+            spans = list(self.__spans)
+            histograms = {name: {**histogram.summary(), "buckets": dict(zip(
+                (str(bound) for bound in BUCKETS), histogram.buckets()))}
+                for name, histogram in self.__histograms.items()}
+        trace = {
+            "traceEvents": [
+                {"name": name, "ph": "X", "pid": os.getpid(), "tid": thread,
+                 "ts": round((start - self.__start_time) * 1e6, 1),
+                 "dur": round(duration * 1e6, 1)}
+                for name, start, duration, thread in spans],
+            "displayTimeUnit": "ms",
+            "otherData": {"histograms": histograms},
+        }
+        with open(file_name, "w", encoding="utf-8") as my_file:
+            json.dump(trace, my_file, indent=1)
@@ -0,0 +1,255 @@
+"""
+Index of all the word lists in a directory tree.
+
+The library stores the metadata of every word list (languages, number of
+rows, hash) and an inverted index from the normalized terms to the places
+where they occur, in an SQLite database. When the tree is scanned again
+only the new and the changed files are read, a file whose size and
+modification time are unchanged is skipped.
+
+The searches use the index of the terms, so "which word list contains X"
+does not read any file. Several word lists can be loaded as one, e.g. to
+practice a whole course in one session.
+"""
+import csv
+import json
+import os
+import sqlite3
+import threading
+
+from deck_cache import file_hash, open_word_list
+from text_normalization import clean_word
+from word_list_loader import WordListError
+
+# The directory of the word lists
+DEFAULT_ROOT = "word_lists"
+# The database of the index
+DEFAULT_DATABASE = "library.sqlite3"
+# The extensions of the word list files
+EXTENSIONS = (".csv", ".txt")
+# The maximum number of search results
+MAX_RESULTS = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    languages TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT NOT NULL,
+    deck INTEGER NOT NULL REFERENCES decks (id),
+    language INTEGER NOT NULL,
+    row INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS terms_term ON terms (term);
+CREATE INDEX IF NOT EXISTS terms_deck ON terms (deck);
+"""
+
+
+def normalize(term):
+    """
+    :param term: string, a term or a search text
+    :return string, the form of the term in the index
+    """
+    return clean_word(term)
+
+
+def find_word_lists(root):
+    """
+    :param root: string, the root directory
+    :return list of strings, the paths of the word lists relative to the root
+    """
+    paths = []
+    for directory, _, file_names in os.walk(root):
+        for file_name in file_names:
+            if file_name.lower().endswith(EXTENSIONS):
+                paths.append(os.path.relpath(os.path.join(directory, file_name), root))
+    return sorted(paths)
+
+
+class Library:
+    """
+    The indexed word lists of a directory tree.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, database=DEFAULT_DATABASE, separator=";"):
+        """
+        :param root: string, the root directory of the word lists
+        :param database: string, the path of the index database
+        :param separator: string, the separator of the terms in the files
+        """
+        self.__root = root
+        self.__separator = separator
+        # The library is updated in a background thread
+        self.__connection = sqlite3.connect(database, check_same_thread=False)
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            self.__connection.executescript(SCHEMA)
+
+    @property
+    def root(self):
+        return self.__root
+
+    @property
+    def separator(self):
+        return self.__separator
+
+    def update(self):
+        """
+        Indexes the new and the changed word lists and removes the deleted ones.
+
+        :return tuple of 3 ints, the number of the indexed,
+            the unchanged and the removed word lists
+        """
+        with self.__lock:
+            known = {path: (deck_id, mtime_ns, size, digest) for deck_id, path, mtime_ns, size, digest
+                     in self.__connection.execute("SELECT id, path, mtime_ns, size, hash FROM decks")}
+        indexed = unchanged = 0
+        paths = find_word_lists(self.__root)
+        for path in paths:
+            full_path = os.path.join(self.__root, path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+            previous = known.get(path)
+            if previous and previous[1:3] == (stat.st_mtime_ns, stat.st_size):
+                unchanged += 1
+                continue
+            digest = file_hash(full_path).hex()
+            if previous and previous[3] == digest:
+                # Only the modification time changed
+                with self.__lock, self.__connection:
+                    self.__connection.execute(
+                        "UPDATE decks SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, previous[0]))
+                unchanged += 1
+                continue
+            self.index_deck(path, stat, digest, previous[0] if previous else None)
+            indexed += 1
+        existing = set(paths)
+        removed = [deck_id for path, (deck_id, *_) in known.items() if path not in existing]
+        with self.__lock, self.__connection:
+            for deck_id in removed:
+                self.__connection.execute("DELETE FROM terms WHERE deck = ?", (deck_id,))
+                self.__connection.execute("DELETE FROM decks WHERE id = ?", (deck_id,))
+        return indexed, unchanged, len(removed)
+
+    def index_deck(self, path, stat, digest, deck_id=None):
+        """
+        Reads a word list and replaces its metadata and terms in the index.
+            A file which cannot be read is stored with its error.
+
+        :param path: string, the path relative to the root
+        :param stat: os.stat_result, the state of the file
+        :param digest: string, the hexadecimal SHA-256 hash of the file
+        :param deck_id: int or None, the id of the previous version
+        """
+        try:
+            languages, word_list, _ = open_word_list(
+                os.path.join(self.__root, path), self.__separator)
+            error = None
+        except (OSError, UnicodeDecodeError, csv.Error, WordListError) as e:
+            languages, word_list, error = [], {}, str(e)
+        rows = len(word_list[languages[0]]) if languages else 0
+        with self.__lock, self.__connection:
+            if deck_id is not None:
+                self.__connection.execute("DELETE FROM terms WHERE deck = ?", (deck_id,))
+                self.__connection.execute("DELETE FROM decks WHERE id = ?", (deck_id,))
+            deck_id = self.__connection.execute(
+                "INSERT INTO decks (path, languages, rows, mtime_ns, size, hash, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, json.dumps(languages, ensure_ascii=False), rows,
+                 stat.st_mtime_ns, stat.st_size, digest, error)).lastrowid
+            self.__connection.executemany(
+                "INSERT INTO terms VALUES (?, ?, ?, ?)",
+                ((normalize(term), deck_id, language, row)
+                 for language, lang in enumerate(languages)
+                 for row, term in enumerate(word_list[lang])))
+
+    def decks(self):
+        """
+        :return list of dicts, the metadata of the readable word lists:
+            path, languages, rows and hash
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT path, languages, rows, hash FROM decks "
+                "WHERE error IS NULL ORDER BY path").fetchall()
+        return [{"path": path, "languages": json.loads(languages), "rows": number_of_rows,
+                 "hash": digest} for path, languages, number_of_rows, digest in rows]
+
+    def search(self, text, prefix=False, limit=MAX_RESULTS):
+        """
+        Finds a term in all the word lists.
+
+        :param text: string, the searched term
+        :param prefix: bool, find also the terms which start with the text
+        :param limit: int, the maximum number of results
+        :return list of tuples of (string, string, int, string),
+            the path of the word list, the language, the row
+            and the normalized term
+        """
+        term = normalize(text)
+        if not term:
+            return []
+        if prefix:
+            # A range of the index instead of LIKE
+            condition, parameters = "term >= ? AND term < ?", (term, term + "\U0010ffff")
+        else:
+            condition, parameters = "term = ?", (term,)
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT decks.path, decks.languages, terms.language, terms.row, terms.term "
+                f"FROM terms JOIN decks ON decks.id = terms.deck WHERE {condition} "
+                "ORDER BY decks.path, terms.row LIMIT ?", (*parameters, limit)).fetchall()
+        return [(path, json.loads(languages)[language], row, found)
+                for path, languages, language, row, found in rows]
+
+    def terms(self):
+        """
+        :return list of tuples of (string, string, int, string),
+            the path of the word list, the language, the row
+            and the normalized term of all the indexed terms
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT decks.path, decks.languages, terms.language, terms.row, terms.term "
+                "FROM terms JOIN decks ON decks.id = terms.deck "
+                "ORDER BY decks.path, terms.language, terms.row").fetchall()
+        languages = {}
+        return [(path, languages.setdefault(deck_languages, json.loads(deck_languages))[language],
+                 row, term) for path, deck_languages, language, row, term in rows]
+
+    def load_union(self, paths):
+        """
+        Loads several word lists as one. Only the languages which are
+            in all of them are kept, in the order of the first one.
+
+        :param paths: list of strings, the paths relative to the root
+        :return tuple of (list of strings, dict), the languages and the word list
+        """
+        decks = [open_word_list(os.path.join(self.__root, path), self.__separator)[:2]
+                 for path in paths]
+        languages = [lang for lang in decks[0][0]
+                     if all(lang in deck_languages for deck_languages, _ in decks)]
+        if not languages:
+            raise WordListError("The word lists do not have a common language!")
+        word_list = {lang: [] for lang in languages}
+        for _, deck_word_list in decks:
+            for lang in languages:
+                word_list[lang].extend(deck_word_list[lang])
+        return languages, word_list
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,268 @@
+"""
+Checks all the word list files at once.
+
+Every file is validated in a separate process: the encoding, the header,
+the number of terms in the lines, the separator, the whitespace around the
+terms and the terms which are the same after normalization (like the
+answers are compared). The results are stored in a cache by the hash of the
+file, so only the new and the changed files are checked again.
+
+The report is printed as a summary, with --json it is also written as JSON:
+    {"version", "separator", "summary": {"files", "errors", "warnings", "cached"},
+     "files": [{"path", "hash", "issues": [{"check", "severity", "line", "message"}]}]}
+
+Usage:
+    python lint_word_lists.py [PATH ...] [--separator ";"] [--json FILE|-]
+        [--jobs N] [--no-cache] [--quiet]
+The default path is word_lists. The exit code is 1 if there is an error.
+"""
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from clean_wordlist import find_files
+from text_normalization import clean_word
+from word_list_loader import iter_rows
+from word_list_writer import atomic_writer
+
+# The default directory of the word lists
+DEFAULT_ROOT = "word_lists"
+# The results of the checked files
+DEFAULT_CACHE = "lint_cache.json"
+# Increased when the checks change, the cache is not valid after that
+LINT_VERSION = 1
+# The share of the separators followed by a space, above it
+#     the file is separated by e.g. "; " instead of ";"
+PADDED_SEPARATOR_SHARE = 0.9
+# The severities of the checks, an error means the file cannot be opened
+SEVERITIES = {
+    "read": "error",
+    "encoding": "error",
+    "header": "error",
+    "columns": "error",
+    "separator": "warning",
+    "whitespace": "warning",
+    "empty": "warning",
+    "duplicate": "warning",
+}
+
+
+def issue(check, message, line=None):
+    """
+    :param check: string, a key of SEVERITIES
+    :param message: string, the description of the problem
+    :param line: int or None, the line number from 1
+    :return dict, a problem of a file
+    """
+    return {"check": check, "severity": SEVERITIES[check], "line": line, "message": message}
+
+
+def lint_text(content, separator):
+    """
+    Checks the content of a word list.
+
+    :param content: string, the content of the file
+    :param separator: string, the separator of the terms
+    :return list of dicts, the issues
+    """
+    issues = []
+    if content.startswith("﻿"):
+        issues.append(issue("encoding", "The file starts with a byte order mark.", 1))
+        content = content[1:]
+    # The nonempty lines, not stripped
+    lines = [(number, line.rstrip("\r\n"))
+             for number, line in enumerate(content.splitlines(), start=1) if line.strip()]
+    if not lines:
+        return [issue("header", "The file must have a header row!")]
+    header_number, header = lines[0]
+    if separator not in header:
+        issues.append(issue("header", f"The header does not contain the separator '{separator}'.",
+                            header_number))
+    languages = [language.strip() for language in header.split(separator)]
+    if len(set(languages)) != len(languages):
+        issues.append(issue("header", "The same language is twice in the header.", header_number))
+    rows = list(iter_rows(lines, separator, len(languages)))
+    if len(rows) == 1:
+        issues.append(issue("header", "There are no terms in the file.", header_number))
+    # Is the file separated by the separator and a space
+    separators = sum(len(terms) - 1 for _, _, terms in rows)
+    padded = sum(1 for _, _, terms in rows for term in terms[1:] if term.startswith(" "))
+    padded_separator = separators > 0 and padded >= PADDED_SEPARATOR_SHARE * separators
+    if padded_separator:
+        issues.append(issue("separator", f"The terms are separated by '{separator} ' "
+                                         f"instead of '{separator}'."))
+    # The lines of the normalized terms of every column
+    seen = [{} for _ in languages]
+    for line_number, line, terms in rows:
+        if "\t" in line and "\t" not in separator:
+            issues.append(issue("separator", "The line contains a tab.", line_number))
+        if len(terms) != len(languages):
+            issues.append(issue("columns", f"{len(terms)} terms instead of {len(languages)}.",
+                                line_number))
+            continue
+        if line_number == header_number:
+            continue
+        for column, term in enumerate(terms):
+            if not term.strip():
+                issues.append(issue("empty", f"The {languages[column]} term is empty.", line_number))
+                continue
+            # The space after a padded separator is reported once
+            stripped = term[1:] if padded_separator and column > 0 and term.startswith(" ") else term
+            if stripped != stripped.strip() or "  " in stripped:
+                issues.append(issue("whitespace", f"Extra whitespace in the {languages[column]} "
+                                                  f"term '{term}'.", line_number))
+            seen[column].setdefault(clean_word(term), []).append(line_number)
+    for language, terms in zip(languages, seen):
+        for term, line_numbers in terms.items():
+            if len(line_numbers) > 1:
+                issues.append(issue("duplicate", f"The {language} term '{term}' is in lines "
+                                                 f"{', '.join(map(str, line_numbers))}.",
+                                    line_numbers[0]))
+    return issues
+
+
+def lint_file(data, separator):
+    """
+    Checks a word list file, runs in a worker process.
+
+    :param data: bytes, the content of the file
+    :param separator: string, the separator of the terms
+    :return list of dicts, the issues
+    """
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        line = data.count(b"\n", 0, e.start) + 1
+        return [issue("encoding", f"The file is not UTF-8: {e.reason} at byte {e.start}.", line)]
+    return lint_text(content, separator)
+
+
+def load_cache(file_name, separator):
+    """
+    :param file_name: string, the path of the cache
+    :param separator: string, the results are valid only with this separator
+    :return dict, key [string] the hash of a file, value [list of dicts] its issues
+    """
+    try:
+        with open(file_name, "r", encoding="utf-8") as my_file:
+            cache = json.load(my_file)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != LINT_VERSION or cache.get("separator") != separator:
+        return {}
+    return cache.get("results", {})
+
+
+def save_cache(file_name, separator, results):
+    """
+    :param file_name: string, the path of the cache
+    :param separator: string, the separator of the checked files
+    :param results: dict, see load_cache
+    """
+    with atomic_writer(file_name) as my_file:
+        json.dump({"version": LINT_VERSION, "separator": separator, "results": results},
+                  my_file, ensure_ascii=False)
+
+
+def lint_files(files, separator, cache=None, jobs=None):
+    """
+    Checks the files, the ones which are not in the cache in parallel.
+
+    :param files: list of strings, the paths of the files
+    :param separator: string, the separator of the terms
+    :param cache: dict or None, see load_cache, the new results are added
+    :param jobs: int or None, the number of processes
+    :return dict, the report
+    """
+    cache = {} if cache is None else cache
+    report_files = []
+    missing = {}
+    # The files whose results were in the cache before this run
+    cached = 0
+    for file_name in files:
+        try:
+            with open(file_name, "rb") as my_file:
+                data = my_file.read()
+        except OSError as e:
+            report_files.append({"path": file_name, "hash": None,
+                                 "issues": [issue("read", f"The file cannot be read: {e}")]})
+            continue
+        digest = hashlib.sha256(data).hexdigest()
+        report_files.append({"path": file_name, "hash": digest})
+        if digest in cache:
+            cached += 1
+        else:
+            missing[digest] = data
+    if missing:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            digests = list(missing)
+            for digest, issues in zip(digests, executor.map(
+                    lint_file, (missing[digest] for digest in digests),
+                    [separator] * len(digests), chunksize=8)):
+                cache[digest] = issues
+    for file_report in report_files:
+        if "issues" not in file_report:
+            file_report["issues"] = cache[file_report["hash"]]
+    severities = [item["severity"] for file_report in report_files
+                  for item in file_report["issues"]]
+    return {
+        "version": LINT_VERSION,
+        "separator": separator,
+        "summary": {
+            "files": len(report_files),
+            "errors": severities.count("error"),
+            "warnings": severities.count("warning"),
+            "cached": cached,
+        },
+        "files": report_files,
+    }
+
+
+def main(argv=None):
+    """
+    :param argv: list of strings or None, the command line arguments
+    :return int, the exit code
+    """
+    parser = argparse.ArgumentParser(description="Checks the word list files.")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_ROOT],
+                        help="files and directories, default: word_lists")
+    parser.add_argument("--separator", default=";",
+                        help="the separator of the terms in the files")
+    parser.add_argument("--json", metavar="FILE", default=None,
+                        help="write the report as JSON, - for the standard output")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="the number of processes, default: the number of CPUs")
+    parser.add_argument("--cache", default=DEFAULT_CACHE,
+                        help="the file of the results of the checked files")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="check also the files which were checked already")
+    parser.add_argument("--quiet", action="store_true",
+                        help="print only the summary")
+    args = parser.parse_args(argv)
+    cache = {} if args.no_cache else load_cache(args.cache, args.separator)
+    report = lint_files(find_files(args.paths), args.separator, cache, args.jobs)
+    if not args.no_cache:
+        save_cache(args.cache, args.separator, cache)
+    if args.json == "-":
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        if args.json:
+            with atomic_writer(args.json) as my_file:
+                json.dump(report, my_file, ensure_ascii=False, indent=1)
+        if not args.quiet:
+            for file_report in report["files"]:
+                for item in file_report["issues"]:
+                    line = f":{item['line']}" if item["line"] else ""
+                    print(f"{file_report['path']}{line}: {item['severity']}: "
+                          f"[{item['check']}] {item['message']}")
+        summary = report["summary"]
+        print(f"{summary['files']} files, {summary['errors']} errors, "
+              f"{summary['warnings']} warnings ({summary['cached']} files from the cache).")
+    return 1 if report["summary"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,6 +67,10 @@ Learn modes:
  - Flashcards: you can turn them with the SPACE
  - Write: written questions    
 
+F12 opens a debug panel with the timings of the practice loop
+    (render, answer check, speech, teardown), with the --trace-out FILE
+    option they are saved as a Chrome trace at the exit.
+
 Example file content for the wordlist:
 Finnish;English;Hungarian
 omena.;apple;alma
@@ -87,42 +91,86 @@ Special character buttons
 Save a backup copy of the statistic.csv file
 Update README with set-up instructions
 """
-print("The program has started, it may take a few seconds.")
+# The start of the program for the startup profile
+import time
+STARTUP_TIME = time.perf_counter()
+import argparse
+import sys
+# Practice in the terminal
+from headless import add_arguments, run_headless
+
+
+def parse_arguments(argv = None):
+    """
+    :param argv: list of strings or None, the command line arguments
+    :return argparse.Namespace, the options
+    """
+    parser = argparse.ArgumentParser(description = "Language learning app.")
+    parser.add_argument("--headless", metavar = "DECK", default = None,
+                        help = "practice the word list in write mode in the terminal")
+    parser.add_argument("--profile-startup", action = "store_true",
+                        help = "print how long the phases of the startup take")
+    parser.add_argument("--trace-out", metavar = "FILE", default = None,
+                        help = "save the timings of the practice loop as a Chrome trace at the exit")
+    add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    ARGUMENTS = parse_arguments()
+    if ARGUMENTS.headless:
+        # No window is created, tkinter and the GUI modules are not imported
+        sys.exit(run_headless(ARGUMENTS))
 # Widgets
-from tkinter import Tk, ttk, filedialog, StringVar, IntVar, Scrollbar, Text, Scale, Menubutton, Menu
+from tkinter import Tk, Toplevel, ttk, filedialog, StringVar, IntVar, Scale, Menubutton, Menu, Listbox
 # Constants
-from tkinter import END, VERTICAL, HORIZONTAL, RAISED
-SPEAK_AVAILABLE = True
-TRANSLATE_AVAILABELE = True
-try:
-    # Reading the text
-    import pygame
-except:
-    print("Speak is not available!")
-    SPEAK_AVAILABLE = False
-try:
-    # Text to speech
-    import gtts
-    # Reading the text
-except:
-    print("Speak is not available!")
-    SPEAK_AVAILABLE = False
-# Translate
-try:
-    from deep_translator import GoogleTranslator
-except:
-    TRANSLATE_AVAILABELE = False
-    print("Translate not available!")
+from tkinter import END, HORIZONTAL, RAISED
+# The text to speech (pygame, gtts) and the translation (deep_translator)
+#     are imported in the background
 # date
 from datetime import datetime
-import numpy as np
-import pandas as pd
-import time
-import random
-import re
 
 # For writing utf-8 characters to file
 import codecs
+# Cache of the synthesized speech
+from audio_cache import AudioCache, synthesize_speech
+# Background speech synthesis
+from speech import SpeechPrefetcher, SpeechWorker, resolve_tts_languages
+# Checking the answers
+from answer_matcher import NEAR_MISS, AnswerMatcher
+from text_normalization import clean_word
+# Reading the word list files
+from word_list_loader import WordListError
+# Compiled cache of the word lists
+from deck_cache import open_word_list, duplicate_report, update_deck
+# Writing the translations into the word list files
+from word_list_writer import append_columns
+# Index and search of all the word lists
+from library import Library
+import threading
+import os
+import csv
+# Scheduling of the questions
+from session_engine import SessionEngine
+# Statistics of the sessions
+from statistics_store import StatisticsError, open_statistics
+import sqlite3
+# Log of the answers
+from event_log import EventLog
+# Translation of the columns
+from translation import GUI_BACKENDS, TranslationCache, TranslationJob
+# Spaced repetition
+from scheduler import SpacedRepetitionScheduler, deck_terms
+# Widgets of the practice modes
+from practice_views import FlashcardsView, WriteView
+# Tables of the word lists
+from virtual_table import VirtualTable, WordListRows
+# Background imports
+from startup import BackgroundImporter, StartupProfiler
+# Timing of the practice loop
+from instrumentation import Instrumentation
+# The end of the imports for the startup profile
+MODULES_IMPORTED = time.perf_counter()
 
 FONT_SIZE = 18
 
@@ -134,7 +182,8 @@ FONTS = {
     "help": ("Times", int(8/14*FONT_SIZE)),                   # Help label
     "table": ("Times", FONT_SIZE),                 # Table data
     "table_header": ("Times", FONT_SIZE, "bold"),  # Table header
-    "write_entry": ("Times", FONT_SIZE)            # Write entry
+    "write_entry": ("Times", FONT_SIZE),           # Write entry
+    "debug": ("Courier", int(10/14*FONT_SIZE))     # Debug panel
 }
 # The used colors
 COLORS = {
@@ -146,6 +195,37 @@ COLORS = {
 }
 # The amount of necessary practice in hours
 TARGET_PRACTICE = 1000
+# How often the finished speech requests are checked in milliseconds
+SPEECH_POLL_INTERVAL = 50
+# How often the background imports are checked in milliseconds
+IMPORT_POLL_INTERVAL = 100
+# How often the debug panel is updated in milliseconds
+DEBUG_PANEL_INTERVAL = 500
+# How often the progress of the translation is checked in milliseconds
+TRANSLATE_POLL_INTERVAL = 100
+# How often the indexing of the library is checked in milliseconds
+LIBRARY_POLL_INTERVAL = 100
+
+
+def initialize_speech():
+    """
+    Initializes the audio after pygame and gtts are imported.
+
+    :return dict, the gTTS languages e.g. {"fi": "Finnish"}
+    """
+    import pygame
+    import gtts
+    pygame.mixer.init()
+    return gtts.lang.tts_langs()
+
+
+# The optional features which are imported in the background
+#     - key [string] the feature
+#     - value [tuple] the modules and the function called after the import
+BACKGROUND_FEATURES = {
+    "speech": (["pygame", "gtts"], initialize_speech),
+    "translate": (["deep_translator"], None),
+}
 
 class GUI:
     """
@@ -154,10 +234,36 @@ class GUI:
     Implements all the functionality of the app. No input/return.
     """
 
-    def __init__(self):
-        # Text to speech
-        pygame.mixer.init()
-        self.__file_counter = 0
+    def __init__(self, profiler = None, instrumentation = None, trace_out = None):
+        """
+        Creates the window and starts the GUI.
+
+        :param profiler: StartupProfiler, measures the startup
+        :param instrumentation: Instrumentation, measures the practice loop
+        :param trace_out: string, the timings are saved into this file at the exit
+        """
+        # Measures the startup
+        self.__profiler = profiler or StartupProfiler(enabled = False)
+        # Measures the stages of the practice loop
+        self.__instrumentation = instrumentation or Instrumentation()
+        # The file of the trace
+        self.__trace_out = trace_out
+        # The debug panel with the timings, created when it is opened
+        self.__debug_panel = None
+        self.__debug_panel_label = None
+        # Imports the text to speech and the translation in the background
+        self.__background_imports = BackgroundImporter(BACKGROUND_FEATURES, self.__profiler)
+        self.__background_imports.start()
+        # The gTTS languages, known when the speech is imported
+        self.__tts_langs = {}
+        # The already synthesized audio files
+        self.__audio_cache = AudioCache()
+        # Synthesizes the terms of the next round in the background
+        self.__speech_prefetcher = SpeechPrefetcher(self.__audio_cache, synthesize =
+            self.__instrumentation.timed("tts synthesis", synthesize_speech))
+        # Reads the texts in a separate thread
+        self.__speech_worker = SpeechWorker(self.__speech_prefetcher,
+            self.__instrumentation.timed("tts playback", self.play_audio), self.stop_audio)
         # The main widget
         self.__main_window = Tk()
         # Title of the window
@@ -184,26 +290,72 @@ class GUI:
             "trim_punctuation_characters": [".", "!", "?"],
             "trim_punctuation": "end",
             "optional_answer_in_parentheses": True,
+            "near_miss_answers": False,
+            "spaced_repetition": False,
             "speak_enabled": True,
             "volume": 0.2,
             "statistics_file": "statistics.csv"
         }
         # The languages in the wordlist i.e. the header of the file as a list
         self.__languages = ["-"]
+        # The languages which are saved in the file, the others are translations
+        self.__file_languages = []
+        # The separator of the opened file
+        self.__file_separator = ";"
+        # The name of the opened word list in the title, more word lists
+        #     of the library are opened together without a file
+        self.__word_list_label = ""
+        # The duplicate terms of the languages
+        self.__duplicates = {}
+        # The text to speech codes of the languages
+        #     - key [string] the language in the header
+        #     - value [string] the gTTS language code
+        self.__tts_languages = {}
+        # Increased when a new word list is opened
+        self.__word_list_version = 0
+        # The compiled acceptable answers of the answer language
+        self.__answer_matcher = None
+        # The word list version and the settings of the compiled matcher
+        self.__answer_matcher_key = None
         # Number of terms to learn
         self.__number_of_words = -1
         # The index of the currently asked question
         self.__current_index = -1
-        # The indecies in random order for the questions
-        self.__question_indices = []
-        # The indecies for the current round
-        self.__current_question_indecies = []
-        # The indecies of the mistakes that are made in the round
-        self.__mistake_indecies = []
-        # Counter of the correct answers
-        self.__number_of_correct_answers = 0
-        # Counter of the incorrect ansers
-        self.__number_of_incorrect_answers = 0
+        # The batches, the order and the mistakes of the questions,
+        #     created when the settings are saved
+        self.__engine = None
+        # The memory states of the terms for the spaced repetition
+        self.__scheduler = SpacedRepetitionScheduler()
+        # The answers are logged in the background
+        self.__event_log = EventLog()
+        # The cache of the translations, opened at the first translation
+        self.__translation_cache = None
+        # The running translation
+        self.__translation_job = None
+        # The target language of the running translation
+        self.__translate_target_lang = ""
+        # The index of the word lists, opened with the library window
+        self.__library = None
+        # The library window
+        self.__library_window = None
+        # The word lists in the library window
+        self.__library_decks = []
+        # The thread which indexes the library, only one runs at a time
+        self.__library_update = None
+        # The error of the last indexing
+        self.__library_error = None
+        # When the current question was shown, time.perf_counter()
+        self.__question_time = 0
+        # The number of the checked answers of the current question
+        self.__attempts = 0
+        # The word list tables of the tabs, they are reused
+        #     - key [string] the name of the parent widget
+        #     - value [VirtualTable] the table
+        self.__tables = {}
+        # The header labels of the tables
+        self.__table_labels = {}
+        # The currently shown recap table and its label
+        self.__list = (None, None)
         # Learn mode i.e "flashcards" or "write"
         self.__mode = ""
         # The tab on which the widgets are put
@@ -244,6 +396,8 @@ class GUI:
         self.__tabs.pack(expand= 1, fill= "both")
         # Trigger for the key pressed
         self.__main_window.bind("<KeyPress>", self.key_pressed)
+        # F12 opens the debug panel with the timings
+        self.__main_window.bind("<F12>", self.toggle_debug_panel)
 
         # ----- The Settings tab -----
         # -- File dialog --
@@ -257,6 +411,9 @@ class GUI:
         # File browser
         ttk.Button(self.__settings_tab, text = "Open",
                    command = self.open_file).grid(column = 1, row = 1)
+        # Library of the word lists
+        ttk.Button(self.__settings_tab, text = "Library",
+                   command = self.open_library).grid(column = 2, row = 1)
         # Help label
         ttk.Label(self.__settings_tab,
                   text = "The file which contains the wordlist.",
@@ -476,18 +633,11 @@ class GUI:
                                                   columnspan = 2, padx = 10)
         # Shuffle var
         self.__speak_enabled_clicled = StringVar()
-        if SPEAK_AVAILABLE:
-            # Setting the value
-            self.__speak_enabled_clicled.set("True")
-            # Dropdown
-            self.__speak_enabled_btn = ttk.OptionMenu(self.__settings_tab,
-                    self.__speak_enabled_clicled, "True", *["True", "False"])
-        else:
-            # Setting the value
-            self.__speak_enabled_clicled.set("False")
-            # Dropdown
-            self.__speak_enabled_btn = ttk.OptionMenu(self.__settings_tab,
-                    self.__speak_enabled_clicled, "False", *["True"])
+        # Setting the value
+        self.__speak_enabled_clicled.set("True")
+        # Dropdown, if the speech cannot be imported only False remains
+        self.__speak_enabled_btn = ttk.OptionMenu(self.__settings_tab,
+                self.__speak_enabled_clicled, "True", *["True", "False"])
         # Puts the dropdown onto the window
         self.__speak_enabled_btn.grid(column = 1, row = 25)
 
@@ -519,15 +669,60 @@ class GUI:
                   text = "The file which contains the statistics.",
                   font = FONTS["help"], foreground=COLORS["help"]).grid(column = 0,
                                 row = 31, columnspan = 2, padx = 10)
+        # The database of the statistics, a CSV file is imported into it
+        self.__statistics = None
         try:
-            open(self.__settings["statistics_file"])
-        except:
+            self.__statistics = open_statistics(self.__settings["statistics_file"])
+        except (OSError, UnicodeDecodeError, sqlite3.Error, StatisticsError) as e:
+            print("The statistics file cannot be opened!", e)
             self.__settings["statistics_file"] = "-"
         self.__statistics_file_label = ttk.Label(self.__settings_tab,
                   text = f"Current file: {self.__settings['statistics_file']}",
                   font = FONTS["help"])
         self.__statistics_file_label.grid(column = 0,
                                 row = 32, columnspan = 2, padx = 10)
+        # -- Spaced repetition --
+        # Spaced repetition label
+        ttk.Label(self.__settings_tab, text = "Spaced repetition:",
+                  font = FONTS["p"]).grid(column = 0, row = 33)
+        # Help label
+        ttk.Label(self.__settings_tab,
+                  text = "Ask only the terms which are due and a few new terms.",
+                  font = FONTS["help"], foreground=COLORS["help"]).grid(column = 0,
+                                row = 34, columnspan = 2, padx = 10)
+        # Spaced repetition var
+        self.__spaced_repetition_clicled = StringVar()
+        # Setting the value
+        self.__spaced_repetition_clicled.set("False")
+        # Dropdown
+        self.__spaced_repetition_btn = ttk.OptionMenu(self.__settings_tab,
+                self.__spaced_repetition_clicled, "False", *["True", "False"])
+        # Puts the dropdown onto the window
+        self.__spaced_repetition_btn.grid(column = 1, row = 33)
+        # -- Progress --
+        # The practice time of today and of all the sessions
+        self.__progress_label = ttk.Label(self.__settings_tab, text = "",
+                                          font = FONTS["help"])
+        self.__progress_label.grid(column = 0, row = 35, columnspan = 2, padx = 10)
+        self.update_progress()
+        # -- Near miss answers --
+        # Near miss label
+        ttk.Label(self.__settings_tab, text = "Accept typos:",
+                  font = FONTS["p"]).grid(column = 0, row = 36)
+        # Help label
+        ttk.Label(self.__settings_tab,
+                  text = "An answer with a typo in every 8 characters is also accepted.",
+                  font = FONTS["help"], foreground=COLORS["help"]).grid(column = 0,
+                                row = 37, columnspan = 2, padx = 10)
+        # Near miss var
+        self.__near_miss_clicled = StringVar()
+        # Setting the value
+        self.__near_miss_clicled.set("False")
+        # Dropdown
+        self.__near_miss_btn = ttk.OptionMenu(self.__settings_tab,
+                self.__near_miss_clicled, "False", *["True", "False"])
+        # Puts the dropdown onto the window
+        self.__near_miss_btn.grid(column = 1, row = 36)
         # -- Error label --
         self.__error_label = ttk.Label(
             self.__settings_tab, text = "", foreground=COLORS["error"])
@@ -599,6 +794,23 @@ class GUI:
         self.__translate_error_label = ttk.Label(self.__translate_tab, text = " ", foreground=COLORS["error"], wraplength=500)
          # Puts the label onto the window
         self.__translate_error_label.grid(column = 0, row = 7, columnspan = 4)
+        # Translator label
+        ttk.Label(self.__translate_tab, text = "Translator:",
+                  font = FONTS["p"]).grid(column = 0, row = 8)
+        # Translator variable
+        self.__translate_backend_clicled = StringVar()
+        # Set the value
+        self.__translate_backend_clicled.set("google")
+        # Dropdown
+        self.__translate_backend_btn = ttk.OptionMenu(self.__translate_tab,
+                        self.__translate_backend_clicled, "google", *GUI_BACKENDS)
+        # Puts the dropdown onto the window
+        self.__translate_backend_btn.grid(column = 1, row = 8)
+        # The progress of the translation, shown while it runs
+        self.__translate_progress = ttk.Progressbar(self.__translate_tab, length = 300)
+        # Cancels the translation
+        self.__translate_cancel_button = ttk.Button(self.__translate_tab, text = "Cancel",
+                                                    command = self.cancel_translation)
         # Flashcards tab
         # Flashcards label
         ttk.Label(self.__flashcards_tab, text = "Flashcards Mode",
@@ -610,22 +822,13 @@ class GUI:
                 command = self.flashcards_mode_start)
         # Puts the button onto the window
         self.__flashcards_start_button.grid(column = 0, row = 1)
-        # Flashcard
-        self.__flashcard_button = ttk.Button(
-            self.__flashcards_tab, text = "...",
-                command = self.flashcard_button)
+        # The flashcard and the buttons, reused for every card
+        self.__flashcards_view = FlashcardsView(self.__flashcards_tab,
+            self.flashcard_button, self.correct_answer, self.incorrect_answer)
         # Start button 2
         self.__flashcards_start_button2 = ttk.Button(
             self.__flashcards_tab, text = "Start!",
                 command = self.flashcards_mode_flashcards)
-        # Correct button
-        self.__flashcards_correct_button = ttk.Button(
-            self.__flashcards_tab, text = "Correct",
-                command = self.correct_answer)
-        # Incorrect button
-        self.__flashcards_incorrect_button = ttk.Button(
-            self.__flashcards_tab, text = "Inorrect",
-                command = self.incorrect_answer)
         # Sets the columnwidth
         self.__flashcards_tab.columnconfigure(0, weight= 1)
 
@@ -644,18 +847,9 @@ class GUI:
             self.__write_tab, text = "Start!", command = self.write_mode_write)
         # Sets the width of the column
         self.__write_tab.columnconfigure(0, weight= 1)
-        # Question label
-        self.__write_question_label = ttk.Label(self.__write_tab)
-        # Check button
-        self.__write_check_button = ttk.Button(self.__write_tab, text = "Check")
-        # Answer entry
-        self.__write_answer_entry = Text(self.__write_tab, height= 5, width = 50)
-        # Answer entry scrollbar
-        self.__write_answer_entry_scrollbar = Scrollbar(self.__write_tab)
-        # Correct answer label
-        self.__write_correct_answer_label = ttk.Label(self.__write_tab)
-        # Next button
-        self.__write_next_button = ttk.Button(self.__write_tab, text = "Next")
+        # The question, the answer entry and the result, reused for every question
+        self.__write_view = WriteView(self.__write_tab, FONTS["p"],
+            FONTS["write_entry"], self.write_check_anwer)
 
         # Common to learn modes
         self.__congrat_label = ttk.Label()
@@ -665,10 +859,19 @@ class GUI:
         self.cancel_settings()
         # Adds the error message
         self.set_message("error", "You haven't chosen a wordlist file!")
+        # The window is ready
+        self.__profiler.record("GUI created", STARTUP_TIME, time.perf_counter() - STARTUP_TIME)
+        # Checks the finished speech requests
+        self.poll_speech()
+        # Checks the background imports
+        self.check_background_imports()
         # Starts the GUI
         self.__main_window.mainloop()
 
     def translate(self):
+        """
+        Starts translating the source column in the background.
+        """
         self.set_message()
         source_lang = self.__translate_clicled.get()
         target_lang = self.__translate_target_entry.get()
@@ -676,23 +879,117 @@ class GUI:
         if target_lang == "":
             self.set_message("translate_error", "The target language has to be given!")
             return
+        if target_lang in self.__word_list:
+            self.set_message("translate_error", f"'{target_lang}' is already in the word list!")
+            return
+        if source_lang not in self.__word_list:
+            self.set_message("translate_error", "The source language has to be chosen!")
+            return
         try:
-            translated = GoogleTranslator(source=source_lang.lower(), target=target_lang.lower()).translate_batch(self.__word_list[source_lang])
-            self.__word_list[target_lang] = translated
+            if self.__translation_cache is None:
+                self.__translation_cache = TranslationCache()
+            self.__translation_job = TranslationJob(
+                self.__word_list[source_lang], source_lang, target_lang,
+                self.__translate_backend_clicled.get(), self.__translation_cache)
+            # The cached texts are not requested again
+            self.__translation_job.start()
+        except Exception as e:
+            self.set_message("translate_error", f"{e}")
+            return
+        self.__translate_target_lang = target_lang
+        # Only one translation can run
+        self.__translate_button.configure(state = "disabled")
+        self.__save_translation_button.configure(state = "disabled")
+        # Shows the progress
+        self.__translate_progress.grid(column = 0, row = 9, columnspan = 2, pady = 10)
+        self.__translate_cancel_button.grid(column = 0, row = 10, columnspan = 2)
+        self.poll_translation()
+
+    def poll_translation(self):
+        """
+        Shows the progress of the translation, it reschedules itself
+            until the translation is finished.
+        """
+        job = self.__translation_job
+        translated, total = job.progress()
+        self.__translate_progress.configure(maximum = max(total, 1), value = translated)
+        if not job.done():
+            self.__main_window.after(TRANSLATE_POLL_INTERVAL, self.poll_translation)
+            return
+        # The translation is finished
+        self.__translation_job = None
+        self.__translate_progress.grid_remove()
+        self.__translate_cancel_button.grid_remove()
+        self.__translate_button.configure(state = "normal")
+        self.__save_translation_button.configure(state = "normal")
+        if job.error:
+            self.set_message("translate_error", f"{job.error}")
+        elif job.cancelled:
+            self.set_message("translate_error",
+                             f"The translation is cancelled ({translated}/{total}).")
+        else:
+            self.__word_list[self.__translate_target_lang] = job.result()
             self.__languages = list(self.__word_list.keys())
             # Prints the word list
             self.print_word_list(self.__languages, range(
                 self.__number_of_words), self.__translate_tab, 20, None, 2)
             self.__translate_tab.columnconfigure(0, weight=1)
             self.__translate_tab.columnconfigure(1, weight=1)
-        except Exception as e:
-            self.set_message("translate_error", f"{e}")
-            return
+
+    def cancel_translation(self):
+        """
+        Cancels the running translation, the finished chunks remain cached.
+        """
+        if self.__translation_job:
+            self.__translation_job.cancel()
 
     def save_translation(self):
-        word_list = pd.DataFrame(self.__word_list)
-        word_list.to_csv(self.__settings["wordlist_file"], sep=self.__settings["separator"], index=False)
-        self.setings_after_new_word_list()
+        """
+        Appends the translated columns to the word list file, and adds
+            the new languages to the settings without reloading the file.
+        """
+        self.set_message()
+        new_languages = [lang for lang in self.__languages if lang not in self.__file_languages]
+        # More word lists opened from the library are not one file
+        if not os.path.isfile(self.__settings["wordlist_file"]):
+            self.set_message("translate_error", "Only a single word list file can be saved!")
+            return
+        if not new_languages:
+            self.set_message("translate_error", "There is no new translation to save!")
+            return
+        try:
+            # The file is replaced atomically
+            append_columns(self.__settings["wordlist_file"], self.__file_separator,
+                           {lang: self.__word_list[lang] for lang in new_languages})
+        except (OSError, UnicodeDecodeError, WordListError) as e:
+            self.set_message("translate_error", f"The translation cannot be saved! {e}")
+            return
+        self.__file_languages = list(self.__languages)
+        # Only the new columns are checked for duplicates
+        new_duplicates = duplicate_report({lang: self.__word_list[lang] for lang in new_languages})
+        self.__duplicates.update(new_duplicates)
+        # The compiled file of the word list is updated too
+        update_deck(self.__settings["wordlist_file"], self.__file_separator,
+                    self.__languages, self.__word_list, self.__duplicates)
+        if new_duplicates:
+            warning_texts = [f"{lang}: {new_duplicates[lang]}" for lang in new_duplicates]
+            self.set_message(
+                "warning", f"There are duplicates in the translation: {', '.join(warning_texts)}")
+        # Adds the new languages to the question languages
+        for lang in new_languages:
+            self.__ques_lang_clicled_items.append(IntVar())
+            self.__question_mb.menu.add_checkbutton(
+                label=lang, variable=self.__ques_lang_clicled_items[-1])
+        # Sets the available languages, the chosen answer language is kept
+        self.__answ_lang_btn.set_menu(
+            self.__answ_lang_clicled.get(), *self.__languages)
+        self.__translate_btn.set_menu(
+            self.__translate_clicled.get(), *self.__languages)
+        # The text to speech codes of the new languages
+        self.__tts_languages.update(resolve_tts_languages(new_languages, self.__tts_langs))
+        # Shows the new columns on the list tab
+        self.update_list_tab()
+        self.set_message("translate_error", f"{', '.join(new_languages)} saved to the file.")
 
 
     def test_volume(self):
@@ -788,55 +1085,22 @@ class GUI:
             self.__tabs.tab(3, state = "disabled")
         # Clears the unnecessary buttons
         self.clear_buttons()
-        # If random order
-        if self.__settings["shuffle"]:
-            # Mixes the questions
-            random.shuffle(self.__question_indices)
-        # If there were no mistakes
-        if len(self.__mistake_indecies) == 0:
-            # If the batch size is 0, i.e. everything is in one batch
-            if self.__settings["batch_size"] == 0:
-                # All of the words are currently asked
-                self.__current_question_indecies = list(self.__question_indices)
-                # Shows the recap list
-                self.learn_mode_list()
-            # If there are batches
-            else:
-                # Checks for the last elements
-                try:
-                    # Sets the currently asked indecies
-                    self.__current_question_indecies = list(
-                        self.__question_indices[0:self.__settings["batch_size"]])
-                    # Removes the currently asked indecies
-                    self.__question_indices[0:self.__settings["batch_size"]] = []
-                # If we are in the last few elemnts
-                except:
-                    # All of the last elements are asked
-                    self.__current_question_indecies = list(
-                        self.__question_indices[0:])
-                    # Clears the list
-                    self.__question_indices = []
-                # If all the questions are answered
-                if len(self.__current_question_indecies) == 0 and len(self.__question_indices) == 0:
-                    # End
-                    self.learn_mode_end()
-                else:
-                    # Next round
-                    self.learn_mode_list()
-        # If there were mistakes in the previous round
+        # The indecies of the next round
+        recap = self.__engine.next_round()
+        # If all the questions are answered
+        if recap is None:
+            # End
+            self.learn_mode_end()
         else:
-            # The mistakes are asked agin
-            self.__current_question_indecies = list(self.__mistake_indecies)
-            # The mistakes list id vleared
-            self.__mistake_indecies = []
             # Next round
-            self.learn_mode_list()
+            self.learn_mode_list(recap)
 
-    def learn_mode_list(self):
+    def learn_mode_list(self, recap):
         """
         Shows the recap list in the beginning of the round
             of the terms which will be asked in this round.
-            No parameter.
+
+        :param recap: list of ints, the indecies of the round
         """
         # Flashcards mode
         if self.__mode == "flashcards":
@@ -864,13 +1128,12 @@ class GUI:
         # Gets the list
         self.__list = self.print_word_list(
             [*self.__settings["ques_langs"], self.__settings["answ_lang"]],
-                self.__current_question_indecies, self.__parent_tab)
+                recap, self.__parent_tab)
         """self.__list = self.print_word_list(
             [self.__settings["ques_lang"], self.__settings["answ_lang"]],
                 self.__current_question_indecies, self.__parent_tab)"""
-        # Shiffels the questions
-        if self.__settings["shuffle"]:
-            random.shuffle(self.__current_question_indecies)
+        # The answers are synthesized while the list is read
+        self.prefetch_speech()
         # Sets the columnwidths
         self.__parent_tab.columnconfigure(1, weight= 0)
         self.__parent_tab.columnconfigure(0, weight= 1)
@@ -901,6 +1164,8 @@ class GUI:
 
         :param event: event, the click event, necessary.
         """
+        # The start of the render
+        render_start = time.perf_counter()
         # Clears the unncessary widgets
         self.clear_list()
         # Activates the flashcards mode
@@ -908,31 +1173,10 @@ class GUI:
         # Shows the question first
         #self.__flashcard_shown_language = self.__settings["ques_lang"]
         self.__flashcard_show_question = True
-        # The flashcard
-        self.__flashcard_button = ttk.Button(
-            self.__parent_tab, text = "...", command = self.flashcard_button)
-        # Puts the flashcard onto the window
-        self.__flashcard_button.grid(column = 0, row = 2,
-                                     columnspan = 2, pady = 40)
-        # Correct button
-        self.__flashcards_correct_button = ttk.Button(
-            self.__parent_tab, text = "[C] Correct",
-            command = self.correct_answer)
-        # Puts the button onto the window
-        self.__flashcards_correct_button.grid(column = 0, row = 3, pady = 20)
-        # Incorrect button
-        self.__flashcards_incorrect_button = ttk.Button(
-            self.__parent_tab, text = "[I] Incorrect",
-            command = self.incorrect_answer)
-        # Puts the button onto the window
-        self.__flashcards_incorrect_button.grid(column = 1, row = 3, pady = 20)
-        # Sets the width of the column
-        self.__parent_tab.columnconfigure(1, weight= 1)
-
+        # The current index, None if the round is over
+        self.__current_index = self.__engine.current_question()
         # Are there any remaining question
-        if len(self.__current_question_indecies) > 0:
-            # The current index is the 0th
-            self.__current_index = self.__current_question_indecies[0]
+        if self.__current_index is not None:
             # Sets the button text
             if self.__flashcard_show_question:
                 text = (self.__settings["separator"]+"\n").join([
@@ -940,10 +1184,15 @@ class GUI:
                 ])
             else:
                 text = self.__word_list[self.__settings["answ_lang"]][self.__current_index]
-            self.__flashcard_button.configure(text = text)
+            # Shows the card
+            self.__flashcards_view.show(text)
+            # The answer time is measured from here
+            self.new_question()
+            # The render is measured until the layout is done
+            self.measure_render("render flashcards", render_start)
         else:
             # If there are no more questions
-            if len(self.__mistake_indecies) == 0 and self.__settings["batch_size"] == 0:
+            if self.__engine.is_finished():
                 # If there were no mistakes - End
                 self.learn_mode_end()
             else:
@@ -960,44 +1209,16 @@ class GUI:
 
         :param event: event, the click event, necessary.
         """
-
+        # The start of the render
+        render_start = time.perf_counter()
         # Clears the unncessary widgets
         self.clear_list()
         # Binds return to checking the answer
         self.__main_window.bind('<Return>', self.write_check_anwer)
-        # Question label
-        self.__write_question_label = ttk.Label(
-            self.__write_tab, text = "...", wraplength= 415, font = FONTS["p"])
-        # Puts the label onto the window
-        self.__write_question_label.grid(column = 0, row = 1)
-        # Answer entry
-        self.__write_answer_entry = Text(
-            self.__write_tab, height= 5, width = 50, font = FONTS["write_entry"])
-        # Puts the entry onto the window
-        self.__write_answer_entry.grid(column = 0, row = 2)
-        # Sets the focus
-        self.__write_answer_entry.focus()
-        # Sets the entry to enabled
-        self.__write_answer_entry.config(state = "normal")
-        # The scrollbar for the textbox
-        self.__write_answer_entry_scrollbar = Scrollbar(self.__write_tab)
-        # Sets the scrollbar
-        self.__write_answer_entry.configure(
-            yscrollcommand = self.__write_answer_entry_scrollbar.set)
-        self.__write_answer_entry_scrollbar.configure(
-            command = self.__write_answer_entry.yview)
-        # Puts the scrollbar onto the window
-        self.__write_answer_entry_scrollbar.grid(column = 1, row = 2, sticky = "nse")
-        # Check button
-        self.__write_check_button = ttk.Button(
-            self.__write_tab, text = "Check", command = self.write_check_anwer)
-        # Puts the button onto the window
-        self.__write_check_button.grid(column = 0, row = 3)
-
+        # The next question index, None if the round is over
+        self.__current_index = self.__engine.current_question()
         # Are there any remaining questions
-        if len(self.__current_question_indecies) > 0:
-            # The next question index
-            self.__current_index = self.__current_question_indecies[0]
+        if self.__current_index is not None:
             # The question
             """self.__question = self.__word_list[self.__settings["ques_lang"]
                                                ][self.__current_index]"""
@@ -1007,13 +1228,16 @@ class GUI:
             # The correct answer
             self.__correct_answer = self.__word_list[self.__settings["answ_lang"]
                                                      ][self.__current_index]
-            # Set the question label
-            self.__write_question_label.configure(
-                text =f'What does\n{self.__question}\nmean in {self.__settings["answ_lang"]}?')
-
+            # Shows the question with an empty answer entry
+            self.__write_view.show_question(
+                f'What does\n{self.__question}\nmean in {self.__settings["answ_lang"]}?')
+            # The answer time is measured from here
+            self.new_question()
+            # The render is measured until the layout is done
+            self.measure_render("render write", render_start)
         else:
             # No more questions
-            if len(self.__mistake_indecies) == 0 and self.__settings["batch_size"] == 0:
+            if self.__engine.is_finished():
                 # NO mistakes - End
                 self.learn_mode_end()
             else:
@@ -1022,19 +1246,137 @@ class GUI:
                 # Next round
                 self.learn_mode()
 
+    def measure_render(self, name, start):
+        """
+        Records the render time when the pending layout and drawing
+            (the idle tasks queued before) are done.
+
+        :param name: string, the name of the stage
+        :param start: float, time.perf_counter() at the start of the render
+        """
+        self.__main_window.after_idle(lambda: self.__instrumentation.record(
+            name, start, time.perf_counter() - start))
+
+    def toggle_debug_panel(self, event = None):
+        """
+        Opens or closes the window with the timings of the practice loop.
+
+        :param event: event, the key event, necessary.
+        """
+        if self.__debug_panel:
+            self.__debug_panel.destroy()
+            self.__debug_panel = None
+            return
+        self.__debug_panel = Toplevel(self.__main_window)
+        self.__debug_panel.title("Timings")
+        self.__debug_panel.protocol("WM_DELETE_WINDOW", self.toggle_debug_panel)
+        self.__debug_panel_label = ttk.Label(self.__debug_panel, font = FONTS["debug"],
+                                             justify = "left")
+        self.__debug_panel_label.grid(column = 0, row = 0, padx = 10, pady = 10)
+        self.update_debug_panel()
+
+    def update_debug_panel(self):
+        """
+        Shows the current timings, it reschedules itself while the panel is open.
+        """
+        if self.__debug_panel:
+            self.__debug_panel_label.configure(text = self.__instrumentation.report())
+            self.__debug_panel.after(DEBUG_PANEL_INTERVAL, self.update_debug_panel)
+
+    def tts_language(self, language):
+        """
+        Finds the text to speech language code of a language.
+
+        :param language: string, a language code or a header of the word list
+        :return string, the language code
+        """
+        # The table is built when the word list is opened
+        return self.__tts_languages.get(language, language)
+
+    def prefetch_speech(self):
+        """
+        Starts synthesizing the answers of the current round
+            in the background.
+        """
+        if self.__settings["speak_enabled"] and self.__mode == "write" and \
+                self.__background_imports.status("speech") == "ready":
+            language = self.tts_language(self.__settings["answ_lang"])
+            self.__speech_prefetcher.prefetch(
+                (self.__word_list[self.__settings["answ_lang"]][i], language)
+                for i in self.__engine.current_indices)
+
     def read_text(self, text, language="en"):
-        if self.__settings["speak_enabled"]:
-            if language not in gtts.lang.tts_langs():
-                for lang in gtts.lang.tts_langs():
-                    if gtts.lang.tts_langs()[lang].lower() == self.clean_word(self.remove_nested_parentheses(self.__settings["answ_lang"]).lower()):
-                        language = lang
-            tts = gtts.gTTS(text=text, lang=language)
-            self.__file_counter += 1
-            self.__file_counter %= 2
-            tts.save(f'hello-{self.__file_counter}.mp3')
-            pygame.mixer.music.load(f'hello-{self.__file_counter}.mp3')
-            pygame.mixer.music.set_volume(self.__settings["volume"])
-            pygame.mixer.music.play(loops=1)
+        """
+        Reads the text. The request is only queued, the synthesis
+            and the playing happen in the speech thread.
+
+        :param text: string, the text to be read
+        :param language: string, a language code or a header of the word list
+        """
+        if self.__settings["speak_enabled"] and self.__background_imports.status("speech") == "ready":
+            language = self.tts_language(language)
+            # Only the last requested text is read
+            self.__speech_worker.say(text, language, self.__settings["volume"])
+
+    def play_audio(self, file_name, volume):
+        """
+        Plays an audio file, called from the speech thread.
+
+        :param file_name: string, the path of the audio file
+        :param volume: float, the volume between 0 and 1
+        """
+        import pygame
+        pygame.mixer.music.load(file_name)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops=1)
+
+    def stop_audio(self):
+        """
+        Stops the audio which is playing, e.g. the answer of the previous question.
+        """
+        # Nothing can be playing before the speech is imported
+        if self.__background_imports.status("speech") != "ready":
+            return
+        import pygame
+        pygame.mixer.music.stop()
+
+    def poll_speech(self):
+        """
+        Handles the finished speech requests, it reschedules itself.
+        """
+        for status, text, error in self.__speech_worker.poll():
+            if status == "error":
+                print(f"The text '{text}' cannot be read!", error)
+        self.__main_window.after(SPEECH_POLL_INTERVAL, self.poll_speech)
+
+    def check_background_imports(self):
+        """
+        Enables the speech and the translation when their imports
+            are finished, it reschedules itself until all are done.
+        """
+        if not self.__background_imports.done():
+            self.__main_window.after(IMPORT_POLL_INTERVAL, self.check_background_imports)
+            return
+        if self.__background_imports.status("speech") == "ready":
+            # The languages of the opened word list can be resolved now
+            self.__tts_langs = self.__background_imports.result("speech")
+            if self.__languages != ["-"]:
+                self.__tts_languages = resolve_tts_languages(self.__languages, self.__tts_langs)
+        else:
+            print("Speak is not available!", self.__background_imports.error("speech"))
+            # Only False can be chosen
+            self.__settings["speak_enabled"] = False
+            self.__speak_enabled_clicled.set("False")
+            self.__speak_enabled_btn.set_menu("False", *["False"])
+        if self.__background_imports.status("translate") == "ready":
+            # If the other tabs are enabled the translate tab can be used
+            if str(self.__tabs.tab(1, "state")) == "normal":
+                self.__tabs.tab(4, state = "normal")
+        else:
+            print("Translate not available!", self.__background_imports.error("translate"))
+        self.__profiler.record("background imports checked", STARTUP_TIME,
+                               time.perf_counter() - STARTUP_TIME)
+        self.__profiler.report()
 
     def write_check_anwer(self, event = None):
         """
@@ -1045,59 +1387,47 @@ class GUI:
         self.read_text(self.__correct_answer, self.__settings["answ_lang"])
         # Unbinds return from the button
         self.unbind_event('<Return>', self.write_check_anwer)
-        # Deletes check button
-        self.delete_widget(self.__write_check_button)
-        # Correct answer label
-        self.__write_correct_answer_label = ttk.Label(
-            self.__write_tab, text = "...", wraplength = 415, font = FONTS["p"])
-        # Puts the label onto the window
-        self.__write_correct_answer_label.grid(column = 0, row = 3)
-        # Next button
-        self.__write_next_button = ttk.Button(self.__write_tab, text = "Next")
-        # Puts the button onto the grid
-        self.__write_next_button.grid(column = 0, row = 4)
+        # The answer entry
+        entry = self.__write_view.entry
         # Deletes the \n from the end of the text entry
-        if self.__write_answer_entry.get("end-1c", END) == "\n":
-            self.__write_answer_entry.delete("end-1c", END)
-        given_answer = self.__write_answer_entry.get("0.0", END).strip().replace("\n","")
+        if entry.get("end-1c", END) == "\n":
+            entry.delete("end-1c", END)
+        given_answer = entry.get("0.0", END).strip().replace("\n","")
         # Is answer correct
-        if self.words_match(given_answer, self.__correct_answer):
-            # Correct label
-            self.__write_correct_answer_label.configure(
-                text =f'Correct, the answer is "{self.__correct_answer}".',
-                foreground=COLORS["correct_answer"])
-            # Next word
-            self.__write_next_button.configure(command = self.correct_answer)
+        is_correct = self.words_match(given_answer, self.__current_index)
+        self.log_answer("attempt", is_correct)
+        if is_correct:
+            # Correct label, next word, a near miss shows the typos
+            self.__write_view.show_result(
+                f'Almost, the answer is "{self.__correct_answer}".'
+                if is_correct == NEAR_MISS else
+                f'Correct, the answer is "{self.__correct_answer}".',
+                COLORS["correct_answer"], self.correct_answer)
             # Binds the return to the button
             self.__main_window.bind('<Return>', self.correct_answer)
         else:
             # Incorrect answer
+            # If repeat until correct the next button checks again
+            if self.__settings["repeat_until_correct"]:
+                next_command = self.write_check_answer_button
+            else:
+                next_command = self.incorrect_answer
             # Incorrect answer label
-            self.__write_correct_answer_label.configure(
-                text =f'Wrong, the answer is "{self.__correct_answer}".',
-                foreground=COLORS["incorrect_answer"])
-            for i in range(max(len(given_answer), len(self.__correct_answer))):
-                try:
-                    if self.__write_answer_entry.get(f"1.{i}", f"1.{i+1}") != self.__correct_answer[i]:
-                        self.__write_answer_entry.tag_add("INCORRECT", f"1.{i}", f"1.{i+1}")
-                except:
-                    self.__write_answer_entry.tag_add("INCORRECT", f"1.{i}", f"1.{i+1}")
-
-            self.__write_answer_entry.tag_configure("INCORRECT", foreground=COLORS["incorrect_answer"])
+            self.__write_view.show_result(
+                f'Wrong, the answer is "{self.__correct_answer}".',
+                COLORS["incorrect_answer"], next_command)
+            # Highlights the differences
+            self.__write_view.show_differences(
+                self.__correct_answer, COLORS["incorrect_answer"],
+                self.__settings["case_sensitive_answers"])
             # If repeat until correct
             if self.__settings["repeat_until_correct"]:
-                # Sets the next button command
-                self.__write_next_button.configure(
-                    command = self.write_check_answer_button)
                 # Binds the return to the button
                 self.__main_window.bind(
                     '<Return>', self.write_check_answer_button)
                 # Disables the entry
-                self.__write_answer_entry.config(state = "disabled")
+                entry.config(state = "disabled")
             else:
-                # Sets the next button command to next word
-                self.__write_next_button.configure(
-                    command = self.incorrect_answer)
                 # Binds the return to the button
                 self.__main_window.bind('<Return>', self.incorrect_answer)
 
@@ -1107,53 +1437,46 @@ class GUI:
 
         :param event: event, the click event, necessary.
         """
+        # The answer entry
+        entry = self.__write_view.entry
         # Enables the text entry
-        self.__write_answer_entry.config(state = "normal")
+        entry.config(state = "normal")
         # Correct answer
-        if self.words_match(self.__write_answer_entry.get("0.0", END).strip().replace("\n",""), self.__correct_answer):
+        is_correct = self.words_match(entry.get("0.0", END).strip().replace("\n",""), self.__current_index)
+        self.log_answer("attempt", is_correct)
+        if is_correct:
             # It will ask it again later
             self.incorrect_answer()
         else:
             # Sets label
-            self.__write_correct_answer_label.configure(text = f"Try again! ({self.__correct_answer})")
+            self.__write_view.result_label.configure(text = f"Try again! ({self.__correct_answer})")
             # Clears entry
-            self.__write_answer_entry.delete("0.0", END)
+            entry.delete("0.0", END)
 
-    def words_match(self, answ, ques):
+    def words_match(self, answ, index):
         """
         Does the answer matches the question.
 
         :param answ: string, your answer
-        :param ques: string, the correct answer
-        :return bool, is the answer correct
-        """
-        # Cleans the word
-        answ = self.clean_word(answ)
-        # A list of the possibly acceptable answers
-        acceptable_answers = [ques]
-        # IF trim punctuations
-        if self.__settings["trim_punctuation"] == "everywhere":
-            # Translation table
-            translation_table = str.maketrans('', '', ''.join(
-                self.__settings["trim_punctuation_characters"]))
-            # Adds the another poissible answer
-            acceptable_answers.append(ques.translate(translation_table))
-        elif self.__settings["trim_punctuation"] == "end":
-            # The word
-            trimmed_word = ques
-            # Until all the unnecesary characers are removed from the end
-            while len(trimmed_word) > 1 and trimmed_word[-1] in self.__settings["trim_punctuation_characters"] + [" "]:
-                # Removes the last character
-                trimmed_word = trimmed_word[:-1]
-            # Adds the another poissible answer
-            acceptable_answers.append(trimmed_word)
-        if self.__settings["optional_answer_in_parentheses"]:
-            acceptable_answers += [self.remove_nested_parentheses(x) for x in acceptable_answers]
-            acceptable_answers += [x.replace("(", "").replace(")", "") for x in acceptable_answers]
-        # Adds the cleaned verstions of the acceptable answers
-        acceptable_answers += [self.clean_word(x) for x in acceptable_answers]
-        # Is the answer correct
-        return answ in acceptable_answers
+        :param index: int, the index of the asked term
+        :return string or None, EXACT, NEAR_MISS (an answer with typos)
+            or None if the answer is wrong
+        """
+        # The acceptable answers are compiled when the settings are saved
+        with self.__instrumentation.stage("normalize answer"):
+            return self.__answer_matcher.check(index, answ)
+
+    def compile_answer_matcher(self):
+        """
+        Compiles the acceptable answers of the answer language.
+            It is only done again if the word list or the
+            settings of the answers changed.
+        """
+        key = (self.__word_list_version, *AnswerMatcher.settings_key(self.__settings))
+        if key != self.__answer_matcher_key:
+            self.__answer_matcher = AnswerMatcher.from_settings(
+                self.__word_list[self.__settings["answ_lang"]], self.__settings)
+            self.__answer_matcher_key = key
 
     def clean_word(self, word):
         """
@@ -1163,50 +1486,57 @@ class GUI:
         :param word: string, the input to be cleaned
         :return string, the cleaned string
         """
-        # Clears the extra whitespace characters from the string
-        word = re.sub('\s{2,}', ' ', word)
-        # Removes the extras spaces from the begining and end
-        word = word.strip()
-        # If the answers are not case sensitive
-        if not self.__settings["case_sensitive_answers"]:
-            # Changes the word to lowercase
-            word = word.lower()
-        # The cleaned word
-        return word
-
-    def remove_nested_parentheses(self, input_string):
-        # Define a regular expression pattern to match the innermost parentheses and their contents
-        pattern = r'\([^()]*\)'
-        
-        # Repeatedly find and remove the innermost parentheses until none are left
-        while re.search(pattern, input_string):
-            input_string = re.sub(pattern, '', input_string)
-        
-        return input_string
+        return clean_word(word, self.__settings["case_sensitive_answers"])
 
     def save_statistics(self):
-        with open(self.__settings["statistics_file"], mode="a", encoding='utf-8') as my_file:
-            content = []
-            content.append(datetime.now())
-            content.append(time.time() - self.__practice_time)
-            content.append(self.__settings['wordlist_file'])
-            content.append(self.__mode)
-            #content.append(self.__settings["ques_lang"])
-            content.append(self.__settings["ques_langs"])
-            content.append(self.__settings["answ_lang"])
-            try:
-                acc = self.__number_of_correct_answers / (self.__number_of_correct_answers+self.__number_of_incorrect_answers)
-            except:
-                acc = 0
-            content.append(acc)
-            my_file.write(";".join(str(x) for x in content) + "\n")
+        """
+        Saves the statistics of the session into the database.
+        """
+        # The statistics file could not be opened, or more word lists
+        #     of the library were practiced together
+        if not self.__statistics or not self.__settings["wordlist_file"]:
+            return
+        try:
+            self.__statistics.add_session(
+                datetime.now(), time.time() - self.__practice_time,
+                self.__settings['wordlist_file'], self.__mode,
+                self.__settings["ques_langs"], self.__settings["answ_lang"],
+                self.__engine.accuracy)
+        except sqlite3.Error as e:
+            print("The statistics cannot be saved!", e)
+            return
+        # The running totals are updated
+        self.update_progress()
+
+    def practice_summary(self):
+        """
+        The practice time of today and of all the sessions
+            from the running totals of the statistics.
+
+        :return list of strings, the lines of the summary
+        """
+        today_practice = self.__statistics.practice_time(datetime.now().date()) / 3600
+        all_practice = self.__statistics.practice_time() / 3600
+        lines = [f"Today you have practiced {today_practice*60:.0f} minutes.",
+                 f"All practice: {all_practice:.1f}/{TARGET_PRACTICE} hours."]
+        if today_practice > 0:
+            d = (TARGET_PRACTICE - all_practice) / today_practice
+            lines.append(f"At this rate it will take {d:.0f} days to learn the language.")
+        return lines
+
+    def update_progress(self):
+        """
+        Shows the practice summary on the settings tab.
+        """
+        if self.__statistics:
+            self.__progress_label.configure(text = "\n".join(self.practice_summary()))
+        else:
+            self.__progress_label.configure(text = "")
 
     def learn_mode_end(self):
         """
         The end of the lear mode, statistics message.
         """
-        # Resets the ansked question indecies
-        self.__question_indices = list(range(self.__number_of_words))
         # Clears the unnecessary widgets
         self.clear_buttons()
         # Shows all the tabs
@@ -1218,24 +1548,22 @@ class GUI:
         # Resets the time
         self.__practice_time = -1
         # The number of correct answers
-        cor_n = self.__number_of_correct_answers
+        cor_n = self.__engine.number_of_correct_answers
         # The number of incorrect answers
-        incor_n = self.__number_of_incorrect_answers
+        incor_n = self.__engine.number_of_incorrect_answers
         # The statistics lable
         self.__congrat_label = ttk.Label(
             self.__parent_tab, text =f"You have learnt all the phrases!\n"
                                     f"Your accuracy in this round was: "
                                     f"{cor_n}/{cor_n+incor_n}"
-                                    f"={cor_n / (cor_n + incor_n) * 100:.0f}%.\n"
+                                    f"={self.__engine.accuracy * 100:.0f}%.\n"
                                     f"You have practiced for "
                                     f"{practice_time / 60:.0f} minutes.",
                                     font = FONTS["p"])
         # Puts the label onto the window
         self.__congrat_label.grid(column = 0, row = 1)
-        # Resets the number of correct answers
-        self.__number_of_correct_answers = 0
-        # Resets the number of correct answers
-        self.__number_of_incorrect_answers = 0
+        # Resets the ansked question indecies and the counters
+        self.reset_session()
         if self.__mode == "flashcards":
             # Restart button
             self.__flashcards_start_button = ttk.Button(
@@ -1255,18 +1583,58 @@ class GUI:
         # Binds the return key
         self.__main_window.bind('<Return>', self.start_timer)
 
+    def new_question(self):
+        """
+        Starts measuring the answer time of the shown question.
+        """
+        self.__question_time = time.perf_counter()
+        self.__attempts = 0
+
+    def log_answer(self, event, correct):
+        """
+        Queues an answer event, it is written in the background.
+
+        :param event: string, "attempt" a checked answer in write mode,
+            "result" the final result of the question
+        :param correct: bool or string, was the answer correct,
+            the result of words_match in write mode
+        """
+        if event == "attempt":
+            self.__attempts += 1
+        self.__event_log.log(
+            event, mode = self.__mode, deck = self.__settings["wordlist_file"] or self.__word_list_label,
+            index = self.__current_index,
+            latency = round(time.perf_counter() - self.__question_time, 3),
+            correct = bool(correct), near_miss = correct == NEAR_MISS,
+            attempt = max(self.__attempts, 1))
+
+    def reset_session(self):
+        """
+        Starts a new session, with spaced repetition only the due terms
+            are asked.
+        """
+        if self.__settings["spaced_repetition"]:
+            self.__engine.reset(self.__scheduler.due_indices())
+        else:
+            self.__engine.reset()
+
     def correct_answer(self, event = None):
         """
         When the answer is correct.
 
         :param event: event, the click event, necessary.
         """
-        # Increases the correct answer counter
-        self.__number_of_correct_answers += 1
+        # The answer of this question is not read anymore
+        self.__speech_worker.cancel()
+        # Logs the result of the question
+        self.log_answer("result", True)
+        if self.__settings["spaced_repetition"]:
+            # The term will be asked later
+            self.__scheduler.review(self.__current_index, True)
+        # Removes the answered question
+        self.__engine.answer_correct()
         # Removes the unncecesary widgets
         self.clear_buttons()
-        # Removes the answered question
-        self.__current_question_indecies.remove(self.__current_index)
         if self.__mode == "flashcards":
             # Next question
             self.flashcards_mode_flashcards()
@@ -1280,24 +1648,17 @@ class GUI:
 
         :param event: event, the click event, necessary.
         """
-        # Increases the incorrect answer counter
-        self.__number_of_incorrect_answers += 1
+        # The answer of this question is not read anymore
+        self.__speech_worker.cancel()
+        # Logs the result of the question
+        self.log_answer("result", False)
+        if self.__settings["spaced_repetition"]:
+            # The term will be asked sooner
+            self.__scheduler.review(self.__current_index, False)
+        # The question is asked again later
+        self.__engine.answer_incorrect()
         # Removes the unncecesary widgets
         self.clear_buttons()
-        # When to correct the mistakes
-        if self.__settings["correct_mistakes"] == "round":
-            # If there is more than on remaining question
-            if len(self.__current_question_indecies) > 1:
-                prew_first_elemnt = self.__current_question_indecies[0]
-                # Shuffles the questions so that the next time cannot be the
-                #   same question
-                while self.__current_question_indecies[0] == prew_first_elemnt:
-                    random.shuffle(self.__current_question_indecies)
-        elif self.__settings["correct_mistakes"] == "end":
-            # Removes the answered question
-            self.__current_question_indecies.remove(self.__current_index)
-            # Adds the question to the mistakes list
-            self.__mistake_indecies.append(self.__current_index)
 
         if self.__mode == "flashcards":
             # Next question
@@ -1311,10 +1672,11 @@ class GUI:
         Deletes the widgets which correspont to a list:
             tree, scrollbar, header
         """
-        # Goes through all the widgets
-        for i in range(3):
-            # Delete the widget
-            self.delete_widget(self.__list[i])
+        table, label = self.__list
+        # Hides the table, it is reused in the next round
+        table.grid_remove()
+        if label:
+            label.grid_remove()
         # Clears all the other widget
         self.clear_buttons()
 
@@ -1322,48 +1684,34 @@ class GUI:
         """
         Cleas all the unncesary widgets from the window.
         """
-        if self.__mode == "flashcards":
-            # The flashcards mode is not active
-            self.__flashcards_keyboard_active = False
-            # Flashcard
-            self.delete_widget(self.__flashcard_button)
-            # Correct btn
-            self.delete_widget(self.__flashcards_correct_button)
-            # Incorrect btn
-            self.delete_widget(self.__flashcards_incorrect_button)
-            # Start btn 2
-            self.delete_widget(self.__flashcards_start_button2)
-            # Start btn
-            self.delete_widget(self.__flashcards_start_button)
-            # Unbinds the return key
-            self.unbind_event('<Return>', self.flashcards_mode_flashcards)
-        elif self.__mode == "write":
-            # Unbinds the return key
-            self.unbind_event('<Return>', self.write_check_anwer)
-            # Unbinds the return key
-            self.unbind_event('<Return>', self.write_mode_write)
-            # Start btn 2
-            self.delete_widget(self.__write_start_button2)
-            # Start btn
-            self.delete_widget(self.__write_start_button)
-            # Question label
-            self.delete_widget(self.__write_question_label)
-            # Answer entry
-            self.delete_widget(self.__write_answer_entry)
-            # Check btn
-            self.delete_widget(self.__write_check_button)
-            # Scrollbar
-            self.delete_widget(self.__write_answer_entry_scrollbar)
-            # Answer label
-            self.delete_widget(self.__write_correct_answer_label)
-            # Next btn
-            self.delete_widget(self.__write_next_button)
-            #self.__write_answer_entry.tag_add("INCORRECT", "1.0", "end")
-            #self.__write_answer_entry.tag_remove("INCORRECT", "1.0", "end")
-        # Unbinds return key
-        self.unbind_event('<Return>', self.start_timer)
-        # Statistics label
-        self.delete_widget(self.__congrat_label)
+        # Measures the teardown of the widgets
+        with self.__instrumentation.stage("teardown"):
+            if self.__mode == "flashcards":
+                # The flashcards mode is not active
+                self.__flashcards_keyboard_active = False
+                # Flashcard and the buttons, they are only hidden
+                self.__flashcards_view.hide()
+                # Start btn 2
+                self.delete_widget(self.__flashcards_start_button2)
+                # Start btn
+                self.delete_widget(self.__flashcards_start_button)
+                # Unbinds the return key
+                self.unbind_event('<Return>', self.flashcards_mode_flashcards)
+            elif self.__mode == "write":
+                # Unbinds the return key
+                self.unbind_event('<Return>', self.write_check_anwer)
+                # Unbinds the return key
+                self.unbind_event('<Return>', self.write_mode_write)
+                # Start btn 2
+                self.delete_widget(self.__write_start_button2)
+                # Start btn
+                self.delete_widget(self.__write_start_button)
+                # Question, answer entry and result, they are only hidden
+                self.__write_view.hide()
+            # Unbinds return key
+            self.unbind_event('<Return>', self.start_timer)
+            # Statistics label
+            self.delete_widget(self.__congrat_label)
 
     def delete_widget(self, widget):
         """
@@ -1402,40 +1750,40 @@ class GUI:
 
     def print_word_list(self, headers, indecies, parent, row = 3, header_text = "In this round you will practice these phrases:", columnspan = 1):
         """
-        Returnes a wordlist to be printed.
+        Shows a wordlist. The table of a parent widget is created
+            once and reused, it only creates the visible rows.
 
         :param headers: list of strings, which languages to print
         :param indecies: list of ints, which word indecies to print
         :param parent: tkinter widget, to whitch widget should it print
         :param row: int=3, in which row in the grid should it print the table
         :param header_text: string, the header of the table
-        :return tuple of 3 tkinter widgets,
-            the tree (the table), scrollbar, and the header label
+        :param columnspan: int=1, how many columns the table spans
+        :return tuple of (VirtualTable, ttk.Label or None),
+            the table and the header label
         """
         # The label
         label = None
         if header_text:
-            # Header label
-            label = ttk.Label(parent, text = header_text, font = FONTS["p"])
+            # Header label, reused
+            label = self.__table_labels.get(str(parent))
+            if label is None:
+                label = ttk.Label(parent, font = FONTS["p"])
+                self.__table_labels[str(parent)] = label
+            label.configure(text = header_text)
             # Puts the header onto the grid
             label.grid(column = 0, row = row)
-        # Gets the list
-        tree, scrollbar = self.get_list(headers, indecies, parent)
-        
-        # Create a new style for the Treeview with larger font
-        style = ttk.Style()
-        style.configure("Custom.Treeview", font=FONTS["table"], rowheight=30)  # bigger font for rows
-        style.configure("Custom.Treeview.Heading", font=FONTS["table_header"])  # bigger font for headings
-        tree.configure(style="Custom.Treeview")
-
-        # Puts the tree onto the window
-        tree.grid(row =row + 1, column = 0, sticky = 'nsew', columnspan=columnspan)
-        # Puts the scrollbar onto the window
-        scrollbar.grid(row = row + 1, column = 1, sticky = 'nse')
-        # Sets the rowheight to expand
-        parent.rowconfigure(row + 1, weight = 1)
+        # The table of the parent, reused
+        table = self.__tables.get(str(parent))
+        if table is None:
+            table = VirtualTable(parent, FONTS["table"], FONTS["table_header"])
+            self.__tables[str(parent)] = table
+        # Only the visible rows are created
+        table.show(headers, WordListRows(self.__word_list, headers, indecies))
+        # Puts the table onto the window
+        table.grid(row + 1, columnspan)
         # Returns the widgets
-        return tree, scrollbar, label
+        return table, label
 
     def flashcard_button(self):
         """
@@ -1449,7 +1797,7 @@ class GUI:
             ])
         else:
             text = self.__word_list[self.__settings["answ_lang"]][self.__current_index]
-        self.__flashcard_button.configure(text = text)
+        self.__flashcards_view.set_text(text)
         """# If it currently shows the question in the question language
         if self.__flashcard_shown_language == self.__settings["ques_lang"]:
             # It sets to show in the answer language
@@ -1465,6 +1813,20 @@ class GUI:
         """
         Quit from the GUI.
         """
+        # Stops the background speech
+        self.__speech_worker.stop()
+        self.__speech_prefetcher.shutdown()
+        # Saves the order of usage of the audio files
+        self.__audio_cache.close()
+        # Closes the database of the spaced repetition
+        self.__scheduler.close()
+        # Writes the remaining answer events
+        self.__event_log.close()
+        # Stops the translation
+        self.cancel_translation()
+        # Closes the cache of the translations
+        if self.__translation_cache:
+            self.__translation_cache.close()
         # Closes the window
         self.__main_window.destroy()
 
@@ -1472,10 +1834,24 @@ class GUI:
         # Clears the error messate
         self.set_message()
         # The allowed file types
-        file_types = (('tabular files', '*.csv'), ('text files', '*.txt'))
+        file_types = (('statistics databases', '*.sqlite3'),
+                      ('tabular files', '*.csv'), ('text files', '*.txt'))
         # The file dialog
         my_file_name = filedialog.askopenfilename(filetypes = file_types)
+        # If no file was chosen
+        if not my_file_name:
+            return
+        try:
+            # A CSV file is imported into a database
+            statistics = open_statistics(my_file_name)
+        except (OSError, UnicodeDecodeError, sqlite3.Error, StatisticsError) as e:
+            self.set_message("error", f"The statistics file cannot be opened! {e}")
+            return
+        if self.__statistics:
+            self.__statistics.close()
+        self.__statistics = statistics
         self.__settings["statistics_file"] = my_file_name
+        self.update_progress()
         self.__statistics_file_label.configure(text=f"Current file: {self.__settings['statistics_file']}")
 
     def open_file(self):
@@ -1492,88 +1868,215 @@ class GUI:
         # The file dialog
         my_file_name = filedialog.askopenfilename(filetypes = file_types)
         self.__settings["wordlist_file"] = my_file_name
+        # The separator character
+        separator_char = self.__settings["separator"]
+        # If it can get the sep. char. from the GUI
+        if self.__separator.get() != "":
+            # It gets the separator character
+            separator_char = self.__separator.get()
         try:
-            # Opens the file, using UTF-8 encoding
-            with open(my_file_name, "r", encoding= "utf8") as my_file:
-                # The separator character
-                separator_char = self.__settings["separator"]
-                # If it can get the sep. char. from the GUI
-                if self.__separator.get() != "":
-                    # It gets the separator character
-                    separator_char = self.__separator.get()
-                # Stores the lines and removes the new line characters
-                lines = [x.strip() for x in my_file.readlines() if x.strip() != ""]
-                # If the file is empty
-                if len(lines) == 0:
-                    # Shows the error message
-                    self.set_message(
-                        "error", "The file must have a header row! Try another file!")
-                    return
-                # If there are no words in the file
-                elif len(lines) == 1:
-                    # Shows the error message
-                    self.set_message(
-                        "error", "There must be phrases in the file! Try another file!")
-                    return
-                
-                # The zeroth line contains the languages
-                self.__languages = lines[0].split(separator_char)
-                # Cheks if one language is in the header multiple times
-                if sorted(list(set(self.__languages))) != sorted(self.__languages):
-                    # Shows the error message
-                    self.set_message(
-                        "error", "The same language cannot be twice in the file header! Try another file!")
-                    return
-                # Add the languages to the word list dictionary
-                for lang in self.__languages:
-                    self.__word_list[lang] = []
-
-                # Adds the words to the word list
-                for line in lines[1:]:
-                    # Splits the line
-                    word_line = line.split(separator_char)
-                    # If the line has correct number of phrases
-                    if len(self.__languages) == len(word_line):
-                        # Go through the line
-                        for i in range(len(word_line)):
-                            # Adds the word to the wordlist dict
-                            self.__word_list[self.__languages[i]].append(word_line[i])
-                    else:
-                        # Shows the error message
-                        self.set_message("error", 
-                                         f"Error in reading the file: in line "
-                                         f"'{line}' the number of "
-                                         f"terms is incorrect. Try another file!")
-                        self.__word_list = {}
-                        return
-            self.setings_after_new_word_list()        
-
+            # Reads the compiled file, or parses the file if it changed
+            languages, word_list, duplicates = open_word_list(my_file_name, separator_char)
         except FileNotFoundError:
             # Shows the error message
             self.set_message(
                 "error", "The file was not found! Try another file!")
             return
-        except:
+        except WordListError as e:
+            # Shows the error message
+            self.set_message("error", f"{e} Try another file!")
+            return
+        except (OSError, UnicodeDecodeError):
             # Shows the error message
             self.set_message(
                 "error", f"There was an error in the file opening! Try another file!")
             return
+        # The previous word list is only replaced if the file is correct
+        self.set_word_list(languages, word_list, duplicates, separator_char,
+                           os.path.basename(my_file_name))
 
-    def setings_after_new_word_list(self):
+    def set_word_list(self, languages, word_list, duplicates, separator, label):
+        """
+        Replaces the word list with a successfully read one.
+
+        :param languages: list of strings, the header of the file
+        :param word_list: dict, the terms of the languages
+        :param duplicates: dict or None, the duplicate report
+        :param separator: string, the separator of the file
+        :param label: string, the name of the word list in the title
+        """
+        self.__languages = languages
+        self.__word_list = word_list
+        self.__file_languages = list(languages)
+        self.__file_separator = separator
+        self.__word_list_label = label
+        self.__main_window.title(f"Language Learning App - {label}")
+        self.setings_after_new_word_list(duplicates)
+
+    def open_library(self):
+        """
+        Opens the window of the word list library, the library
+            is indexed in the background.
+        """
+        if self.__library_window:
+            self.__library_window.lift()
+            return
+        if self.__library is None:
+            separator = self.__separator.get() or self.__settings["separator"]
+            self.__library = Library(separator = separator)
+        window = self.__library_window = Toplevel(self.__main_window)
+        window.title("Library")
+        window.protocol("WM_DELETE_WINDOW", self.close_library)
+        # Search entry
+        ttk.Label(window, text = "Search:", font = FONTS["p"]).grid(column = 0, row = 0)
+        self.__library_search = StringVar()
+        self.__library_search.trace_add("write", lambda *args: self.search_library())
+        ttk.Entry(window, textvariable = self.__library_search).grid(
+            column = 1, row = 0, sticky = "ew")
+        # The found terms, a click selects their word list
+        self.__library_results = Listbox(window, height = 8, font = FONTS["help"])
+        self.__library_results.grid(column = 0, row = 1, columnspan = 2, sticky = "nsew")
+        self.__library_results.bind("<<ListboxSelect>>", self.select_library_result)
+        # The word lists, more can be selected
+        self.__library_list = Listbox(window, height = 15, selectmode = "extended",
+                                      font = FONTS["help"], exportselection = False)
+        self.__library_list.grid(column = 0, row = 2, columnspan = 2, sticky = "nsew")
+        # Status label
+        self.__library_status = ttk.Label(window, text = "Indexing the word lists...",
+                                          font = FONTS["help"])
+        self.__library_status.grid(column = 0, row = 3, columnspan = 2)
+        # Open button
+        ttk.Button(window, text = "Open selected", command = self.open_library_selection).grid(
+            column = 0, row = 4, columnspan = 2, pady = 10)
+        window.columnconfigure(1, weight = 1)
+        window.rowconfigure(2, weight = 1)
+        self.__library_search_results = []
+        # Only the changed files are read again, an indexing
+        #     which is still running is not started twice
+        if self.__library_update is None or not self.__library_update.is_alive():
+            self.__library_error = None
+            self.__library_update = threading.Thread(
+                target = self.update_library, name = "library", daemon = True)
+            self.__library_update.start()
+        self.check_library_update()
+
+    def update_library(self):
+        """
+        Indexes the library, runs in a background thread.
+        """
+        try:
+            self.__library.update()
+        except (OSError, sqlite3.Error) as e:
+            self.__library_error = e
+
+    def check_library_update(self):
+        """
+        Shows the word lists when the indexing is finished,
+            it reschedules itself until then.
+        """
+        if not self.__library_window:
+            return
+        if self.__library_update.is_alive():
+            self.__main_window.after(LIBRARY_POLL_INTERVAL, self.check_library_update)
+            return
+        self.__library_decks = self.__library.decks()
+        self.__library_list.delete(0, END)
+        for deck in self.__library_decks:
+            self.__library_list.insert(
+                END, f"{deck['path']} ({deck['rows']}: {', '.join(deck['languages'])})")
+        if self.__library_error:
+            self.__library_status.configure(
+                text = f"The indexing failed: {self.__library_error}")
+        else:
+            self.__library_status.configure(text = f"{len(self.__library_decks)} word lists")
+        self.search_library()
+
+    def search_library(self):
+        """
+        Shows the terms which start with the searched text.
+        """
+        if self.__library_update.is_alive():
+            return
+        self.__library_search_results = self.__library.search(
+            self.__library_search.get(), prefix = True)
+        self.__library_results.delete(0, END)
+        for path, lang, row, term in self.__library_search_results:
+            self.__library_results.insert(END, f"{term} - {lang} - {path}:{row + 1}")
+
+    def select_library_result(self, event = None):
+        """
+        Selects the word list of the clicked search result.
+
+        :param event: event, the select event, necessary.
+        """
+        selection = self.__library_results.curselection()
+        if not selection:
+            return
+        path = self.__library_search_results[selection[0]][0]
+        for i, deck in enumerate(self.__library_decks):
+            if deck["path"] == path:
+                self.__library_list.selection_set(i)
+                self.__library_list.see(i)
+
+    def open_library_selection(self):
+        """
+        Opens the selected word lists, more word lists are
+            opened as one word list with their common languages.
+        """
+        paths = [self.__library_decks[i]["path"] for i in self.__library_list.curselection()]
+        if not paths:
+            self.__library_status.configure(text = "Select a word list!")
+            return
+        try:
+            if len(paths) == 1:
+                file_name = os.path.join(self.__library.root, paths[0])
+                languages, word_list, duplicates = open_word_list(
+                    file_name, self.__library.separator)
+            else:
+                # Not a file, so the session is not scheduled
+                #     and not saved in the statistics
+                file_name = ""
+                languages, word_list = self.__library.load_union(paths)
+                duplicates = None
+        except (OSError, UnicodeDecodeError, csv.Error, WordListError) as e:
+            self.__library_status.configure(text = f"{e}")
+            return
+        self.set_message()
+        self.__settings["wordlist_file"] = file_name
+        self.set_word_list(languages, word_list, duplicates, self.__library.separator,
+                           " + ".join(paths))
+        self.close_library()
+
+    def close_library(self):
+        """
+        Closes the library window, the index is kept.
+        """
+        if self.__library_window:
+            self.__library_window.destroy()
+            self.__library_window = None
+
+    def setings_after_new_word_list(self, duplicates = None):
+        """
+        Updates the settings and the tabs after a new word list is read.
+
+        :param duplicates: dict, the duplicate terms of the languages,
+            if None they are searched
+        """
         self.__tabs.tab(1, state = "disabled")
         self.__tabs.tab(2, state = "disabled")
         self.__tabs.tab(3, state = "disabled")
         self.__tabs.tab(4, state = "disabled")
+        # The compiled data of the previous word list is outdated
+        self.__word_list_version += 1
         # Number of words
         self.__number_of_words = len(self.__word_list[self.__languages[0]])
         # Shows the info message
         self.set_message(
             "info", f"{self.__number_of_words} terms have succesfully read from the file.")
-        warning_texts = []
-        for lang in self.__word_list:
-            duplicates = self.find_duplicates(self.__word_list[lang])
-            if duplicates:
-                warning_texts += [f"{lang}: {duplicates}"]
+        if duplicates is None:
+            duplicates = duplicate_report(self.__word_list)
+        self.__duplicates = duplicates
+        warning_texts = [f"{lang}: {duplicates[lang]}" for lang in duplicates]
         if len(warning_texts) != 0:
             self.set_message(
                 "warning", f"There are duplicates in the file: {', '.join(warning_texts)}")
@@ -1593,26 +2096,11 @@ class GUI:
             self.__languages[0], *self.__languages)
         self.__translate_btn.set_menu(
             self.__languages[0], *self.__languages)
-        # Sets the question indecies
-        self.__question_indices = list(range(self.__number_of_words))
+        # The text to speech codes of the languages
+        self.__tts_languages = resolve_tts_languages(self.__languages, self.__tts_langs)
         # Updates the list tab
         self.update_list_tab()
 
-    def find_duplicates(self, strings):
-        seen = set()
-        duplicates = set()
-
-        for string in strings:
-            if string in seen:
-                duplicates.add(string)
-            else:
-                seen.add(string)
-
-        if duplicates:
-            return list(duplicates)
-        else:
-            return None
-
     def set_message(self, msg_type= "", text = ""):
         """
         Sets the content of the error and the info label.
@@ -1734,9 +2222,27 @@ class GUI:
         self.__settings["trim_punctuation_characters"] = list(self.__trim_characters.get())
         self.__settings["trim_punctuation"] = self.__trim_position_clicled.get()
         self.__settings["optional_answer_in_parentheses"] = True if self.__optional_answers_clicled.get() == "True" else False
+        self.__settings["near_miss_answers"] = True if self.__near_miss_clicled.get() == "True" else False
+        self.__settings["spaced_repetition"] = True if self.__spaced_repetition_clicled.get() == "True" else False
+        if self.__settings["spaced_repetition"] and not self.__settings["wordlist_file"]:
+            # The reviews are stored by the file of the word list
+            self.__settings["spaced_repetition"] = False
+            self.__spaced_repetition_clicled.set("False")
+            self.set_message("warning", "The spaced repetition needs a single word list file!")
         self.__settings["speak_enabled"] = True if self.__speak_enabled_clicled.get() == "True" else False
         self.__settings["volume"] = self.__volume.get() / 100
-        
+        # Compiles the acceptable answers
+        self.compile_answer_matcher()
+        # A new session with the saved settings
+        self.__engine = SessionEngine.from_settings(self.__number_of_words, self.__settings)
+        if self.__settings["spaced_repetition"]:
+            # The terms of the word list are scheduled
+            direction, terms = deck_terms(self.__word_list,
+                self.__settings["ques_langs"], self.__settings["answ_lang"])
+            self.__scheduler.open_deck(self.__settings["wordlist_file"], direction, terms)
+            # Only the due terms are asked
+            self.reset_session()
+
         # Shows all tabs
         self.enable_all_tabs()
 
@@ -1752,7 +2258,7 @@ class GUI:
         self.__tabs.tab(2, state = "normal")
         # Write tab enabled
         self.__tabs.tab(3, state = "normal")
-        if TRANSLATE_AVAILABELE:
+        if self.__background_imports.status("translate") == "ready":
             # Translate tab enabled
             self.__tabs.tab(4, state = "normal")
         else:
@@ -1799,6 +2305,12 @@ class GUI:
         # Optional answers
         self.__optional_answers_clicled.set(
             "True" if self.__settings["optional_answer_in_parentheses"] else "False")
+        # Near miss answers
+        self.__near_miss_clicled.set(
+            "True" if self.__settings["near_miss_answers"] else "False")
+        # Spaced repetition
+        self.__spaced_repetition_clicled.set(
+            "True" if self.__settings["spaced_repetition"] else "False")
         # Speak enabled
         self.__speak_enabled_clicled.set(
             "True" if self.__settings["speak_enabled"] else "False")
@@ -1822,63 +2334,48 @@ class GUI:
         self.__translate_tab.columnconfigure(0, weight = 1)
         self.__translate_tab.columnconfigure(1, weight = 1)
 
-    def get_list(self, headers, indecies, parent):
-        """
-        Returnes the components of a wordlist.
-
-        :param headers: list of strings, which languages to print
-        :param indecies: list of ints, which word indecies to print
-        :param parent: tkinter widget, to whitch widget should it print
-        :return tuple of 2 tkinter widgets,
-            the tree (the table), scrollbar
-        """
-        # Columns
-        columns = tuple(headers)
-        # Table
-        tree = ttk.Treeview(parent, columns = columns, show = 'headings')
-        # Sets the headers
-        for lang in columns:
-            tree.heading(lang, text = lang)
-        # Sets the content of the rows
-        for i in indecies:
-            # Content of a row
-            content = tuple([self.__word_list[lang][i] for lang in columns])
-            # Adds the content
-            tree.insert('', END, values = content)
-        # Adds a scrollbar
-        scrollbar = ttk.Scrollbar(parent, orient=VERTICAL, command = tree.yview)
-        # Sets a scrollbar
-        tree.configure(yscroll = scrollbar.set)
-        # Returns the widgets
-        return tree, scrollbar
-
     def __del__(self):
+        # Writes the remaining answer events
+        self.__event_log.close()
+        # The window may be closed without the Quit button
+        self.__audio_cache.close()
+        # Writes the pending reviews
+        self.__scheduler.close()
+        if self.__translation_cache:
+            self.__translation_cache.close()
+        # Saves the timings
+        if self.__trace_out:
+            try:
+                self.__instrumentation.dump(self.__trace_out)
+            except OSError as e:
+                print("The trace cannot be saved!", e)
         if self.__practice_time != -1:
             self.save_statistics()
         try:
-            data = pd.read_csv(self.__settings["statistics_file"], sep=";")
-            # Get today's date
-            today_date = datetime.now().date()
-            # Converts the column to datatime type
-            data['Date'] = pd.to_datetime(data['Date'])
-            # Filter rows based on today's date
-            today_rows = data[data['Date'].dt.date == today_date]
-
-            today_practice = np.sum(today_rows["Time"]) / 3600
-            all_practice = np.sum(data["Time"]) / 3600
-
-            d = (TARGET_PRACTICE - all_practice) / today_practice
-
-            print(f"Today you have practiced {today_practice*60:.0f} minutes.")
-            print(f"All practice: {all_practice:.1f}/{TARGET_PRACTICE} hours.")
-            print(f"At this rate it will take {d:.0f} days to learn the language.")
+            # The running totals of the statistics
+            if self.__statistics:
+                for line in self.practice_summary():
+                    print(line)
+                self.__statistics.close()
         except Exception as e:
             print("The statistics file cannot be opened!", e)
         print("bye")
 
-def main():
+def main(args = None):
+    """
+    :param args: argparse.Namespace or None, the options,
+        parsed from the command line if None
+    """
+    if args is None:
+        args = parse_arguments()
+    if args.headless:
+        # No window is created
+        sys.exit(run_headless(args))
+    # Measures the startup
+    profiler = StartupProfiler(args.profile_startup, STARTUP_TIME)
+    profiler.record("main.py imports", STARTUP_TIME, MODULES_IMPORTED - STARTUP_TIME)
     # Creates the GUI
-    app = GUI()
+    app = GUI(profiler, Instrumentation(), args.trace_out)
 
 if __name__ == "__main__":
-    main()
+    main(ARGUMENTS)
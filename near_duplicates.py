@@ -0,0 +1,272 @@
+"""
+Finds the terms which are the same or almost the same in different word lists.
+
+The terms of all the word lists are taken from the library index
+(library.py). Every distinct term of a language is described by the set of
+its character 3-grams, and the similarity of two terms is the Jaccard
+similarity of their sets. Comparing all the pairs would take quadratic
+time, so the candidate pairs are found with locality sensitive hashing:
+    - a MinHash signature of every term is computed with one permutation
+      hashing: a single hash of every 3-gram, the hash range is divided into
+      bins and the minimum of every bin is kept, the empty bins are filled
+      from the next nonempty bin (densification)
+    - the signature is cut into bands, the terms with an equal band
+      are candidates, only they are compared exactly (in a very large
+      bucket only the alphabetical neighbours)
+    - the similar terms are joined into clusters with union-find
+So the time is roughly linear in the number of terms.
+
+Only the clusters of different forms are reported, with --exact also
+the terms which are exactly the same in several word lists.
+
+Usage:
+    python near_duplicates.py [--root word_lists] [--threshold 0.7]
+        [--min-decks 2] [--exact] [--limit 50] [--json FILE|-]
+"""
+import argparse
+import json
+import sys
+import zlib
+from collections import defaultdict
+
+from library import DEFAULT_DATABASE, DEFAULT_ROOT, Library
+
+# The length of the character shingles
+SHINGLE_LENGTH = 3
+# The number of bins of the signature
+SIGNATURE_LENGTH = 32
+# The number of the signature values in a band,
+#     SIGNATURE_LENGTH // BAND_ROWS bands
+BAND_ROWS = 4
+# The minimum Jaccard similarity of the near duplicates
+DEFAULT_THRESHOLD = 0.7
+# The number of the 32-bit hashes, the hashes are divided into
+#     SIGNATURE_LENGTH bins of BIN_WIDTH
+HASH_RANGE = 1 << 32
+BIN_WIDTH = HASH_RANGE // SIGNATURE_LENGTH + 1
+# Every term of a bucket is compared with this many terms before it,
+#     so a bucket of very common 3-grams does not take quadratic time
+BUCKET_WINDOW = 64
+
+
+def shingles(term):
+    """
+    :param term: string, a normalized term
+    :return set of strings, the character n-grams, the term is padded
+        with spaces so the beginning and the end count too
+    """
+    padded = f" {term} "
+    return {padded[i:i + SHINGLE_LENGTH] for i in range(max(1, len(padded) - SHINGLE_LENGTH + 1))}
+
+
+def signature(hashes):
+    """
+    :param hashes: iterable of ints, the 32-bit hashes of the shingles of a term
+    :return tuple of ints, the one permutation MinHash signature
+    """
+    bins = [HASH_RANGE] * SIGNATURE_LENGTH
+    for value in hashes:
+        index = value // BIN_WIDTH
+        if value < bins[index]:
+            bins[index] = value
+    # An empty bin gets the value of the next nonempty bin (circularly)
+    #     with an offset by the distance, so equal sets still have equal
+    #     signatures. The bins are walked backwards twice around.
+    filled = list(bins)
+    nearest = None
+    distance = 0
+    for i in range(2 * SIGNATURE_LENGTH - 1, -1, -1):
+        distance += 1
+        index = i % SIGNATURE_LENGTH
+        if bins[index] < HASH_RANGE:
+            nearest = bins[index]
+            distance = 0
+        elif nearest is not None:
+            filled[index] = nearest + distance * HASH_RANGE
+    return tuple(filled)
+
+
+def jaccard(first, second):
+    """
+    :param first: set
+    :param second: set
+    :return float, the Jaccard similarity of the sets
+    """
+    return len(first & second) / len(first | second)
+
+
+class UnionFind:
+    """
+    Disjoint sets of integers 0...n-1.
+    """
+
+    def __init__(self, size):
+        """
+        :param size: int, the number of the elements
+        """
+        self.__parents = list(range(size))
+
+    def find(self, element):
+        """
+        :param element: int
+        :return int, the representative of its set
+        """
+        parents = self.__parents
+        root = element
+        while parents[root] != root:
+            root = parents[root]
+        # Path compression
+        while parents[element] != root:
+            parents[element], element = root, parents[element]
+        return root
+
+    def union(self, first, second):
+        """
+        Joins the sets of two elements.
+
+        :param first: int
+        :param second: int
+        """
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.__parents[max(first, second)] = min(first, second)
+
+
+def find_clusters(terms, threshold=DEFAULT_THRESHOLD):
+    """
+    Groups the distinct terms of one language into near duplicate clusters.
+
+    :param terms: list of strings, distinct normalized terms
+    :param threshold: float, the minimum Jaccard similarity of two terms
+    :return list of lists of ints, the indices of the terms
+        in the clusters which have more than one term
+    """
+    term_shingles = [shingles(term) for term in terms]
+    sizes = [len(shingle_set) for shingle_set in term_shingles]
+    # The hashes of the distinct shingles
+    shingle_hashes = {}
+    union_find = UnionFind(len(terms))
+    buckets = defaultdict(list)
+    for index, shingle_set in enumerate(term_shingles):
+        hashes = []
+        for shingle in shingle_set:
+            value = shingle_hashes.get(shingle)
+            if value is None:
+                value = shingle_hashes[shingle] = zlib.crc32(shingle.encode("utf-8"))
+            hashes.append(value)
+        bins = signature(hashes)
+        for band in range(0, SIGNATURE_LENGTH, BAND_ROWS):
+            buckets[(band, bins[band:band + BAND_ROWS])].append(index)
+    for members in buckets.values():
+        # All the pairs of a small bucket are compared, in a large one
+        #     the sorted neighbours, the similar terms are mostly close
+        if len(members) > BUCKET_WINDOW:
+            members.sort(key=terms.__getitem__)
+        for position, index in enumerate(members):
+            shingle_set = term_shingles[index]
+            size = sizes[index]
+            for other in members[max(0, position - BUCKET_WINDOW):position]:
+                # The similarity is at most the ratio of the sizes
+                other_size = sizes[other]
+                if min(size, other_size) < threshold * max(size, other_size):
+                    continue
+                # The pairs which are already in the same cluster are skipped
+                if union_find.find(index) == union_find.find(other):
+                    continue
+                common = len(shingle_set & term_shingles[other])
+                if common >= threshold * (size + other_size - common):
+                    union_find.union(other, index)
+    clusters = defaultdict(list)
+    for index in range(len(terms)):
+        clusters[union_find.find(index)].append(index)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def near_duplicates(occurrences, threshold=DEFAULT_THRESHOLD, min_decks=2, exact=False):
+    """
+    Finds the clusters of the same and the similar terms.
+
+    :param occurrences: list of tuples of (string, string, int, string),
+        the path, the language, the row and the normalized term,
+        see Library.terms
+    :param threshold: float, the minimum Jaccard similarity of two terms
+    :param min_decks: int, only the clusters which are in at least
+        this many word lists are reported
+    :param exact: bool, are the terms without similar terms reported too
+    :return list of dicts, the clusters: language, terms, decks and
+        occurrences (path, row, term), the ones of several terms first,
+        then the ones in the most word lists
+    """
+    # The places of the distinct terms of every language
+    by_language = defaultdict(lambda: defaultdict(list))
+    for path, language, row, term in occurrences:
+        if term:
+            by_language[language.strip().lower()][term].append((path, row, term))
+    clusters = []
+    for language, places in by_language.items():
+        terms = list(places)
+        groups = find_clusters(terms, threshold)
+        if exact:
+            # A term without similar terms is a cluster alone
+            clustered = {index for group in groups for index in group}
+            groups += [[index] for index in range(len(terms)) if index not in clustered]
+        for group in groups:
+            cluster_places = [place for index in group for place in places[terms[index]]]
+            decks = sorted({path for path, _, _ in cluster_places})
+            if len(decks) >= min_decks:
+                clusters.append({
+                    "language": language,
+                    "terms": sorted(terms[index] for index in group),
+                    "decks": decks,
+                    "occurrences": [{"path": path, "row": row, "term": term}
+                                    for path, row, term in cluster_places],
+                })
+    clusters.sort(key=lambda cluster: (len(cluster["terms"]) == 1, -len(cluster["decks"]),
+                                       cluster["language"], cluster["terms"]))
+    return clusters
+
+
+def main(argv=None):
+    """
+    :param argv: list of strings or None, the command line arguments
+    :return int, the exit code
+    """
+    parser = argparse.ArgumentParser(description="Finds near duplicate terms in the word lists.")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="the directory of the word lists")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help="the library index")
+    parser.add_argument("--separator", default=";", help="the separator of the terms")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="the minimum similarity of the 3-grams of two terms")
+    parser.add_argument("--min-decks", type=int, default=2,
+                        help="report the clusters which are in this many word lists")
+    parser.add_argument("--exact", action="store_true",
+                        help="report also the same terms without other forms")
+    parser.add_argument("--limit", type=int, default=50, help="the number of printed clusters")
+    parser.add_argument("--json", metavar="FILE", default=None,
+                        help="write all the clusters as JSON, - for the standard output")
+    args = parser.parse_args(argv)
+    library = Library(args.root, args.database, args.separator)
+    try:
+        # Only the new and the changed word lists are read
+        library.update()
+        occurrences = library.terms()
+    finally:
+        library.close()
+    clusters = near_duplicates(occurrences, args.threshold, args.min_decks, args.exact)
+    if args.json == "-":
+        json.dump(clusters, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+        return 0
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as my_file:
+            json.dump(clusters, my_file, ensure_ascii=False, indent=1)
+    for cluster in clusters[:args.limit]:
+        print(f"[{cluster['language']}] {' | '.join(cluster['terms'])}")
+        print(f"    in {len(cluster['decks'])} word lists: {', '.join(cluster['decks'])}")
+    print(f"{len(clusters)} clusters in at least {args.min_decks} word lists "
+          f"from {len(occurrences)} terms.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
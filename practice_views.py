@@ -0,0 +1,159 @@
+"""
+The widgets of the flashcards and the write mode.
+
+The widgets are created once when the app starts. For every question only
+their texts and states are changed, when the mode is not active they are
+hidden with grid_remove, so no widget is destroyed and created per card.
+"""
+from tkinter import ttk, Scrollbar, Text, END
+
+from answer_diff import incorrect_ranges, text_indices
+
+
+class FlashcardsView:
+    """
+    The flashcard and the correct/incorrect buttons.
+    """
+
+    def __init__(self, parent, flip, correct, incorrect):
+        """
+        Creates the widgets.
+
+        :param parent: tkinter widget, the flashcards tab
+        :param flip: function, flips the card
+        :param correct: function, the answer was correct
+        :param incorrect: function, the answer was incorrect
+        """
+        self.__parent = parent
+        # The flashcard
+        self.card = ttk.Button(parent, text = "...", command = flip)
+        # Correct button
+        self.correct_button = ttk.Button(
+            parent, text = "[C] Correct", command = correct)
+        # Incorrect button
+        self.incorrect_button = ttk.Button(
+            parent, text = "[I] Incorrect", command = incorrect)
+
+    def show(self, text):
+        """
+        Shows a card.
+
+        :param text: string, the text of the card
+        """
+        self.card.configure(text = text)
+        # Puts the flashcard onto the window
+        self.card.grid(column = 0, row = 2, columnspan = 2, pady = 40)
+        # Puts the buttons onto the window
+        self.correct_button.grid(column = 0, row = 3, pady = 20)
+        self.incorrect_button.grid(column = 1, row = 3, pady = 20)
+        # Sets the width of the column
+        self.__parent.columnconfigure(1, weight = 1)
+
+    def set_text(self, text):
+        """
+        :param text: string, the new text of the card
+        """
+        self.card.configure(text = text)
+
+    def hide(self):
+        """
+        Removes the widgets from the window, they are kept for the next card.
+        """
+        self.card.grid_remove()
+        self.correct_button.grid_remove()
+        self.incorrect_button.grid_remove()
+
+
+class WriteView:
+    """
+    The question, the answer entry and the result of the write mode.
+    """
+
+    def __init__(self, parent, font, entry_font, check):
+        """
+        Creates the widgets.
+
+        :param parent: tkinter widget, the write tab
+        :param font: tuple, the font of the labels
+        :param entry_font: tuple, the font of the answer entry
+        :param check: function, checks the answer
+        """
+        # Question label
+        self.question_label = ttk.Label(
+            parent, text = "...", wraplength = 415, font = font)
+        # Answer entry
+        self.entry = Text(parent, height = 5, width = 50, font = entry_font)
+        # The scrollbar for the textbox
+        self.scrollbar = Scrollbar(parent)
+        # Sets the scrollbar
+        self.entry.configure(yscrollcommand = self.scrollbar.set)
+        self.scrollbar.configure(command = self.entry.yview)
+        # Check button
+        self.check_button = ttk.Button(parent, text = "Check", command = check)
+        # Correct answer label
+        self.result_label = ttk.Label(
+            parent, text = "...", wraplength = 415, font = font)
+        # Next button
+        self.next_button = ttk.Button(parent, text = "Next")
+
+    def show_question(self, text):
+        """
+        Shows a new question with an empty answer entry.
+
+        :param text: string, the question
+        """
+        # Set the question label
+        self.question_label.configure(text = text)
+        # Sets the entry to enabled and clears the previous answer
+        self.entry.config(state = "normal")
+        self.entry.delete("1.0", END)
+        self.entry.tag_remove("INCORRECT", "1.0", END)
+        # Puts the widgets onto the window
+        self.question_label.grid(column = 0, row = 1)
+        self.entry.grid(column = 0, row = 2)
+        self.scrollbar.grid(column = 1, row = 2, sticky = "nse")
+        self.check_button.grid(column = 0, row = 3)
+        # The result of the previous question is hidden
+        self.result_label.grid_remove()
+        self.next_button.grid_remove()
+        # Sets the focus
+        self.entry.focus()
+
+    def show_result(self, text, color, command):
+        """
+        Shows the result instead of the check button.
+
+        :param text: string, the text of the result label
+        :param color: string, the color of the text
+        :param command: function, the command of the next button
+        """
+        self.check_button.grid_remove()
+        self.result_label.configure(text = text, foreground = color)
+        # Puts the label onto the window
+        self.result_label.grid(column = 0, row = 3)
+        self.next_button.configure(command = command)
+        # Puts the button onto the grid
+        self.next_button.grid(column = 0, row = 4)
+
+    def show_differences(self, correct, color, case_sensitive=False):
+        """
+        Highlights the parts of the answer which differ from the correct answer.
+
+        :param correct: string, the correct answer
+        :param color: string, the color of the wrong parts
+        :param case_sensitive: bool, does the case matter
+        """
+        answer = self.entry.get("1.0", "end-1c")
+        indices = text_indices(incorrect_ranges(answer, correct, case_sensitive))
+        # All the ranges are added in one call
+        if indices:
+            self.entry.tag_add("INCORRECT", *indices)
+        self.entry.tag_configure("INCORRECT", foreground = color)
+
+    def hide(self):
+        """
+        Removes the widgets from the window, they are kept for the next question.
+        """
+        for widget in (self.question_label, self.entry, self.scrollbar,
+                       self.check_button, self.result_label, self.next_button):
+            widget.grid_remove()
@@ -0,0 +1,226 @@
+"""
+Spaced repetition of the terms with the SM-2 algorithm.
+
+The memory state of every term (ease, interval, due date) is stored in a
+local SQLite database, so the state is kept between the sessions. A session
+only asks the terms which are due and a limited number of new terms, the due
+terms are selected with an indexed query instead of reading the whole deck.
+
+A term is identified by the word list file, the direction (the question
+and the answer languages) and the text of the question and the answer, so
+the state remains valid if the lines of the file are reordered.
+"""
+import os
+import sqlite3
+import time
+
+# The database of the memory states
+DEFAULT_DATABASE = "scheduler.sqlite3"
+# The maximum number of new terms in a session
+NEW_TERMS_PER_SESSION = 20
+# The maximum number of due terms in a session
+REVIEWS_PER_SESSION = 200
+# The ease of a new term
+INITIAL_EASE = 2.5
+# The ease cannot be lower than this
+MINIMUM_EASE = 1.3
+# The SM-2 grades (0-5) of the answers
+CORRECT_QUALITY = 4
+INCORRECT_QUALITY = 1
+# Seconds in a day, the intervals are in days
+DAY = 24 * 60 * 60
+# The reviews are written in one transaction after this many answers
+REVIEWS_PER_COMMIT = 20
+# The number of terms looked up in one query when the new terms are searched
+TERMS_PER_QUERY = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    deck TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    term TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    repetitions INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (deck, direction, term)
+);
+CREATE INDEX IF NOT EXISTS reviews_due ON reviews (deck, direction, due);
+"""
+
+
+def next_state(ease, interval, repetitions, quality):
+    """
+    Computes the next memory state of a term with SM-2.
+
+    :param ease: float, the ease factor
+    :param interval: float, the current interval in days
+    :param repetitions: int, the number of successful reviews in a row
+    :param quality: int, the grade of the answer between 0 and 5
+    :return tuple of (float, float, int), the new ease, interval
+        and number of repetitions
+    """
+    if quality < 3:
+        # The term has to be learnt again
+        repetitions = 0
+        interval = 1
+    else:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+        repetitions += 1
+    ease = max(MINIMUM_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return ease, interval, repetitions
+
+
+def deck_terms(word_list, ques_langs, answ_lang):
+    """
+    Creates the identifiers of the terms for open_deck.
+
+    :param word_list: dict, key [string] the language,
+        value [list of strings] the terms
+    :param ques_langs: list of strings, the question languages
+    :param answ_lang: string, the answer language
+    :return tuple of (string, list of strings), the direction
+        and the identifier of every term
+    """
+    languages = [*ques_langs, answ_lang]
+    direction = "\x1f".join(languages)
+    terms = ["\x1f".join(row) for row in zip(*(word_list[lang] for lang in languages))]
+    return direction, terms
+
+
+class SpacedRepetitionScheduler:
+    """
+    The memory states of the terms in the database.
+    """
+
+    def __init__(self, database=DEFAULT_DATABASE, clock=time.time):
+        """
+        :param database: string, the path of the SQLite database
+        :param clock: function, returns the current time in seconds
+        """
+        self.__connection = sqlite3.connect(database)
+        with self.__connection:
+            self.__connection.executescript(SCHEMA)
+        self.__clock = clock
+        # The opened deck and direction
+        self.__deck = None
+        self.__direction = None
+        # The term of every index
+        self.__terms = []
+        # The indecies of every term, a term can be more than once in a file
+        self.__indices = {}
+        # The terms which were already graded in this session
+        self.__graded = set()
+        # The new states which are not written yet
+        #     - key [string] the term
+        #     - value [tuple] the row of the reviews table
+        self.__pending = {}
+
+    def open_deck(self, deck, direction, terms):
+        """
+        Selects the word list whose terms are scheduled, a new session starts.
+
+        :param deck: string, the path of the word list file
+        :param direction: string, the question and the answer languages
+        :param terms: list of strings, the identifier of every term,
+            e.g. the question and the answer
+        """
+        self.flush()
+        self.__deck = os.path.abspath(deck)
+        self.__direction = direction
+        self.__terms = list(terms)
+        self.__indices = {}
+        for i, term in enumerate(self.__terms):
+            self.__indices.setdefault(term, []).append(i)
+        self.__graded = set()
+
+    def due_indices(self, new_limit=NEW_TERMS_PER_SESSION,
+                    review_limit=REVIEWS_PER_SESSION):
+        """
+        Selects the terms of a session, the most overdue terms first
+            and then the new terms in the order of the file.
+
+        :param new_limit: int, the maximum number of new terms
+        :param review_limit: int, the maximum number of due terms
+        :return list of ints, the indecies of the terms
+        """
+        self.__graded = set()
+        self.flush()
+        # The due terms with the index on (deck, direction, due)
+        due = self.__connection.execute(
+            "SELECT term FROM reviews WHERE deck = ? AND direction = ? AND due <= ? "
+            "ORDER BY due LIMIT ?",
+            (self.__deck, self.__direction, self.__clock(), review_limit))
+        indices = []
+        for (term,) in due:
+            indices.extend(self.__indices.get(term, []))
+        # The first terms of the file which have never been reviewed,
+        #     looked up in batches with the primary key
+        terms = list(self.__indices)
+        new_terms = 0
+        for start in range(0, len(terms), TERMS_PER_QUERY):
+            batch = terms[start:start + TERMS_PER_QUERY]
+            known = {term for (term,) in self.__connection.execute(
+                "SELECT term FROM reviews WHERE deck = ? AND direction = ? "
+                f"AND term IN ({', '.join('?' * len(batch))})",
+                (self.__deck, self.__direction, *batch))}
+            for term in batch:
+                if new_terms >= new_limit:
+                    return indices
+                if term not in known:
+                    indices.extend(self.__indices[term])
+                    new_terms += 1
+        return indices
+
+    def review(self, index, correct):
+        """
+        Updates the memory state of a term after an answer. Only the first
+            answer of a term in a session counts, the repetitions of the
+            mistakes do not change the state again.
+
+        :param index: int, the index of the answered term
+        :param correct: bool, was the answer correct
+        """
+        term = self.__terms[index]
+        if term in self.__graded:
+            return
+        self.__graded.add(term)
+        row = self.__connection.execute(
+            "SELECT ease, interval, repetitions, lapses FROM reviews "
+            "WHERE deck = ? AND direction = ? AND term = ?",
+            (self.__deck, self.__direction, term)).fetchone()
+        ease, interval, repetitions, lapses = row or (INITIAL_EASE, 0, 0, 0)
+        quality = CORRECT_QUALITY if correct else INCORRECT_QUALITY
+        ease, interval, repetitions = next_state(ease, interval, repetitions, quality)
+        if not correct:
+            lapses += 1
+        # The answers are committed in batches, not one by one
+        self.__pending[term] = (self.__deck, self.__direction, term, ease, interval,
+                                repetitions, lapses, self.__clock() + interval * DAY)
+        if len(self.__pending) >= REVIEWS_PER_COMMIT:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the pending reviews in one transaction.
+        """
+        if not self.__pending:
+            return
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                list(self.__pending.values()))
+        self.__pending = {}
+
+    def close(self):
+        """
+        Writes the pending reviews and closes the database.
+        """
+        self.flush()
+        self.__connection.close()
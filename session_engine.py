@@ -0,0 +1,174 @@
+"""
+The scheduling of a practice session, independent of the GUI.
+
+The engine splits the terms into rounds (batches), shuffles them, and asks
+the mistakes again, either later in the same round or in an extra round
+at the end. It only deals with the indices of the terms, so it can be used
+by the GUI, in the terminal, or in a benchmark without a display.
+"""
+import random
+
+
+class SessionEngine:
+    """
+    The state of a practice session.
+    """
+
+    def __init__(self, number_of_words, batch_size=8, shuffle=True,
+                 correct_mistakes="end", rng=random):
+        """
+        :param number_of_words: int, the number of terms in the word list
+        :param batch_size: int, the number of terms in a round,
+            0 if all the terms are in one round
+        :param shuffle: bool, ask the terms in random order
+        :param correct_mistakes: string, "end" the mistakes are asked in
+            the next round, "round" they are asked again in this round
+        :param rng: random.Random or the random module, shuffles the terms
+        """
+        self.__number_of_words = number_of_words
+        self.__batch_size = batch_size
+        self.__shuffle = shuffle
+        self.__correct_mistakes = correct_mistakes
+        self.__random = rng
+        # The indecies which were not asked yet
+        self.__question_indices = []
+        # The indecies for the current round
+        self.__current_question_indecies = []
+        # The indecies of the mistakes that are made in the round
+        self.__mistake_indecies = []
+        # Counter of the correct answers
+        self.__number_of_correct_answers = 0
+        # Counter of the incorrect ansers
+        self.__number_of_incorrect_answers = 0
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, number_of_words, settings):
+        """
+        Creates an engine from the settings dictionary of the app.
+
+        :param number_of_words: int, the number of terms in the word list
+        :param settings: dict, the settings of the app
+        :return SessionEngine
+        """
+        return cls(number_of_words, settings["batch_size"],
+                   settings["shuffle"], settings["correct_mistakes"])
+
+    def reset(self, indices=None):
+        """
+        Starts a new session, the counters are cleared.
+
+        :param indices: list of ints, the terms to be asked,
+            if None all the terms are asked
+        """
+        if indices is None:
+            indices = range(self.__number_of_words)
+        self.__question_indices = list(indices)
+        self.__current_question_indecies = []
+        self.__mistake_indecies = []
+        self.__number_of_correct_answers = 0
+        self.__number_of_incorrect_answers = 0
+
+    def next_round(self):
+        """
+        Starts the next round.
+
+        :return list of ints or None, the indecies of the round
+            in their original order for the recap list,
+            None if the session is over
+        """
+        # If random order
+        if self.__shuffle:
+            # Mixes the questions
+            self.__random.shuffle(self.__question_indices)
+        # If there were mistakes in the previous round
+        if self.__mistake_indecies:
+            # The mistakes are asked agin
+            self.__current_question_indecies = self.__mistake_indecies
+            self.__mistake_indecies = []
+        # If the batch size is 0, i.e. everything is in one batch
+        elif self.__batch_size == 0:
+            self.__current_question_indecies = list(self.__question_indices)
+        else:
+            # Sets the currently asked indecies
+            self.__current_question_indecies = self.__question_indices[:self.__batch_size]
+            # Removes the currently asked indecies
+            del self.__question_indices[:self.__batch_size]
+        # If all the questions are answered
+        if not self.__current_question_indecies:
+            return None
+        recap = list(self.__current_question_indecies)
+        # Shuffles the questions
+        if self.__shuffle:
+            self.__random.shuffle(self.__current_question_indecies)
+        return recap
+
+    def current_question(self):
+        """
+        :return int or None, the index of the asked term,
+            None if the round is over
+        """
+        if self.__current_question_indecies:
+            return self.__current_question_indecies[0]
+        return None
+
+    def is_finished(self):
+        """
+        :return bool, is the session over after the current round
+        """
+        if self.__current_question_indecies or self.__mistake_indecies:
+            return False
+        return self.__batch_size == 0 or not self.__question_indices
+
+    def answer_correct(self):
+        """
+        The current question was answered correctly.
+        """
+        # Increases the correct answer counter
+        self.__number_of_correct_answers += 1
+        # Removes the answered question
+        self.__current_question_indecies.pop(0)
+
+    def answer_incorrect(self):
+        """
+        The current question was answered incorrectly.
+        """
+        # Increases the incorrect answer counter
+        self.__number_of_incorrect_answers += 1
+        # When to correct the mistakes
+        if self.__correct_mistakes == "round":
+            # If there is more than on remaining question
+            if len(self.__current_question_indecies) > 1:
+                prew_first_elemnt = self.__current_question_indecies[0]
+                # Shuffles the questions so that the next time cannot be the
+                #   same question
+                while self.__current_question_indecies[0] == prew_first_elemnt:
+                    self.__random.shuffle(self.__current_question_indecies)
+        elif self.__correct_mistakes == "end":
+            # Adds the question to the mistakes list
+            self.__mistake_indecies.append(self.__current_question_indecies.pop(0))
+
+    @property
+    def current_indices(self):
+        """
+        :return list of ints, the remaining indecies of the round
+        """
+        return list(self.__current_question_indecies)
+
+    @property
+    def number_of_correct_answers(self):
+        return self.__number_of_correct_answers
+
+    @property
+    def number_of_incorrect_answers(self):
+        return self.__number_of_incorrect_answers
+
+    @property
+    def accuracy(self):
+        """
+        :return float, the ratio of the correct answers, 0 if nothing was asked
+        """
+        answers = self.__number_of_correct_answers + self.__number_of_incorrect_answers
+        if answers == 0:
+            return 0
+        return self.__number_of_correct_answers / answers
@@ -0,0 +1,316 @@
+"""
+Background speech synthesis for the language learning app.
+
+The terms of the next round are synthesized by a pool of worker threads
+while the user reads the recap list, so when a term has to be read
+its audio file is usually already in the cache.
+
+The texts are read by a separate speech thread, the GUI only puts the
+requests into a queue and polls the results, so a key press never waits
+for the synthesis or the disk.
+"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from audio_cache import synthesize_speech
+from text_normalization import remove_nested_parentheses
+
+# The number of the parallel synthesis requests
+PREFETCH_WORKERS = 4
+# How often the speech thread checks if the request it waits for
+#     became stale during the synthesis, in seconds
+STALE_CHECK_INTERVAL = 0.05
+# Language names which are used when gTTS does not know them
+#     - key [string] the lowercase name of the language
+#     - value [string] the gTTS language code
+LANGUAGE_ALIASES = {
+    "finnish": "fi",
+    "english": "en",
+    "hungarian": "hu",
+    "french": "fr",
+    "swedish": "sv",
+    "german": "de",
+    "spanish": "es",
+    "russian": "ru",
+    "estonian": "et",
+    "suomi": "fi",
+    "finska": "fi",
+    "finn": "fi",
+    "englanti": "en",
+    "angol": "en",
+    "unkari": "hu",
+    "magyar": "hu",
+    "ranska": "fr",
+    "francia": "fr",
+    "français": "fr",
+    "francais": "fr",
+    "ruotsi": "sv",
+    "svenska": "sv",
+    "saksa": "de",
+    "deutsch": "de",
+    "német": "de",
+    "espanja": "es",
+    "español": "es",
+    "venäjä": "ru",
+    "viro": "et",
+    "eesti": "et",
+}
+
+
+def resolve_tts_languages(languages, tts_langs):
+    """
+    Maps the header of a word list to the gTTS language codes.
+        It is built once per word list, so reading a text needs no lookup.
+
+    :param languages: list of strings, the header of the word list
+        e.g. ["Finnish", "english", "hu"]
+    :param tts_langs: dict, the gTTS languages, e.g. {"fi": "Finnish"},
+        empty if gTTS is not imported yet
+    :return dict, key [string] the header, value [string] the language code,
+        the unknown languages are left out
+    """
+    # The names of the languages, e.g. {"finnish": "fi"}
+    names = {name.lower(): code for code, name in tts_langs.items()}
+    resolved = {}
+    for language in languages:
+        # Removes the notes in parentheses, e.g. "Finnish (puhekieli)"
+        name = remove_nested_parentheses(language).strip().lower()
+        if name in tts_langs:
+            resolved[language] = name
+        elif name in names:
+            resolved[language] = names[name]
+        elif name in LANGUAGE_ALIASES:
+            resolved[language] = LANGUAGE_ALIASES[name]
+    return resolved
+
+
+class SpeechPrefetcher:
+    """
+    Synthesizes the texts into the audio cache in worker threads.
+    """
+
+    def __init__(self, audio_cache, workers=PREFETCH_WORKERS, synthesize=synthesize_speech):
+        """
+        Starts the worker pool.
+
+        :param audio_cache: AudioCache, the cache of the audio files
+        :param workers: int, the number of the worker threads
+        :param synthesize: function(text, language, file_name), creates an audio file
+        """
+        # The cache of the audio files
+        self.__audio_cache = audio_cache
+        # Creates the missing audio files
+        self.__synthesize = synthesize
+        # The worker threads
+        self.__executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="speech-prefetch")
+        # The requests which are not finished yet
+        #     - key [tuple of 2 strings] the text and the language
+        #     - value [Future] the path of the audio file when it is done
+        self.__futures = {}
+        # The GUI and the speech thread both make requests
+        self.__lock = threading.Lock()
+
+    def prefetch(self, items):
+        """
+        Starts synthesizing the texts which are not in the cache.
+
+        :param items: iterable of (text, language) tuples
+        """
+        for text, language in items:
+            self.request(text, language)
+
+    def request(self, text, language):
+        """
+        Returns the future of an audio file, it is submitted if necessary.
+
+        :param text: string, the text to be read
+        :param language: string, the language code
+        :return Future, its result is the path of the audio file
+        """
+        key = (text, language)
+        with self.__lock:
+            future = self.__futures.get(key)
+        if future is not None and not future.done():
+            return future
+        # A cached file does not need a worker
+        file_name = self.ready(text, language)
+        if file_name:
+            future = Future()
+            future.set_result(file_name)
+            return future
+        with self.__lock:
+            future = self.__futures.get(key)
+            # Failed or cancelled requests (e.g. no network)
+            #     and evicted files are tried again
+            if future is None or future.done():
+                future = self.__executor.submit(
+                    self.__audio_cache.fetch, text, language, self.__synthesize)
+                self.__futures[key] = future
+            else:
+                return future
+        # Outside the lock, the callback runs at once if the future is done
+        future.add_done_callback(lambda done: self.forget(key, done))
+        return future
+
+    def forget(self, key, future):
+        """
+        Removes a finished request, so the dictionary does not grow.
+
+        :param key: tuple of 2 strings, the text and the language
+        :param future: Future, the finished request
+        """
+        with self.__lock:
+            if self.__futures.get(key) is future:
+                del self.__futures[key]
+
+    def ready(self, text, language):
+        """
+        :param text: string, the text to be read
+        :param language: string, the language code
+        :return string or None, the path of the audio file if it is ready
+        """
+        return self.__audio_cache.get(text, language)
+
+    def shutdown(self):
+        """
+        Stops the workers, the pending requests are dropped.
+        """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SpeechWorker:
+    """
+    Reads the requested texts in a dedicated thread.
+
+    The results are put into a completion queue which is polled by the GUI.
+    Every new request or cancel makes the earlier pending requests stale,
+        the stale requests are never played. A cancel also stops
+        the audio which is playing.
+    """
+
+    def __init__(self, prefetcher, play, stop_playing=None):
+        """
+        Starts the speech thread.
+
+        :param prefetcher: SpeechPrefetcher, synthesizes the audio files
+        :param play: function(file_name, volume), plays an audio file,
+            it is called from the speech thread
+        :param stop_playing: function or None, stops the audio
+            which is playing, it is called by cancel
+        """
+        # Synthesizes the audio files
+        self.__prefetcher = prefetcher
+        # Plays an audio file
+        self.__play = play
+        # Stops the playing audio
+        self.__stop_playing = stop_playing
+        # The requests waiting to be read
+        self.__requests = queue.Queue()
+        # The results for the GUI: (status, text, error) tuples
+        #     status is "played", "cancelled" or "error"
+        self.__completed = queue.Queue()
+        # The id of the latest request, older requests are stale
+        self.__generation = 0
+        # Guards the generation counter, a request is played
+        #     and the audio is stopped while it is held
+        self.__lock = threading.Lock()
+        # The speech thread
+        self.__thread = threading.Thread(
+            target=self.run, name="speech", daemon=True)
+        self.__thread.start()
+
+    def say(self, text, language, volume):
+        """
+        Requests reading a text, the earlier pending requests are cancelled.
+
+        :param text: string, the text to be read
+        :param language: string, the language code
+        :param volume: float, the volume between 0 and 1
+        """
+        with self.__lock:
+            self.__generation += 1
+            generation = self.__generation
+        self.__requests.put((generation, text, language, volume))
+
+    def cancel(self):
+        """
+        Cancels the pending requests and stops the playing audio,
+            e.g. when the next question is shown.
+        """
+        with self.__lock:
+            self.__generation += 1
+            if self.__stop_playing:
+                self.__stop_playing()
+
+    def is_stale(self, generation):
+        """
+        :param generation: int, the id of a request
+        :return bool, was a newer request made or was it cancelled
+        """
+        with self.__lock:
+            return generation != self.__generation
+
+    def run(self):
+        """
+        The loop of the speech thread.
+        """
+        while True:
+            request = self.__requests.get()
+            # Stop signal
+            if request is None:
+                return
+            generation, text, language, volume = request
+            try:
+                if self.is_stale(generation):
+                    self.__completed.put(("cancelled", text, None))
+                    continue
+                file_name = self.wait(generation, self.__prefetcher.request(text, language))
+                with self.__lock:
+                    # It may have been cancelled during the synthesis,
+                    #     a cancel cannot come between the check and the play
+                    stale = generation != self.__generation
+                    if not stale:
+                        self.__play(file_name, volume)
+                self.__completed.put(("cancelled" if stale else "played", text, None))
+            except Exception as e:
+                self.__completed.put(("error", text, e))
+
+    def wait(self, generation, future):
+        """
+        Waits for a synthesis, but not after the request became stale.
+            The synthesis of a stale request still finishes in the
+            background and its audio file is cached.
+
+        :param generation: int, the id of the request
+        :param future: Future, the synthesis of the audio file
+        :return string or None, the path of the audio file,
+            None if the request became stale
+        """
+        while True:
+            try:
+                return future.result(timeout=STALE_CHECK_INTERVAL)
+            except FutureTimeoutError:
+                if self.is_stale(generation):
+                    return None
+
+    def poll(self):
+        """
+        Returns the finished requests without blocking.
+
+        :return list of (status, text, error) tuples
+        """
+        results = []
+        while True:
+            try:
+                results.append(self.__completed.get_nowait())
+            except queue.Empty:
+                return results
+
+    def stop(self):
+        """
+        Stops the speech thread after the current request.
+        """
+        self.cancel()
+        self.__requests.put(None)
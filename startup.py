@@ -0,0 +1,157 @@
+"""
+Fast startup of the language learning app.
+
+The slow optional dependencies (text to speech, translation) are imported
+in a background thread while the window is already usable, the features
+are enabled when their imports are finished.
+
+The StartupProfiler collects how long the phases of the startup and the
+imports take, it prints an -X importtime-style report with the
+--profile-startup option.
+"""
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """
+    Measures the phases of the startup.
+    """
+
+    def __init__(self, enabled=True, start_time=None):
+        """
+        :param enabled: bool, if False nothing is recorded
+        :param start_time: float, time.perf_counter() at the start
+            of the program, the phases are shown relative to it
+        """
+        self.__enabled = enabled
+        self.__start_time = time.perf_counter() if start_time is None else start_time
+        # The measured phases: (name, start, duration, thread name) tuples
+        self.__records = []
+        # The report is printed only once
+        self.__reported = False
+        # The records can come from the background thread
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+    def record(self, name, start, duration):
+        """
+        Stores a measured phase.
+
+        :param name: string, the name of the phase
+        :param start: float, time.perf_counter() at its start
+        :param duration: float, its length in seconds
+        """
+        if self.__enabled:
+            with self.__lock:
+                self.__records.append(
+                    (name, start, duration, threading.current_thread().name))
+
+    @contextmanager
+    def measure(self, name):
+        """
+        Measures the phase in the with block.
+
+        :param name: string, the name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start)
+
+    def report(self, file=sys.stderr):
+        """
+        Prints the measured phases in the order of their start.
+
+        :param file: file object, where it is printed
+        """
+        if not self.__enabled or self.__reported:
+            return
+        self.__reported = True
+        with self.__lock:
+            records = sorted(self.__records, key=lambda record: record[1])
+        print("startup: start [ms] | duration [ms] |     thread | phase", file=file)
+        for name, start, duration, thread in records:
+            print(f"startup: {(start - self.__start_time) * 1000:11.1f} | "
+                  f"{duration * 1000:13.1f} | {thread:>10.10} | {name}", file=file)
+
+
+class BackgroundImporter:
+    """
+    Imports the modules of the optional features in a background thread.
+    """
+
+    def __init__(self, features, profiler=None):
+        """
+        :param features: dict, key [string] the name of the feature,
+            value [tuple of (list of strings, function or None)]
+            the modules to be imported and a function which is
+            called after the imports, its return value is stored
+        :param profiler: StartupProfiler, measures the imports
+        """
+        self.__features = features
+        self.__profiler = profiler or StartupProfiler(enabled=False)
+        # The state of the features: "loading", "ready" or "failed"
+        self.__status = {feature: "loading" for feature in features}
+        # The return values of the initializer functions
+        self.__results = {}
+        # The import errors
+        self.__errors = {}
+        self.__thread = threading.Thread(target=self.run, name="import", daemon=True)
+
+    def start(self):
+        """
+        Starts importing.
+        """
+        self.__thread.start()
+
+    def run(self):
+        """
+        Imports the features one by one.
+        """
+        for feature, (modules, initializer) in self.__features.items():
+            try:
+                for module in modules:
+                    with self.__profiler.measure(f"import {module}"):
+                        importlib.import_module(module)
+                if initializer:
+                    with self.__profiler.measure(f"initialize {feature}"):
+                        self.__results[feature] = initializer()
+                self.__status[feature] = "ready"
+            except Exception as e:
+                self.__errors[feature] = e
+                self.__status[feature] = "failed"
+
+    def status(self, feature):
+        """
+        :param feature: string, the name of the feature
+        :return string, "loading", "ready" or "failed"
+        """
+        return self.__status[feature]
+
+    def result(self, feature):
+        """
+        :param feature: string, the name of the feature
+        :return the return value of its initializer, None if there is none
+        """
+        return self.__results.get(feature)
+
+    def error(self, feature):
+        """
+        :param feature: string, the name of the feature
+        :return Exception or None, why the import failed
+        """
+        return self.__errors.get(feature)
+
+    def done(self):
+        """
+        :return bool, are all the imports finished
+        """
+        return "loading" not in self.__status.values()
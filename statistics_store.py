@@ -0,0 +1,224 @@
+"""
+The statistics of the practice sessions in an SQLite database.
+
+Every finished session is one row of the sessions table, it is inserted in
+a transaction, so an interrupted write cannot corrupt the previous data.
+The table is indexed by the day and by the word list file.
+
+The practice time of every day and of all the sessions are kept as running
+totals, they are updated in the same transaction as the session is
+inserted, so the summary does not depend on the length of the history. If
+the totals do not match the sessions (e.g. the database was written by an
+older version) they are rebuilt when the database is opened.
+
+The earlier statistics were appended to a CSV file with the header of
+statistics_template.csv, such a file is imported into a database next to it.
+"""
+import os
+import sqlite3
+from datetime import datetime
+
+# The header of the CSV statistics files
+CSV_HEADER = ["Date", "Time", "File", "Mode", "Question language",
+              "Answer language", "Accuracy"]
+# The extension of the statistics databases
+DATABASE_EXTENSION = ".sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    day TEXT NOT NULL,
+    time REAL NOT NULL,
+    file TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    question_languages TEXT NOT NULL,
+    answer_language TEXT NOT NULL,
+    accuracy REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_day ON sessions (day);
+CREATE INDEX IF NOT EXISTS sessions_file ON sessions (file);
+CREATE TABLE IF NOT EXISTS daily_totals (
+    day TEXT PRIMARY KEY,
+    time REAL NOT NULL,
+    sessions INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    time REAL NOT NULL,
+    sessions INTEGER NOT NULL,
+    last_session INTEGER NOT NULL
+);
+"""
+
+
+class StatisticsError(Exception):
+    """
+    The statistics file cannot be read.
+    """
+
+
+def parse_csv_line(line):
+    """
+    Parses a line of a CSV statistics file. The file name can contain
+        the separator, so the columns after it are counted from the end.
+
+    :param line: string, a line without the line break
+    :return tuple, the values of a sessions row without the id
+    """
+    parts = line.split(";")
+    if len(parts) < len(CSV_HEADER):
+        raise ValueError(f"{len(parts)} columns instead of {len(CSV_HEADER)}")
+    date, practice_time = parts[0], float(parts[1])
+    mode, question_languages, answer_language, accuracy = parts[-4:]
+    file_name = ";".join(parts[2:-4])
+    day = datetime.fromisoformat(date).date().isoformat()
+    return (date, day, practice_time, file_name, mode, question_languages,
+            answer_language, float(accuracy))
+
+
+class StatisticsStore:
+    """
+    The database of the practice sessions.
+    """
+
+    def __init__(self, database):
+        """
+        :param database: string, the path of the SQLite database
+        """
+        self.__database = database
+        self.__connection = sqlite3.connect(database)
+        with self.__connection:
+            self.__connection.executescript(SCHEMA)
+        if self.is_stale():
+            with self.__connection:
+                self.rebuild_totals()
+
+    @property
+    def database(self):
+        return self.__database
+
+    def add_session(self, date, practice_time, file_name, mode,
+                    question_languages, answer_language, accuracy):
+        """
+        Saves a finished session.
+
+        :param date: datetime, the end of the session
+        :param practice_time: float, the length of the session in seconds
+        :param file_name: string, the word list file
+        :param mode: string, "write" or "flashcards"
+        :param question_languages: list of strings, the question languages
+        :param answer_language: string, the answer language
+        :param accuracy: float, the ratio of the correct answers
+        """
+        day = date.date().isoformat()
+        with self.__connection:
+            cursor = self.__connection.execute(
+                "INSERT INTO sessions (date, day, time, file, mode, question_languages, "
+                "answer_language, accuracy) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(date), day, practice_time, file_name,
+                 mode, str(question_languages), answer_language, accuracy))
+            # Updates the running totals
+            self.__connection.execute(
+                "INSERT INTO daily_totals VALUES (?, ?, 1) ON CONFLICT (day) "
+                "DO UPDATE SET time = time + excluded.time, sessions = sessions + 1",
+                (day, practice_time))
+            self.__connection.execute(
+                "UPDATE totals SET time = time + ?, sessions = sessions + 1, "
+                "last_session = ?", (practice_time, cursor.lastrowid))
+
+    def import_csv(self, file_name):
+        """
+        Imports a CSV statistics file, all the rows are inserted
+            in one transaction.
+
+        :param file_name: string, the path of the CSV file
+        :return int, the number of the imported sessions
+        """
+        rows = []
+        with open(file_name, encoding="utf-8") as my_file:
+            for line_number, line in enumerate(my_file, start=1):
+                line = line.rstrip("\r\n")
+                # Skips the header and the empty lines
+                if not line or (line_number == 1 and line.split(";") == CSV_HEADER):
+                    continue
+                try:
+                    rows.append(parse_csv_line(line))
+                except ValueError as e:
+                    raise StatisticsError(f"{file_name}, line {line_number}: {e}")
+        with self.__connection:
+            self.__connection.executemany(
+                "INSERT INTO sessions (date, day, time, file, mode, question_languages, "
+                "answer_language, accuracy) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.rebuild_totals()
+        return len(rows)
+
+    def is_empty(self):
+        """
+        :return bool, are there no sessions
+        """
+        return self.__connection.execute(
+            "SELECT NOT EXISTS (SELECT 1 FROM sessions)").fetchone()[0] == 1
+
+    def is_stale(self):
+        """
+        :return bool, do the running totals miss some sessions
+        """
+        row = self.__connection.execute(
+            "SELECT (SELECT last_session FROM totals), "
+            "(SELECT COALESCE(MAX(id), 0) FROM sessions)").fetchone()
+        return row[0] != row[1]
+
+    def rebuild_totals(self):
+        """
+        Computes the running totals from all the sessions,
+            it has to be called in a transaction.
+        """
+        self.__connection.execute("DELETE FROM daily_totals")
+        self.__connection.execute(
+            "INSERT INTO daily_totals SELECT day, TOTAL(time), COUNT(*) "
+            "FROM sessions GROUP BY day")
+        self.__connection.execute(
+            "INSERT OR REPLACE INTO totals SELECT 0, TOTAL(time), COUNT(*), "
+            "COALESCE(MAX(id), 0) FROM sessions")
+
+    def practice_time(self, day=None):
+        """
+        :param day: date, the day, None for all the sessions
+        :return float, the practice time in seconds
+        """
+        if day is None:
+            row = self.__connection.execute("SELECT time FROM totals").fetchone()
+        else:
+            row = self.__connection.execute(
+                "SELECT time FROM daily_totals WHERE day = ?",
+                (day.isoformat(),)).fetchone()
+        return row[0] if row else 0.0
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        self.__connection.close()
+
+
+def open_statistics(file_name):
+    """
+    Opens a statistics database. If a CSV file is given, its database is the
+        file with the .sqlite3 extension, the CSV file is imported when the
+        database is created.
+
+    :param file_name: string, the path of the database or the CSV file
+    :return StatisticsStore
+    """
+    base, extension = os.path.splitext(file_name)
+    if extension.lower() != DATABASE_EXTENSION:
+        store = StatisticsStore(base + DATABASE_EXTENSION)
+        if store.is_empty() and os.path.exists(file_name):
+            try:
+                store.import_csv(file_name)
+            except (OSError, UnicodeDecodeError, StatisticsError):
+                store.close()
+                raise
+        return store
+    return StatisticsStore(file_name)
@@ -0,0 +1,58 @@
+"""
+Text normalization of the terms and the answers.
+
+The regular expressions are compiled once when the module is imported,
+and the parentheses are removed in a single pass with a stack.
+"""
+import re
+
+# Two or more whitespace characters
+MULTIPLE_WHITESPACE = re.compile(r"\s{2,}")
+
+
+def clean_word(word, case_sensitive=False):
+    """
+    Removes the unncesary whitespace characters from the string.
+        And changes the case if nessesary.
+
+    :param word: string, the input to be cleaned
+    :param case_sensitive: bool, does the case matter
+    :return string, the cleaned string
+    """
+    # Clears the extra whitespace characters and the spaces
+    #     from the begining and end
+    word = MULTIPLE_WHITESPACE.sub(" ", word).strip()
+    # If the answers are not case sensitive
+    if not case_sensitive:
+        # Changes the word to lowercase
+        word = word.lower()
+    # The cleaned word
+    return word
+
+
+def remove_nested_parentheses(input_string):
+    """
+    Removes the parts in parentheses, also the nested ones.
+        The unmatched parentheses are kept, like when the innermost
+        pairs are removed repeatedly.
+
+    :param input_string: string, e.g. "(Hyvää) huomenta!"
+    :return string, e.g. " huomenta!"
+    """
+    # Fast path, most of the terms have no parentheses
+    if "(" not in input_string:
+        return input_string
+    # The characters of the result
+    result = []
+    # The positions in the result where the open parentheses start
+    open_positions = []
+    for character in input_string:
+        if character == "(":
+            open_positions.append(len(result))
+            result.append(character)
+        elif character == ")" and open_positions:
+            # Removes the parentheses and its content
+            del result[open_positions.pop():]
+        else:
+            result.append(character)
+    return "".join(result)
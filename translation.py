@@ -0,0 +1,282 @@
+"""
+Translation of the columns of the word lists.
+
+The texts are translated in chunks by a pool of worker threads, so the
+window is not blocked and the translation can be cancelled. The finished
+translations are stored in a persistent cache, keyed by the backend, the
+source and the target languages and the text, so translating an unchanged
+word list again does not send any request. Failed (empty) translations
+are not cached, they are reported as errors.
+
+The translator backend is pluggable: BACKENDS maps a name to a class with
+a translate_batch(texts) method. "google" uses deep_translator, "offline"
+works without network, e.g. for testing. Only the backends of GUI_BACKENDS
+are offered in the window, the offline one without a dictionary would
+only copy the source texts.
+"""
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# The cache of the translations
+DEFAULT_CACHE = "translation_cache.sqlite3"
+# The number of texts in a request
+CHUNK_SIZE = 50
+# The number of the parallel requests
+TRANSLATE_WORKERS = 4
+# The number of texts looked up in one query of the cache,
+#     below the limit of the SQLite parameters
+TEXTS_PER_QUERY = 500
+
+
+class TranslationError(Exception):
+    """
+    The translator gave a wrong answer.
+    """
+
+
+class GoogleBackend:
+    """
+    Google Translate through deep_translator.
+    """
+
+    def __init__(self, source, target):
+        """
+        :param source: string, the source language, a name or a code
+        :param target: string, the target language, a name or a code
+        """
+        from deep_translator import GoogleTranslator
+        self.__translator = GoogleTranslator(source=source.lower(), target=target.lower())
+
+    def translate_batch(self, texts):
+        """
+        :param texts: list of strings, the texts to be translated
+        :return list of strings, the translations
+        """
+        return self.__translator.translate_batch(texts)
+
+
+class OfflineBackend:
+    """
+    A local stand-in translator: it looks the texts up in a dictionary,
+        the unknown texts remain unchanged.
+    """
+
+    def __init__(self, source, target, dictionary=None):
+        """
+        :param source: string, the source language
+        :param target: string, the target language
+        :param dictionary: dict, key [string] a text, value [string] its translation
+        """
+        self.__dictionary = dictionary or {}
+
+    def translate_batch(self, texts):
+        """
+        :param texts: list of strings, the texts to be translated
+        :return list of strings, the translations
+        """
+        return [self.__dictionary.get(text, text) for text in texts]
+
+
+# The available translators
+#     - key [string] the name of the backend
+#     - value [class] created with the source and the target language
+BACKENDS = {
+    "google": GoogleBackend,
+    "offline": OfflineBackend,
+}
+# The translators which can be chosen in the window
+GUI_BACKENDS = ["google"]
+
+
+class TranslationCache:
+    """
+    The finished translations in an SQLite database.
+    """
+
+    def __init__(self, database=DEFAULT_CACHE):
+        """
+        :param database: string, the path of the database
+        """
+        # The worker threads store the translations
+        self.__connection = sqlite3.connect(database, check_same_thread=False)
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            columns = [row[1] for row in self.__connection.execute(
+                "PRAGMA table_info(translations)")]
+            # The translations of the older versions do not know their backend,
+            #     e.g. an untranslated copy of the offline backend, they are dropped
+            if columns and "backend" not in columns:
+                self.__connection.execute("DROP TABLE translations")
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations (backend TEXT NOT NULL, "
+                "source TEXT NOT NULL, target TEXT NOT NULL, text TEXT NOT NULL, "
+                "translation TEXT NOT NULL, PRIMARY KEY (backend, source, target, text))")
+
+    def get_many(self, texts, backend, source, target):
+        """
+        :param texts: iterable of strings, the texts
+        :param backend: string, the name of the translator
+        :param source: string, the source language
+        :param target: string, the target language
+        :return dict, key [string] a text, value [string] its cached translation
+        """
+        texts = list(texts)
+        found = {}
+        with self.__lock:
+            # Looked up in batches with the primary key
+            for start in range(0, len(texts), TEXTS_PER_QUERY):
+                batch = texts[start:start + TEXTS_PER_QUERY]
+                found.update(self.__connection.execute(
+                    "SELECT text, translation FROM translations "
+                    "WHERE backend = ? AND source = ? AND target = ? "
+                    f"AND text IN ({', '.join('?' * len(batch))})",
+                    (backend, source, target, *batch)))
+        return found
+
+    def put_many(self, translations, backend, source, target):
+        """
+        Stores translations in one transaction.
+
+        :param translations: dict, key [string] a text, value [string] its translation
+        :param backend: string, the name of the translator
+        :param source: string, the source language
+        :param target: string, the target language
+        """
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                [(backend, source, target, text, translation)
+                 for text, translation in translations.items()])
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        with self.__lock:
+            self.__connection.close()
+
+
+class TranslationJob:
+    """
+    The translation of a column in the background.
+    """
+
+    def __init__(self, texts, source, target, backend="google", cache=None,
+                 chunk_size=CHUNK_SIZE, workers=TRANSLATE_WORKERS):
+        """
+        :param texts: list of strings, the texts to be translated
+        :param source: string, the source language
+        :param target: string, the target language
+        :param backend: string, a key of BACKENDS
+        :param cache: TranslationCache or None, the cache of the translations
+        :param chunk_size: int, the number of texts in a request
+        :param workers: int, the number of the parallel requests
+        """
+        self.__texts = list(texts)
+        self.__source = source
+        self.__target = target
+        self.__backend_name = backend
+        self.__backend = BACKENDS[backend]
+        self.__cache = cache
+        self.__chunk_size = chunk_size
+        self.__workers = workers
+        # The translations of the distinct texts, empty texts are not sent
+        self.__translations = {"": ""}
+        # The number of the texts waiting for a request
+        self.__remaining = 0
+        # The number of the distinct texts
+        self.__total = 0
+        self.__cancelled = False
+        self.__error = None
+        self.__lock = threading.Lock()
+        self.__executor = None
+        self.__futures = []
+
+    def start(self):
+        """
+        Looks up the cache and starts the requests of the missing texts.
+        """
+        distinct = [text for text in dict.fromkeys(self.__texts) if text]
+        self.__total = len(distinct)
+        if self.__cache:
+            self.__translations.update(self.__cache.get_many(
+                distinct, self.__backend_name, self.__source, self.__target))
+        missing = [text for text in distinct if text not in self.__translations]
+        self.__remaining = len(missing)
+        if not missing:
+            return
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__workers, thread_name_prefix="translate")
+        for i in range(0, len(missing), self.__chunk_size):
+            self.__futures.append(self.__executor.submit(
+                self.translate_chunk, missing[i:i + self.__chunk_size]))
+        self.__executor.shutdown(wait=False)
+
+    def translate_chunk(self, chunk):
+        """
+        Translates a chunk, runs in a worker thread.
+
+        :param chunk: list of strings, distinct texts
+        """
+        if self.__cancelled or self.__error:
+            return
+        try:
+            translated = self.__backend(self.__source, self.__target).translate_batch(chunk)
+            # Otherwise some texts would have no translation
+            if translated is None or len(translated) != len(chunk):
+                raise TranslationError(
+                    f"The translator returned {len(translated or [])} translations "
+                    f"for {len(chunk)} texts!")
+            # Some translators return None or "" if the translation failed
+            failed = [text for text, translation in zip(chunk, translated) if not translation]
+            if failed:
+                raise TranslationError(
+                    f"{len(failed)} texts could not be translated, e.g. '{failed[0]}'.")
+        except Exception as e:
+            with self.__lock:
+                self.__error = self.__error or e
+            self.cancel()
+            return
+        translations = dict(zip(chunk, translated))
+        if self.__cache:
+            self.__cache.put_many(translations, self.__backend_name, self.__source, self.__target)
+        with self.__lock:
+            self.__translations.update(translations)
+            self.__remaining -= len(chunk)
+
+    def progress(self):
+        """
+        :return tuple of 2 ints, the number of the translated
+            distinct texts and the number of all the distinct texts
+        """
+        with self.__lock:
+            return self.__total - self.__remaining, self.__total
+
+    def done(self):
+        """
+        :return bool, are all the requests finished (or cancelled)
+        """
+        return all(future.done() for future in self.__futures)
+
+    def cancel(self):
+        """
+        Cancels the requests which did not start yet.
+        """
+        self.__cancelled = True
+        for future in self.__futures:
+            future.cancel()
+
+    @property
+    def cancelled(self):
+        return self.__cancelled
+
+    @property
+    def error(self):
+        return self.__error
+
+    def result(self):
+        """
+        :return list of strings, the translations in the order of the texts
+        """
+        return [self.__translations[text] for text in self.__texts]
@@ -0,0 +1,197 @@
+"""
+Virtualized table for the word lists.
+
+A ttk.Treeview with thousands of rows is slow to fill, so the table only
+creates as many rows as fit into the window, and when it is scrolled the
+values of these rows are replaced. The table widgets are created once and
+reused when a new word list is shown.
+"""
+from tkinter import ttk, VERTICAL
+
+# The height of a row in pixels
+ROW_HEIGHT = 30
+# The number of rows shown before the table gets its real size
+DEFAULT_VISIBLE_ROWS = 10
+
+
+class WordListRows:
+    """
+    The rows of a word list table, computed when they are shown.
+    """
+
+    def __init__(self, word_list, headers, indecies):
+        """
+        :param word_list: dict, key [string] the language,
+            value [list of strings] the terms
+        :param headers: list of strings, which languages to show
+        :param indecies: list of ints, which word indecies to show
+        """
+        self.__columns = [word_list[lang] for lang in headers]
+        self.__indecies = indecies
+
+    def __len__(self):
+        return len(self.__indecies)
+
+    def __getitem__(self, row):
+        """
+        :param row: int, the row of the table
+        :return tuple of strings, the terms in the row
+        """
+        i = self.__indecies[row]
+        return tuple(column[i] for column in self.__columns)
+
+
+class VirtualTable:
+    """
+    A table which only creates the visible rows.
+    """
+
+    def __init__(self, parent, font, header_font):
+        """
+        Creates the tree and its scrollbar.
+
+        :param parent: tkinter widget, the parent of the table
+        :param font: tuple, the font of the rows
+        :param header_font: tuple, the font of the header
+        """
+        # Create a new style for the Treeview with larger font
+        style = ttk.Style()
+        style.configure("Custom.Treeview", font=font, rowheight=ROW_HEIGHT)
+        style.configure("Custom.Treeview.Heading", font=header_font)
+        # Table
+        self.tree = ttk.Treeview(parent, show='headings', style="Custom.Treeview",
+                                 height=DEFAULT_VISIBLE_ROWS)
+        # Adds a scrollbar
+        self.scrollbar = ttk.Scrollbar(parent, orient=VERTICAL, command=self.yview)
+        # The rows of the table, with len() and [] like a list
+        self.__rows = []
+        # The index of the first visible row
+        self.__first = 0
+        # The number of the visible rows
+        self.__visible = DEFAULT_VISIBLE_ROWS
+        # The items of the tree, they are reused for the visible rows
+        self.__items = []
+        # Resizing and scrolling
+        self.tree.bind("<Configure>", self.resize)
+        self.tree.bind("<MouseWheel>", self.mouse_wheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(1))
+
+    def show(self, headers, rows):
+        """
+        Shows new content in the table.
+
+        :param headers: list of strings, the header of the columns
+        :param rows: sequence of tuples, e.g. WordListRows
+        """
+        columns = tuple(headers)
+        if tuple(self.tree["columns"]) != columns:
+            # The items have to be created again with the new columns
+            self.tree.delete(*self.__items)
+            self.__items = []
+            self.tree.configure(columns=columns)
+            # Sets the headers
+            for lang in columns:
+                self.tree.heading(lang, text=lang)
+        self.__rows = rows
+        self.__first = 0
+        self.render()
+
+    def render(self):
+        """
+        Puts the values of the visible rows into the items.
+        """
+        last = min(self.__first + self.__visible, len(self.__rows))
+        # The visible rows are generated from the rows
+        visible_rows = (self.__rows[i] for i in range(self.__first, last))
+        count = 0
+        for count, values in enumerate(visible_rows, start=1):
+            if count <= len(self.__items):
+                self.tree.item(self.__items[count - 1], values=values)
+            else:
+                self.__items.append(self.tree.insert('', 'end', values=values))
+        # Removes the unnecessary items
+        if count < len(self.__items):
+            self.tree.delete(*self.__items[count:])
+            del self.__items[count:]
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        """
+        Sets the scrollbar to the visible part.
+        """
+        if len(self.__rows) == 0:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.__first / len(self.__rows),
+                               min(1, (self.__first + self.__visible) / len(self.__rows)))
+
+    def scroll_to(self, first):
+        """
+        Scrolls so that the given row is the first visible.
+
+        :param first: int, the index of a row
+        """
+        first = max(0, min(first, len(self.__rows) - self.__visible))
+        if first != self.__first:
+            self.__first = first
+            self.render()
+
+    def scroll(self, rows):
+        """
+        :param rows: int, scrolls by this many rows
+        """
+        self.scroll_to(self.__first + rows)
+
+    def yview(self, *args):
+        """
+        The command of the scrollbar.
+
+        :param args: ("moveto", fraction) or ("scroll", number, "units"/"pages")
+        """
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.__rows)))
+        elif args[0] == "scroll":
+            step = self.__visible if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def mouse_wheel(self, event):
+        """
+        :param event: event, the mouse wheel event
+        """
+        self.scroll(-1 if event.delta > 0 else 1)
+
+    def resize(self, event):
+        """
+        Computes the number of visible rows when the size changes.
+
+        :param event: event, the configure event
+        """
+        # The header is about as high as a row
+        visible = max(1, event.height // ROW_HEIGHT - 1)
+        if visible != self.__visible:
+            self.__visible = visible
+            # The last rows fill the table
+            self.__first = max(0, min(self.__first, len(self.__rows) - self.__visible))
+            self.render()
+
+    def grid(self, row, columnspan=1):
+        """
+        Puts the table onto the window.
+
+        :param row: int, the row in the grid
+        :param columnspan: int, how many columns the tree spans
+        """
+        # Puts the tree onto the window
+        self.tree.grid(row=row, column=0, sticky='nsew', columnspan=columnspan)
+        # Puts the scrollbar onto the window
+        self.scrollbar.grid(row=row, column=1, sticky='nse')
+        # Sets the rowheight to expand
+        self.tree.master.rowconfigure(row, weight=1)
+
+    def grid_remove(self):
+        """
+        Hides the table, it can be shown again with grid.
+        """
+        self.tree.grid_remove()
+        self.scrollbar.grid_remove()
@@ -0,0 +1,144 @@
+"""
+Streaming loader of the word list files.
+
+The file is read line by line and the terms are put directly into the
+columns, so only the columns are kept in memory. Every bad line is
+reported with its line number.
+
+A line is split at the separator. If that gives a wrong number of terms
+and the separator is a single character, the line is parsed again with
+the csv module, so a term can contain the separator if it is quoted,
+e.g. "one; two";yksi, kaksi
+The quotation marks of the lines which split correctly are kept as they are.
+"""
+import csv
+
+# At most this many bad lines are shown in the error message
+MAX_REPORTED_LINES = 5
+
+
+class WordListError(Exception):
+    """
+    The word list file is incorrect.
+    """
+
+    def __init__(self, message, bad_lines=()):
+        """
+        :param message: string, the description of the error
+        :param bad_lines: list of (int, string) tuples,
+            the line numbers and the contents of the bad lines
+        """
+        super().__init__(message)
+        self.bad_lines = list(bad_lines)
+
+
+def split_line(line, separator):
+    """
+    Splits a line of the word list into terms.
+
+    :param line: string, a line without the new line character
+    :param separator: string, the separator of the terms
+    :return list of strings, the terms
+    """
+    return line.split(separator)
+
+
+def split_quoted_line(line, separator):
+    """
+    Splits a line of the word list with the csv module,
+        the quoted terms may contain the separator.
+
+    :param line: string, a line without the new line character
+    :param separator: string, a single separator character
+    :return list of strings, the terms
+    """
+    return next(csv.reader([line], delimiter=separator))
+
+
+def iter_lines(my_file):
+    """
+    Reads the nonempty lines of a file lazily.
+
+    :param my_file: file object, opened in text mode
+    :return generator of (int, string) tuples,
+        the line numbers from 1 and the stripped lines
+    """
+    for line_number, line in enumerate(my_file, start=1):
+        line = line.strip()
+        if line != "":
+            yield line_number, line
+
+
+def iter_rows(lines, separator, number_of_terms):
+    """
+    Splits the lines into terms lazily.
+
+    :param lines: iterable of (int, string) tuples, the numbered lines
+    :param separator: string, the separator of the terms
+    :param number_of_terms: int, the number of terms in a line
+    :return generator of (int, string, list of strings) tuples,
+        the line number, the line and the terms
+    """
+    for line_number, line in lines:
+        terms = split_line(line, separator)
+        # The separator may be inside a quoted term
+        if len(terms) != number_of_terms and len(separator) == 1 and '"' in line:
+            terms = split_quoted_line(line, separator)
+        yield line_number, line, terms
+
+
+def read_word_list(my_file, separator):
+    """
+    Reads a word list in one pass.
+
+    :param my_file: file object, opened in text mode
+    :param separator: string, the separator of the terms
+    :return tuple of (list of strings, dict),
+        the languages in the header and the word list, the keys are
+        the languages and the values are the lists of the terms
+    """
+    lines = iter_lines(my_file)
+    # The first line contains the languages
+    header = next(lines, None)
+    # If the file is empty
+    if header is None:
+        raise WordListError("The file must have a header row!")
+    languages = split_line(header[1], separator)
+    # Cheks if one language is in the header multiple times
+    if len(set(languages)) != len(languages):
+        raise WordListError(
+            "The same language cannot be twice in the file header!")
+    # The terms of the languages
+    columns = [[] for _ in languages]
+    # The lines with incorrect number of terms
+    bad_lines = []
+    for line_number, line, terms in iter_rows(lines, separator, len(languages)):
+        if len(terms) != len(languages):
+            bad_lines.append((line_number, line))
+            continue
+        for column, term in zip(columns, terms):
+            column.append(term)
+    if bad_lines:
+        line_list = ", ".join(str(number) for number, _ in bad_lines)
+        first_lines = "\n".join(
+            f"{number}: '{line}'" for number, line in bad_lines[:MAX_REPORTED_LINES])
+        raise WordListError(
+            f"Error in reading the file: the number of terms is incorrect "
+            f"in line(s) {line_list}.\n{first_lines}", bad_lines)
+    # If there are no words in the file
+    if len(columns[0]) == 0:
+        raise WordListError("There must be phrases in the file!")
+    return languages, dict(zip(languages, columns))
+
+
+def load_word_list(file_name, separator):
+    """
+    Opens and reads a word list file.
+
+    :param file_name: string, the path of the file
+    :param separator: string, the separator of the terms
+    :return tuple of (list of strings, dict), see read_word_list
+    """
+    # Opens the file, using UTF-8 encoding
+    with open(file_name, "r", encoding="utf8") as my_file:
+        return read_word_list(my_file, separator)
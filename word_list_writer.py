@@ -0,0 +1,104 @@
+"""
+Appending new columns (e.g. translations) to a word list file.
+
+The file is copied line by line into a temporary file in the same directory
+with the new terms at the end of the lines, then the temporary file replaces
+the original with os.replace. So if the program stops during the writing,
+the original file remains intact. The existing terms, the empty lines and
+the line endings are kept as they are.
+"""
+import csv
+import io
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from word_list_loader import WordListError, split_line, split_quoted_line
+
+
+def format_line(content, new_terms, separator):
+    """
+    Appends terms to a line, so that the loader reads it back.
+
+    :param content: string, the line without the line break
+    :param new_terms: list of strings, the terms to be appended
+    :param separator: string, the separator of the terms
+    :return string, the new line without the line break
+    """
+    # A term cannot span more lines
+    new_terms = [" ".join(term.splitlines()) for term in new_terms]
+    # The line is split simply, unless a term contains the separator
+    if not any(separator in term for term in new_terms):
+        return separator.join([content] + new_terms)
+    if len(separator) != 1:
+        raise WordListError(f"A term contains the separator '{separator}': {new_terms}")
+    # The loader reads the whole line with the csv module,
+    #     the existing terms have to be read the same way
+    if split_quoted_line(content, separator) != split_line(content, separator):
+        raise WordListError(f"The quoted terms cannot be appended to the line '{content}'!")
+    quoted = io.StringIO()
+    csv.writer(quoted, delimiter=separator, lineterminator="").writerow(new_terms)
+    return content + separator + quoted.getvalue()
+
+
+@contextmanager
+def atomic_writer(file_name):
+    """
+    Writes a file atomically: the with block writes a temporary file
+        in the same directory, which replaces the file at the end.
+        If the block raises an exception the file is not changed.
+
+    :param file_name: string, the path of the file
+    :return text file, the temporary file, opened with newline=""
+    """
+    directory = os.path.dirname(os.path.abspath(file_name))
+    descriptor, temp_name = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(file_name) + ".", suffix=".tmp")
+    try:
+        with open(descriptor, "w", encoding="utf8", newline="") as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        # Keeps the permissions of the original file
+        if os.path.exists(file_name):
+            shutil.copymode(file_name, temp_name)
+        os.replace(temp_name, file_name)
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+
+
+def append_columns(file_name, separator, columns):
+    """
+    Appends columns to a word list file atomically.
+
+    :param file_name: string, the path of the word list
+    :param separator: string, the separator of the terms
+    :param columns: dict, key [string] the language, value [list of strings]
+        the terms, one for every row of the file
+    """
+    languages = list(columns)
+    rows = list(zip(*(columns[lang] for lang in languages)))
+    with atomic_writer(file_name) as temp_file, \
+            open(file_name, "r", encoding="utf8", newline="") as my_file:
+        # The header is the first nonempty line, the rows are the others
+        row = -1
+        for line in my_file:
+            content = line.rstrip()
+            if content == "":
+                temp_file.write(line)
+                continue
+            if row == -1:
+                new_terms = languages
+            elif row < len(rows):
+                new_terms = rows[row]
+            else:
+                raise WordListError("The file has changed since it was opened!")
+            row += 1
+            ending = line[len(line.rstrip("\r\n")):]
+            temp_file.write(format_line(content, new_terms, separator))
+            # The last line may not have a line break
+            temp_file.write(ending)
+        if row != len(rows):
+            raise WordListError("The file has changed since it was opened!")